@@ -14,6 +14,7 @@
 #   limitations under the License.
 #
 
+import importlib
 import warnings
 
 from hsml import util, version
@@ -33,3 +34,16 @@ warnings.formatwarning = ml_formatwarning
 warnings.simplefilter("always", util.VersionWarning)
 
 __all__ = ["connection"]
+
+
+def __getattr__(name):
+    # Submodules with heavy dependencies (numpy, pandas, grpc, protobuf) are not
+    # imported with the package, they are loaded the first time they are accessed.
+    try:
+        return importlib.import_module("{}.{}".format(__name__, name))
+    except ModuleNotFoundError as e:
+        if e.name != "{}.{}".format(__name__, name):
+            raise
+        raise AttributeError(
+            "module {!r} has no attribute {!r}".format(__name__, name)
+        ) from None
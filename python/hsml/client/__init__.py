@@ -14,6 +14,8 @@
 #   limitations under the License.
 #
 
+import threading
+
 from hsml.client.hopsworks import base as hw_base
 from hsml.client.hopsworks import external as hw_external
 from hsml.client.hopsworks import internal as hw_internal
@@ -23,12 +25,17 @@ from hsml.client.istio import internal as ist_internal
 from hsml.connection import CONNECTION_SAAS_HOSTNAME
 
 
+# guards the creation and removal of the clients, which can be shared by threads
+_lock = threading.RLock()
+
 _client_type = None
 _saas_connection = None
 
 _hopsworks_client = None
 _istio_client = None
 
+_connection_pool_configuration = None
+
 _kserve_installed = None
 _serving_resource_limits = None
 _serving_num_instances_limits = None
@@ -44,44 +51,63 @@ def init(
     trust_store_path=None,
     api_key_file=None,
     api_key_value=None,
+    connection_pool_configuration=None,
 ):
-    global _client_type
-    _client_type = client_type
-
-    global _saas_connection
-    _saas_connection = host == CONNECTION_SAAS_HOSTNAME
-
+    global _client_type, _connection_pool_configuration, _saas_connection
     global _hopsworks_client
-    if not _hopsworks_client:
-        if client_type == "internal":
-            _hopsworks_client = hw_internal.Client()
-        elif client_type == "external":
-            _hopsworks_client = hw_external.Client(
-                host,
-                port,
-                project,
-                hostname_verification,
-                trust_store_path,
-                api_key_file,
-                api_key_value,
-            )
+    with _lock:
+        _client_type = client_type
+        _connection_pool_configuration = connection_pool_configuration
+        _saas_connection = host == CONNECTION_SAAS_HOSTNAME
+
+        if not _hopsworks_client:
+            if client_type == "internal":
+                _hopsworks_client = hw_internal.Client(connection_pool_configuration)
+            elif client_type == "external":
+                _hopsworks_client = hw_external.Client(
+                    host,
+                    port,
+                    project,
+                    hostname_verification,
+                    trust_store_path,
+                    api_key_file,
+                    api_key_value,
+                    connection_pool_configuration,
+                )
 
 
 def get_instance() -> hw_base.Client:
     global _hopsworks_client
-    if _hopsworks_client:
-        return _hopsworks_client
+    # read the global once, it can be cleared by a concurrent stop()
+    hopsworks_client = _hopsworks_client
+    if hopsworks_client:
+        return hopsworks_client
     raise Exception("Couldn't find client. Try reconnecting to Hopsworks.")
 
 
 def set_istio_client(host, port, project=None, api_key_value=None):
     global _client_type, _istio_client
 
-    if not _istio_client:
+    if _istio_client:
+        return
+    with _lock:
+        # check again, another thread may have set it while waiting for the lock
+        if _istio_client:
+            return
         if _client_type == "internal":
-            _istio_client = ist_internal.Client(host, port)
+            _istio_client = ist_internal.Client(
+                host,
+                port,
+                connection_pool_configuration=_connection_pool_configuration,
+            )
         elif _client_type == "external":
-            _istio_client = ist_external.Client(host, port, project, api_key_value)
+            _istio_client = ist_external.Client(
+                host,
+                port,
+                project,
+                api_key_value,
+                connection_pool_configuration=_connection_pool_configuration,
+            )
 
 
 def get_istio_instance() -> ist_base.Client:
@@ -89,6 +115,17 @@ def get_istio_instance() -> ist_base.Client:
     return _istio_client
 
 
+def get_connection_pool_stats() -> dict:
+    global _hopsworks_client, _istio_client
+    hopsworks_client, istio_client = _hopsworks_client, _istio_client
+    stats = {}
+    if hopsworks_client is not None:
+        stats["hopsworks"] = hopsworks_client._get_connection_pool_stats()
+    if istio_client is not None:
+        stats["istio"] = istio_client._get_connection_pool_stats()
+    return stats
+
+
 def get_client_type() -> str:
     global _client_type
     return _client_type
@@ -147,6 +184,9 @@ def set_knative_domain(knative_domain):
 
 def stop():
     global _hopsworks_client, _istio_client
-    _hopsworks_client._close()
-    _istio_client._close()
-    _hopsworks_client = _istio_client = None
+    with _lock:
+        if _hopsworks_client is not None:
+            _hopsworks_client._close()
+        if _istio_client is not None:
+            _istio_client._close()
+        _hopsworks_client = _istio_client = None
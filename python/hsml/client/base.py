@@ -19,7 +19,7 @@ from abc import ABC, abstractmethod
 import furl
 import requests
 import urllib3
-from hsml.client import exceptions
+from hsml.client import connection_pool, exceptions, tracing
 from hsml.decorators import connected
 
 
@@ -96,15 +96,33 @@ class Client(ABC):
             files=files,
         )
 
-        prepped = self._session.prepare_request(request)
-        response = self._session.send(prepped, verify=self._verify, stream=stream)
-
-        if self._get_retry(request, response):
-            prepped = self._session.prepare_request(request)
+        with tracing.request_span(method, path_params, f_url.host) as span:
+            # inference servers can join the client trace, see `tracing_configuration`
+            inject_trace_context = span is not None and tracing.is_inference_request(
+                path_params
+            )
+            prepped = self._prepare_request(request, inject_trace_context)
             response = self._session.send(prepped, verify=self._verify, stream=stream)
 
-        if response.status_code // 100 != 2:
-            raise exceptions.RestAPIError(url, response)
+            resend_count = 0
+            if self._get_retry(request, response):
+                prepped = self._prepare_request(request, inject_trace_context)
+                response = self._session.send(
+                    prepped, verify=self._verify, stream=stream
+                )
+                resend_count += 1
+
+            if span is not None:
+                tracing.set_response_attributes(
+                    span,
+                    response,
+                    len(prepped.body) if prepped.body else 0,
+                    resend_count,
+                    stream,
+                )
+
+            if response.status_code // 100 != 2:
+                raise exceptions.RestAPIError(url, response)
 
         if stream:
             return response
@@ -114,6 +132,46 @@ class Client(ABC):
                 return None
             return response.json()
 
+    def _prepare_request(self, request, inject_trace_context=False):
+        prepped = self._session.prepare_request(request)
+        if inject_trace_context:
+            tracing.inject(prepped.headers)
+        return prepped
+
+    def _create_session(self, connection_pool_configuration=None):
+        """Create the HTTP session of the client, with a tuned connection pool.
+
+        If `http2` is enabled in the configuration, requests are sent with the HTTP/2
+        transport instead, which requires httpx.
+
+        :param connection_pool_configuration: connection pool settings, see `PooledHTTPAdapter`
+            and `Http2Adapter`
+        :type connection_pool_configuration: dict, optional
+        :return: HTTP session
+        :rtype: requests.Session
+        """
+        if (connection_pool_configuration or {}).get("http2", False):
+            # imported on demand, httpx is an optional dependency
+            from hsml.client import http2
+
+            self._connection_pool = http2.Http2Adapter.from_configuration(
+                connection_pool_configuration
+            )
+        else:
+            self._connection_pool = (
+                connection_pool.PooledHTTPAdapter.from_configuration(
+                    connection_pool_configuration
+                )
+            )
+        session = requests.session()
+        session.mount("https://", self._connection_pool)
+        session.mount("http://", self._connection_pool)
+        return session
+
+    def _get_connection_pool_stats(self):
+        """Get hit and miss statistics of the client connection pool."""
+        return self._connection_pool.statistics.to_dict()
+
     def _close(self):
         """Closes a client. Can be implemented for clean up purposes, not mandatory."""
         self._connected = False
@@ -0,0 +1,113 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import gzip
+from typing import Any, Dict, Optional, Tuple
+
+from hsml.constants import COMPRESSION
+from urllib3.util.request import ACCEPT_ENCODING
+
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+ALGORITHMS = [COMPRESSION.ALGORITHM_GZIP, COMPRESSION.ALGORITHM_ZSTD]
+
+
+def is_available(algorithm: str) -> bool:
+    """Check whether a compression algorithm can be used in this environment."""
+    if algorithm == COMPRESSION.ALGORITHM_ZSTD:
+        return zstandard is not None
+    return algorithm in ALGORITHMS
+
+
+def validate_configuration(compression_configuration: Optional[Dict[str, Any]]):
+    """Validate a compression configuration, raising a ValueError if not valid."""
+    if compression_configuration is None:
+        return
+    algorithm = compression_configuration.get("algorithm", COMPRESSION.ALGORITHM_GZIP)
+    if algorithm not in ALGORITHMS:
+        raise ValueError(
+            "Compression algorithm '{}' is not supported. Possible values are {}".format(
+                algorithm, ", ".join(ALGORITHMS)
+            )
+        )
+    if not is_available(algorithm):
+        raise ModuleNotFoundError(
+            "Compression algorithm '{}' requires zstandard, install it with "
+            "`pip install zstandard`.".format(algorithm)
+        )
+
+
+def compress(
+    body: bytes, compression_configuration: Optional[Dict[str, Any]]
+) -> Tuple[bytes, Optional[str]]:
+    """Compress a request body if it is larger than the configured minimum size.
+
+    :param body: request body
+    :type body: bytes
+    :param compression_configuration: compression settings with keys `algorithm`,
+        `min_size` and `level`, or None to send the body uncompressed
+    :type compression_configuration: dict, optional
+    :return: the (compressed) body and its content encoding, None if not compressed
+    :rtype: Tuple[bytes, str]
+    """
+    if compression_configuration is None:
+        return body, None
+    min_size = compression_configuration.get("min_size", COMPRESSION.MIN_SIZE)
+    if len(body) < min_size:
+        # small bodies are not worth the cpu cost
+        return body, None
+
+    algorithm = compression_configuration.get("algorithm", COMPRESSION.ALGORITHM_GZIP)
+    level = compression_configuration.get("level")
+    if algorithm == COMPRESSION.ALGORITHM_ZSTD:
+        compressor = (
+            zstandard.ZstdCompressor()
+            if level is None
+            else zstandard.ZstdCompressor(level=level)
+        )
+        return compressor.compress(body), algorithm
+    return gzip.compress(
+        body, compresslevel=COMPRESSION.GZIP_LEVEL if level is None else level
+    ), algorithm
+
+
+def get_accept_encoding(
+    compression_configuration: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
+    """Get the content encodings accepted in responses, preferred algorithm first.
+
+    Only the encodings that urllib3 can decode in this environment are accepted, e.g.
+    zstd requires zstandard and br requires brotli.
+
+    :param compression_configuration: compression settings, the configured algorithm
+        is preferred if it can be decoded, or None to keep the default header of requests
+    :type compression_configuration: dict, optional
+    :return: value of the Accept-Encoding header, None if compression is not configured
+    :rtype: str
+    """
+    if compression_configuration is None:
+        return None
+    encodings = [e.strip() for e in ACCEPT_ENCODING.split(",")]
+    algorithm = compression_configuration.get("algorithm", COMPRESSION.ALGORITHM_GZIP)
+    if algorithm in encodings:
+        encodings.remove(algorithm)
+        encodings.insert(0, algorithm)
+    return ", ".join(encodings)
@@ -0,0 +1,188 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import socket
+import threading
+import time
+
+from hsml import metrics
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class ConnectionPoolStatistics:
+    """Counters of the connections handed out by a connection pool.
+
+    A request served with an already open connection counts as a hit, a request
+    that had to open a new connection (and possibly a TLS handshake) as a miss.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _record_request(self):
+        with self._lock:
+            self._requests += 1
+
+    def _record_miss(self):
+        with self._lock:
+            self._misses += 1
+
+    def _record_eviction(self):
+        with self._lock:
+            self._evictions += 1
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "hits": self._requests - self._misses,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+    @property
+    def requests(self):
+        """Number of connections requested from the pool."""
+        return self._requests
+
+    @property
+    def hits(self):
+        """Number of requests served with a pooled connection."""
+        return self._requests - self._misses
+
+    @property
+    def misses(self):
+        """Number of requests that opened a new connection."""
+        return self._misses
+
+    @property
+    def evictions(self):
+        """Number of times idle connections were dropped after the idle timeout."""
+        return self._evictions
+
+    def __repr__(self):
+        return "ConnectionPoolStatistics({})".format(self.to_dict())
+
+
+def _counting_pool_class(pool_class, statistics):
+    class CountingConnectionPool(pool_class):
+        def _get_conn(self, *args, **kwargs):
+            start = time.monotonic()
+            conn = super()._get_conn(*args, **kwargs)
+            # time blocked waiting for a free connection of the pool
+            metrics.add_phase_time(metrics.QUEUEING, time.monotonic() - start)
+            statistics._record_request()
+            # new connections and dropped ones that were closed by the pool are
+            # not connected yet, they (re)connect when the request is sent
+            if getattr(conn, "sock", None) is None:
+                statistics._record_miss()
+            return conn
+
+    return CountingConnectionPool
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTP adapter with a tunable connection pool.
+
+    # Arguments
+        pool_connections: Number of per-host connection pools to cache.
+        pool_maxsize: Maximum number of connections kept open per host.
+        pool_block: Whether to block when no free connection is available instead
+            of opening a connection that is discarded after use.
+        keep_alive: Whether to keep connections open between requests. If enabled,
+            TCP keep-alive probes are sent on idle connections.
+        idle_timeout: Seconds after which idle pooled connections are closed and
+            reopened on the next request, `None` to keep them indefinitely.
+    """
+
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+    DEFAULT_POOL_BLOCK = False
+    DEFAULT_KEEP_ALIVE = True
+    DEFAULT_IDLE_TIMEOUT = None
+
+    def __init__(
+        self,
+        pool_connections=DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        pool_block=DEFAULT_POOL_BLOCK,
+        keep_alive=DEFAULT_KEEP_ALIVE,
+        idle_timeout=DEFAULT_IDLE_TIMEOUT,
+    ):
+        # set before the base constructor, which initializes the pool manager
+        self._keep_alive = keep_alive
+        self._idle_timeout = idle_timeout
+        self._last_used = None
+        self._statistics = ConnectionPoolStatistics()
+        super().__init__(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    @classmethod
+    def from_configuration(cls, connection_pool_configuration=None):
+        """Create an adapter from a connection pool configuration dictionary."""
+        configuration = connection_pool_configuration or {}
+        return cls(
+            pool_connections=configuration.get(
+                "pool_connections", cls.DEFAULT_POOL_CONNECTIONS
+            ),
+            pool_maxsize=configuration.get("pool_maxsize", cls.DEFAULT_POOL_MAXSIZE),
+            pool_block=configuration.get("pool_block", cls.DEFAULT_POOL_BLOCK),
+            keep_alive=configuration.get("keep_alive", cls.DEFAULT_KEEP_ALIVE),
+            idle_timeout=configuration.get("idle_timeout", cls.DEFAULT_IDLE_TIMEOUT),
+        )
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        if self._keep_alive:
+            pool_kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool_class(HTTPConnectionPool, self._statistics),
+            "https": _counting_pool_class(HTTPSConnectionPool, self._statistics),
+        }
+
+    def add_headers(self, request, **kwargs):
+        if not self._keep_alive:
+            request.headers["Connection"] = "close"
+
+    def send(self, request, **kwargs):
+        self._evict_idle_connections()
+        try:
+            return super().send(request, **kwargs)
+        finally:
+            self._last_used = time.monotonic()
+
+    def _evict_idle_connections(self):
+        if self._idle_timeout is None or self._last_used is None:
+            return
+        if time.monotonic() - self._last_used > self._idle_timeout:
+            # closes the idle connections, in-use ones are closed when released
+            self.poolmanager.clear()
+            self._statistics._record_eviction()
+
+    @property
+    def statistics(self):
+        """Hit and miss statistics of the connection pool."""
+        return self._statistics
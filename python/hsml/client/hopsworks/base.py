@@ -15,6 +15,7 @@
 #
 
 import os
+import threading
 from abc import abstractmethod
 
 from hsml.client import auth, base
@@ -28,6 +29,9 @@ class Client(base.Client):
 
     BASE_PATH_PARAMS = ["hopsworks-api", "api"]
 
+    # guards token refreshes, shared by the requests sent from multiple threads
+    _auth_lock = threading.Lock()
+
     @abstractmethod
     def __init__(self):
         """To be extended by clients."""
@@ -66,13 +70,28 @@ class Client(base.Client):
         """
         if response.status_code == 401 and self.REST_ENDPOINT in os.environ:
             # refresh token and retry request - only on hopsworks
-            self._auth = auth.BearerAuth(self._read_jwt())
-            # Update request with the new token
-            request.auth = self._auth
+            # Update request with the new token, the request is owned by the caller
+            request.auth = self._refresh_auth(request.auth)
             # retry request
             return True
         return False
 
+    def _refresh_auth(self, stale_auth):
+        """Refresh the token of the client, once for all the requests rejected with it.
+
+        Concurrent requests that failed with the same token wait for the first one to
+        read the new token and reuse it, instead of refreshing it again.
+
+        :param stale_auth: authentication of the rejected request
+        :type stale_auth: requests.auth.AuthBase
+        :return: the refreshed authentication
+        :rtype: requests.auth.AuthBase
+        """
+        with self._auth_lock:
+            if self._auth is stale_auth:
+                self._auth = auth.BearerAuth(self._read_jwt())
+            return self._auth
+
     def _get_host_port_pair(self):
         """
         Removes "http or https" from the rest endpoint and returns a list
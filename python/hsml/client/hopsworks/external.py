@@ -14,7 +14,6 @@
 #   limitations under the License.
 #
 
-import requests
 from hsml.client import auth, exceptions
 from hsml.client.hopsworks import base as hopsworks
 
@@ -29,6 +28,7 @@ class Client(hopsworks.Client):
         trust_store_path,
         api_key_file,
         api_key_value,
+        connection_pool_configuration=None,
     ):
         """Initializes a client in an external environment."""
         if not host:
@@ -50,7 +50,7 @@ class Client(hopsworks.Client):
         api_key = auth.get_api_key(api_key_value, api_key_file)
         self._auth = auth.ApiKeyAuth(api_key)
 
-        self._session = requests.session()
+        self._session = self._create_session(connection_pool_configuration)
         self._connected = True
         self._verify = self._get_verify(self._host, trust_store_path)
 
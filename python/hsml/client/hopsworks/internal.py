@@ -19,17 +19,10 @@ import os
 import textwrap
 from pathlib import Path
 
-import requests
 from hsml.client import auth
 from hsml.client.hopsworks import base as hopsworks
 
 
-try:
-    import jks
-except ImportError:
-    pass
-
-
 class Client(hopsworks.Client):
     REQUESTS_VERIFY = "REQUESTS_VERIFY"
     DOMAIN_CA_TRUSTSTORE_PEM = "DOMAIN_CA_TRUSTSTORE_PEM"
@@ -47,7 +40,7 @@ class Client(hopsworks.Client):
     MATERIAL_PWD = "material_passwd"
     SECRETS_DIR = "SECRETS_DIR"
 
-    def __init__(self):
+    def __init__(self, connection_pool_configuration=None):
         """Initializes a client being run from a job/notebook directly on Hopsworks."""
         self._base_url = self._get_hopsworks_rest_endpoint()
         self._host, self._port = self._get_host_port_pair()
@@ -68,7 +61,7 @@ class Client(hopsworks.Client):
         except FileNotFoundError:
             self._auth = auth.ApiKeyAuth(self._read_apikey())
         self._verify = self._get_verify(hostname_verification, trust_store_path)
-        self._session = requests.session()
+        self._session = self._create_session(connection_pool_configuration)
 
         self._connected = True
 
@@ -109,6 +102,9 @@ class Client(hopsworks.Client):
         Returns:
              strings: (ca_cert)
         """
+        # pyjks is slow to import and only needed inside Hopsworks clusters
+        import jks
+
         # load the keystore and decrypt it with password
         ks = jks.KeyStore.load(jks_path, keystore_pw, try_decrypt_keys=True)
         ca_certs = ""
@@ -0,0 +1,223 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import io
+import os
+import ssl
+import threading
+
+import requests
+from hsml.client.connection_pool import ConnectionPoolStatistics, PooledHTTPAdapter
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+# connection-specific headers are not allowed in HTTP/2 requests
+_HOP_BY_HOP_HEADERS = {
+    "connection",
+    "keep-alive",
+    "proxy-connection",
+    "transfer-encoding",
+    "upgrade",
+}
+
+# http versions of httpx responses, as reported by urllib3
+_HTTP_VERSIONS = {"HTTP/1.0": 10, "HTTP/1.1": 11, "HTTP/2": 20}
+
+
+class _ResponseStream(io.RawIOBase):
+    """File-like object over the (decoded) body of an httpx response.
+
+    Like urllib3 responses, `version` is the HTTP version of the response, e.g. `11`
+    for HTTP/1.1 and `20` for HTTP/2.
+    """
+
+    def __init__(self, response):
+        self._response = response
+        self.version = _HTTP_VERSIONS.get(response.http_version, 0)
+        self._chunks = response.iter_bytes()
+        self._buffer = b""
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        while not self._buffer:
+            try:
+                self._buffer = next(self._chunks)
+            except StopIteration:
+                return 0
+        size = min(len(b), len(self._buffer))
+        b[:size] = self._buffer[:size]
+        self._buffer = self._buffer[size:]
+        return size
+
+    def close(self):
+        self._response.close()
+        super().close()
+
+
+class Http2Adapter(BaseAdapter):
+    """Transport adapter sending the requests of a `requests.Session` with httpx.
+
+    HTTPS connections negotiate HTTP/2 and fall back to HTTP/1.1 if the server does
+    not support it. Plain HTTP connections use HTTP/1.1, unless `prior_knowledge` is
+    set and HTTP/2 is used without negotiation. Concurrent requests to the same host
+    are multiplexed over a few HTTP/2 connections.
+
+    # Arguments
+        pool_maxsize: Maximum number of connections kept open per host.
+        idle_timeout: Seconds after which idle connections are closed, `None` to
+            keep them indefinitely.
+        prior_knowledge: Whether to use HTTP/2 on plain HTTP connections, for
+            example, towards an Istio ingress gateway.
+    """
+
+    DEFAULT_PRIOR_KNOWLEDGE = False
+
+    def __init__(
+        self,
+        pool_maxsize=PooledHTTPAdapter.DEFAULT_POOL_MAXSIZE,
+        idle_timeout=PooledHTTPAdapter.DEFAULT_IDLE_TIMEOUT,
+        prior_knowledge=DEFAULT_PRIOR_KNOWLEDGE,
+    ):
+        if httpx is None:
+            raise ModuleNotFoundError(
+                "The HTTP/2 transport requires httpx, install it with "
+                "`pip install hsml[http2]`."
+            )
+        super().__init__()
+        self._limits = httpx.Limits(
+            max_connections=None,
+            max_keepalive_connections=pool_maxsize,
+            keepalive_expiry=idle_timeout,
+        )
+        self._prior_knowledge = prior_knowledge
+        self._clients = {}  # {(scheme, verify, cert): httpx.Client}
+        self._lock = threading.Lock()
+        self._statistics = ConnectionPoolStatistics()
+
+    @classmethod
+    def from_configuration(cls, connection_pool_configuration=None):
+        """Create an adapter from a connection pool configuration dictionary."""
+        configuration = connection_pool_configuration or {}
+        return cls(
+            pool_maxsize=configuration.get(
+                "pool_maxsize", PooledHTTPAdapter.DEFAULT_POOL_MAXSIZE
+            ),
+            idle_timeout=configuration.get(
+                "idle_timeout", PooledHTTPAdapter.DEFAULT_IDLE_TIMEOUT
+            ),
+            prior_knowledge=configuration.get(
+                "http2_prior_knowledge", cls.DEFAULT_PRIOR_KNOWLEDGE
+            ),
+        )
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        client = self._get_client(request.url.split(":", 1)[0], verify, cert)
+        headers = [
+            (name, value)
+            for name, value in request.headers.items()
+            if name.lower() not in _HOP_BY_HOP_HEADERS
+        ]
+        httpx_request = client.build_request(
+            request.method,
+            request.url,
+            headers=headers,
+            content=request.body,
+            timeout=self._get_timeout(timeout),
+            extensions={"trace": self._trace},
+        )
+
+        self._statistics._record_request()
+        try:
+            httpx_response = client.send(httpx_request, stream=True)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(e, request=request) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(e, request=request) from e
+
+        response = self._build_response(request, httpx_response)
+        if not stream:
+            # consume the body, releasing the stream for other requests
+            response.content  # noqa: B018
+        return response
+
+    def close(self):
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            client.close()
+
+    def _get_client(self, scheme, verify, cert):
+        key = (scheme, verify, cert)
+        with self._lock:
+            if key not in self._clients:
+                prior_knowledge = scheme == "http" and self._prior_knowledge
+                self._clients[key] = httpx.Client(
+                    http1=not prior_knowledge,
+                    http2=True,
+                    verify=self._get_verify(verify),
+                    cert=cert,
+                    limits=self._limits,
+                    trust_env=False,
+                )
+            return self._clients[key]
+
+    def _get_verify(self, verify):
+        # requests passes trust stores as paths, httpx expects an SSL context
+        if isinstance(verify, str):
+            if os.path.isdir(verify):
+                return ssl.create_default_context(capath=verify)
+            return ssl.create_default_context(cafile=verify)
+        return verify
+
+    def _get_timeout(self, timeout):
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return httpx.Timeout(read, connect=connect)
+        return httpx.Timeout(timeout)
+
+    def _trace(self, event_name, info):
+        if event_name == "connection.connect_tcp.complete":
+            self._statistics._record_miss()
+
+    def _build_response(self, request, httpx_response):
+        response = requests.Response()
+        response.status_code = httpx_response.status_code
+        response.reason = httpx_response.reason_phrase
+        response.headers = CaseInsensitiveDict(httpx_response.headers)
+        # the body is decoded by httpx, do not decode it again
+        response.headers.pop("Content-Encoding", None)
+        response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+        response.raw = _ResponseStream(httpx_response)
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    @property
+    def statistics(self):
+        """Hit and miss statistics of the connection pool."""
+        return self._statistics
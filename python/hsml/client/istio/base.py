@@ -14,11 +14,17 @@
 #   limitations under the License.
 #
 
+from __future__ import annotations
+
 import os
 from abc import abstractmethod
+from typing import TYPE_CHECKING
 
 from hsml.client import base
-from hsml.client.istio.grpc.inference_client import GRPCInferenceServerClient
+
+
+if TYPE_CHECKING:
+    from hsml.client.istio.grpc.inference_client import GRPCInferenceServerClient
 
 
 class Client(base.Client):
@@ -90,6 +96,9 @@ class Client(base.Client):
         return ui_url
 
     def _create_grpc_channel(self, service_hostname: str) -> GRPCInferenceServerClient:
+        # grpc is only imported when the first grpc channel is created
+        from hsml.client.istio.grpc.inference_client import GRPCInferenceServerClient
+
         return GRPCInferenceServerClient(
             url=self._host + ":" + str(self._port),
             channel_args=(("grpc.ssl_target_name_override", service_hostname),),
@@ -14,7 +14,6 @@
 #   limitations under the License.
 #
 
-import requests
 from hsml.client import auth
 from hsml.client.istio import base as istio
 
@@ -28,6 +27,7 @@ class Client(istio.Client):
         api_key_value,
         hostname_verification=None,
         trust_store_path=None,
+        connection_pool_configuration=None,
     ):
         """Initializes a client in an external environment such as AWS Sagemaker."""
         self._host = host
@@ -37,7 +37,7 @@ class Client(istio.Client):
 
         self._auth = auth.ApiKeyAuth(api_key_value)
 
-        self._session = requests.session()
+        self._session = self._create_session(connection_pool_configuration)
         self._connected = True
         self._verify = self._get_verify(hostname_verification, trust_store_path)
 
@@ -14,6 +14,8 @@
 #   limitations under the License.
 
 import grpc
+from hsml import metrics
+from hsml.client import tracing
 from hsml.client.istio.grpc.proto.grpc_predict_v2_pb2_grpc import (
     GRPCInferenceServiceStub,
 )
@@ -21,6 +23,9 @@ from hsml.client.istio.utils.infer_type import InferRequest, InferResponse
 
 
 class GRPCInferenceServerClient:
+    SERVICE_NAME = "inference.GRPCInferenceService"
+    INFER_METHOD = "ModelInfer"
+
     def __init__(
         self,
         url,
@@ -39,6 +44,7 @@ class GRPCInferenceServerClient:
         self._channel = grpc.insecure_channel(url, options=channel_opt)
         self._client_stub = GRPCInferenceServiceStub(self._channel)
         self._serving_api_key = serving_api_key
+        self._url = url
 
     def __enter__(self):
         return self
@@ -57,18 +63,34 @@ class GRPCInferenceServerClient:
     def infer(self, infer_request: InferRequest, headers=None, client_timeout=None):
         headers = {} if headers is None else headers
         headers["authorization"] = "ApiKey " + self._serving_api_key
-        metadata = headers.items()
 
-        # convert the InferRequest to a ModelInferRequest message
-        request = infer_request.to_grpc()
+        with tracing.grpc_span(self.SERVICE_NAME, self.INFER_METHOD, self._url) as span:
+            # propagate the trace context to the inference server
+            tracing.inject(headers)
+            metadata = headers.items()
+
+            # convert the InferRequest to a ModelInferRequest message
+            with metrics.phase(metrics.SERIALIZATION):
+                request = infer_request.to_grpc()
+
+            try:
+                # send request
+                with metrics.phase(metrics.NETWORK):
+                    model_infer_response = self._client_stub.ModelInfer(
+                        request=request, metadata=metadata, timeout=client_timeout
+                    )
+            except grpc.RpcError as rpc_error:
+                if span is not None and isinstance(rpc_error, grpc.Call):
+                    span.set_attribute(
+                        "rpc.grpc.status_code", rpc_error.code().value[0]
+                    )
+                raise rpc_error
 
-        try:
-            # send request
-            model_infer_response = self._client_stub.ModelInfer(
-                request=request, metadata=metadata, timeout=client_timeout
-            )
-        except grpc.RpcError as rpc_error:
-            raise rpc_error
+            if span is not None:
+                span.set_attribute("rpc.grpc.status_code", grpc.StatusCode.OK.value[0])
+                span.set_attribute("rpc.request.size", request.ByteSize())
+                span.set_attribute("rpc.response.size", model_infer_response.ByteSize())
 
         # convert back the ModelInferResponse message to InferResponse
-        return InferResponse.from_grpc(model_infer_response)
+        with metrics.phase(metrics.DESERIALIZATION):
+            return InferResponse.from_grpc(model_infer_response)
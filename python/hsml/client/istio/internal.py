@@ -19,17 +19,10 @@ import os
 import textwrap
 from pathlib import Path
 
-import requests
 from hsml.client import auth, exceptions
 from hsml.client.istio import base as istio
 
 
-try:
-    import jks
-except ImportError:
-    pass
-
-
 class Client(istio.Client):
     REQUESTS_VERIFY = "REQUESTS_VERIFY"
     PROJECT_ID = "HOPSWORKS_PROJECT_ID"
@@ -48,7 +41,7 @@ class Client(istio.Client):
     MATERIAL_PWD = "material_passwd"
     SECRETS_DIR = "SECRETS_DIR"
 
-    def __init__(self, host, port):
+    def __init__(self, host, port, connection_pool_configuration=None):
         """Initializes a client being run from a job/notebook directly on Hopsworks."""
         self._host = host
         self._port = port
@@ -64,7 +57,7 @@ class Client(istio.Client):
         self._project_name = self._project_name()
         self._auth = auth.ApiKeyAuth(self._get_serving_api_key())
         self._verify = self._get_verify(hostname_verification, trust_store_path)
-        self._session = requests.session()
+        self._session = self._create_session(connection_pool_configuration)
 
         self._connected = True
 
@@ -121,6 +114,9 @@ class Client(istio.Client):
         Returns:
              strings: (ca_cert)
         """
+        # pyjks is slow to import and only needed inside Hopsworks clusters
+        import jks
+
         # load the keystore and decrypt it with password
         ks = jks.KeyStore.load(jks_path, keystore_pw, try_decrypt_keys=True)
         ca_certs = ""
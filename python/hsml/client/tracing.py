@@ -0,0 +1,196 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import importlib.util
+from contextlib import nullcontext
+from typing import Any, Dict, List, Optional
+
+from hsml import version
+
+
+# opentelemetry modules, imported when tracing is enabled as they are slow to import
+trace = None
+propagate = None
+
+TRACER_NAME = "hsml"
+
+# inference requests are sent to `.../models/<deployment name>:predict`
+INFERENCE_SUFFIX = ":predict"
+
+# the segment following these ones identifies a resource by name
+NAME_COLLECTIONS = ["models", "tags", "getProjectInfo"]
+# dataset paths can contain any number of segments after these ones
+DATASET_COLLECTIONS = ["dataset"]
+DATASET_ACTIONS = ["upload", "download", "with_auth"]
+
+# returned when tracing is disabled, so that untraced requests only pay a function call
+_NO_SPAN = nullcontext()
+
+_tracer = None
+_propagate = True
+
+
+def is_available() -> bool:
+    """Check whether OpenTelemetry can be used in this environment."""
+    return importlib.util.find_spec("opentelemetry") is not None
+
+
+def validate_configuration(tracing_configuration: Optional[Dict[str, Any]]):
+    """Validate a tracing configuration, raising an error if tracing is not available."""
+    if tracing_configuration is not None and not is_available():
+        raise ModuleNotFoundError(
+            "Tracing requires opentelemetry-api, install it with "
+            "`pip install hsml[tracing]`."
+        )
+
+
+def init(tracing_configuration: Optional[Dict[str, Any]] = None):
+    """Enable tracing of the requests, replacing the current tracer.
+
+    :param tracing_configuration: tracing settings with keys `tracer_provider`, the
+        OpenTelemetry tracer provider to use instead of the global one, and `propagate`,
+        whether to send the trace context to the inference endpoints
+    :type tracing_configuration: dict, optional
+    """
+    global _tracer, _propagate, trace, propagate
+    configuration = tracing_configuration or {}
+    validate_configuration(configuration)
+    from opentelemetry import propagate, trace
+
+    _tracer = trace.get_tracer(
+        TRACER_NAME,
+        version.__version__,
+        tracer_provider=configuration.get("tracer_provider"),
+    )
+    _propagate = configuration.get("propagate", True)
+
+
+def stop():
+    """Disable tracing of the requests."""
+    global _tracer, _propagate
+    _tracer = None
+    _propagate = True
+
+
+def is_enabled() -> bool:
+    """Check whether requests are traced."""
+    return _tracer is not None
+
+
+def get_path_template(path_params: List[Any]) -> str:
+    """Get the path of a request with identifiers replaced by placeholders.
+
+    Span names built from the template have a low cardinality, for example
+    `["project", 119, "modelregistries", 119, "models", "mnist_1"]` becomes
+    `/project/{id}/modelregistries/{id}/models/{name}`.
+
+    :param path_params: path segments of the request
+    :type path_params: list
+    :return: path template
+    :rtype: str
+    """
+    segments = []
+    in_dataset_path = False
+    for i, segment in enumerate(str(p) for p in path_params):
+        if in_dataset_path:
+            if segment in DATASET_ACTIONS:
+                segments.append(segment)
+            elif segments[-1] != "{path}":
+                segments.append("{path}")
+            continue
+        if i > 0 and str(path_params[i - 1]) in NAME_COLLECTIONS:
+            # keep the action of inference requests, e.g. `{name}:predict`
+            _, colon, action = segment.partition(":")
+            segment = "{name}" + colon + action
+        elif segment.isdigit():
+            segment = "{id}"
+        segments.append(segment)
+        in_dataset_path = segment in DATASET_COLLECTIONS
+    return "/" + "/".join(segments)
+
+
+def request_span(method: str, path_params: List[Any], server_address: str):
+    """Start the span of a REST request, as current span.
+
+    :return: context manager returning the span, or None if tracing is disabled
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    template = get_path_template(path_params)
+    return tracer.start_as_current_span(
+        "{} {}".format(method, template),
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            "http.request.method": method,
+            "url.template": template,
+            "server.address": server_address,
+        },
+    )
+
+
+def set_response_attributes(
+    span, response, request_size: int, resend_count: int, stream: bool = False
+):
+    """Set the status, sizes and retries of a REST request on its span."""
+    span.set_attribute("http.response.status_code", response.status_code)
+    span.set_attribute("http.request.body.size", request_size)
+    if not stream:
+        span.set_attribute("http.response.body.size", len(response.content))
+    elif "content-length" in response.headers:
+        # streamed responses are not read yet, rely on the announced size
+        span.set_attribute(
+            "http.response.body.size", int(response.headers["content-length"])
+        )
+    if resend_count > 0:
+        span.set_attribute("http.request.resend_count", resend_count)
+    if response.status_code >= 400:
+        span.set_status(trace.StatusCode.ERROR)
+
+
+def grpc_span(service: str, method: str, server_address: str):
+    """Start the span of a gRPC call, as current span.
+
+    :return: context manager returning the span, or None if tracing is disabled
+    """
+    tracer = _tracer
+    if tracer is None:
+        return _NO_SPAN
+    return tracer.start_as_current_span(
+        "{}/{}".format(service, method),
+        kind=trace.SpanKind.CLIENT,
+        attributes={
+            "rpc.system": "grpc",
+            "rpc.service": service,
+            "rpc.method": method,
+            "server.address": server_address,
+        },
+    )
+
+
+def is_inference_request(path_params: List[Any]) -> bool:
+    """Check whether a REST request is sent to an inference endpoint."""
+    return len(path_params) > 0 and str(path_params[-1]).endswith(INFERENCE_SUFFIX)
+
+
+def inject(headers):
+    """Add the headers propagating the current trace context, if enabled.
+
+    :param headers: request headers or gRPC metadata, modified in place
+    :type headers: dict
+    """
+    if _tracer is not None and _propagate:
+        propagate.inject(headers)
@@ -15,9 +15,16 @@
 #
 
 import os
+from typing import Any, Dict, Optional
 
 from hsml import client
-from hsml.core import model_api, model_registry_api, model_serving_api
+from hsml.client import tracing
+from hsml.core import (
+    metadata_cache,
+    model_api,
+    model_registry_api,
+    model_serving_api,
+)
 from hsml.decorators import connected, not_connected
 from requests.exceptions import ConnectionError
 
@@ -85,6 +92,32 @@ class Connection:
         api_key_file: Path to a file containing the API Key.
         api_key_value: API Key as string, if provided, however, this should be used with care,
         especially if the used notebook or job script is accessible by multiple parties. Defaults to `None`.
+        connection_pool_configuration: Configuration of the HTTP connection pools used by the Hopsworks and Istio clients.
+            Increase the pool size when sending requests from many threads, for example, parallel uploads and predictions.
+            `connection_pool_configuration` can contain the following keys:
+            * key `pool_connections`: number of per-host connection pools to cache. Default 10.
+            * key `pool_maxsize`: maximum number of connections kept open per host. Default 10.
+            * key `pool_block`: whether to wait for a free connection instead of opening a new one when the pool is exhausted. Default False.
+            * key `keep_alive`: whether to keep connections open between requests, sending TCP keep-alive probes. Default True.
+            * key `idle_timeout`: seconds after which idle connections are closed and reopened. Default `None` (never).
+            * key `http2`: whether to send requests over HTTP/2, multiplexing concurrent requests over few connections.
+              HTTPS connections fall back to HTTP/1.1 if not supported by the server. Requires `httpx`,
+              install it with `pip install hsml[http2]`. Default False.
+            * key `http2_prior_knowledge`: whether to also use HTTP/2 on plain HTTP connections, such as the ones
+              to the Istio ingress gateway, without negotiation. Default False.
+        metadata_cache_configuration: Configuration of the cache of model and deployment metadata, used by
+            `get_model` and `get_deployment` lookups. Cached metadata is invalidated when saved, deleted or tagged
+            through this connection, changes made elsewhere are visible once the cached entry expires.
+            Defaults to `None`, which disables the cache. `metadata_cache_configuration` can contain the following keys:
+            * key `ttl`: seconds after which cached metadata expires. Default 60.
+            * key `max_size`: maximum number of cached entries, the least recently used are evicted. Default 1024.
+        tracing_configuration: Configuration of the OpenTelemetry tracing of the requests sent to Hopsworks and the
+            inference endpoints, with a span per REST request and gRPC inference call. Requires `opentelemetry-api`,
+            install it with `pip install hsml[tracing]`. Defaults to `None`, which disables tracing.
+            `tracing_configuration` can contain the following keys:
+            * key `tracer_provider`: OpenTelemetry tracer provider creating the spans. Default `None` (the global one).
+            * key `propagate`: whether to send the trace context to the inference endpoints, so that the client spans
+              can be correlated with the server traces. Default True.
 
     # Returns
         `Connection`. Connection handle to perform operations on a Hopsworks project.
@@ -99,6 +132,9 @@ class Connection:
         trust_store_path: str = None,
         api_key_file: str = None,
         api_key_value: str = None,
+        connection_pool_configuration: Optional[Dict[str, Any]] = None,
+        metadata_cache_configuration: Optional[Dict[str, Any]] = None,
+        tracing_configuration: Optional[Dict[str, Any]] = None,
     ):
         self._host = host
         self._port = port
@@ -107,6 +143,9 @@ class Connection:
         self._trust_store_path = trust_store_path
         self._api_key_file = api_key_file
         self._api_key_value = api_key_value
+        self._connection_pool_configuration = connection_pool_configuration
+        self._metadata_cache_configuration = metadata_cache_configuration
+        self._tracing_configuration = tracing_configuration
         self._connected = False
         self._model_api = model_api.ModelApi()
         self._model_registry_api = model_registry_api.ModelRegistryApi()
@@ -146,6 +185,47 @@ class Connection:
         """
         return self._model_serving_api.get()
 
+    @connected
+    def get_connection_pool_stats(self):
+        """Get statistics of the HTTP connection pools used by the Hopsworks and Istio clients.
+
+        A hit is a request served with an already open connection, while a miss is a request that
+        had to open a new connection. A high number of misses under concurrent load indicates that
+        `pool_maxsize` in `connection_pool_configuration` should be increased.
+
+        !!! example
+            ```python
+            import hsml
+            conn = hsml.connection(connection_pool_configuration={"pool_maxsize": 32})
+            ...
+            conn.get_connection_pool_stats()
+            # {'hopsworks': {'requests': 12, 'hits': 11, 'misses': 1, 'evictions': 0}}
+            ```
+
+        # Returns
+            `dict`. Connection pool statistics per client.
+        """
+        return client.get_connection_pool_stats()
+
+    @connected
+    def get_metadata_cache_stats(self):
+        """Get statistics of the metadata cache, or `None` if it is not enabled.
+
+        !!! example
+            ```python
+            import hsml
+            conn = hsml.connection(metadata_cache_configuration={"ttl": 300})
+            ...
+            conn.get_metadata_cache_stats()
+            # {'hits': 41, 'misses': 3, 'evictions': 0, 'size': 3}
+            ```
+
+        # Returns
+            `dict`. Hits, misses and evictions of the cache, and its number of entries.
+        """
+        cache = metadata_cache.get_instance()
+        return cache.to_dict() if cache is not None else None
+
     @not_connected
     def connect(self):
         """Instantiate the connection.
@@ -164,6 +244,9 @@ class Connection:
             conn.connect()
             ```
         """
+        if self._tracing_configuration is not None:
+            tracing.init(self._tracing_configuration)
+
         self._connected = True
         try:
             # init client
@@ -177,14 +260,22 @@ class Connection:
                     self._trust_store_path,
                     self._api_key_file,
                     self._api_key_value,
+                    self._connection_pool_configuration,
                 )
             else:
-                client.init("internal")
+                client.init(
+                    "internal",
+                    connection_pool_configuration=self._connection_pool_configuration,
+                )
+
+            if self._metadata_cache_configuration is not None:
+                metadata_cache.init(self._metadata_cache_configuration)
 
             self._model_api = model_api.ModelApi()
             self._model_serving_api.load_default_configuration()  # istio client, default resources,...
         except (TypeError, ConnectionError):
             self._connected = False
+            tracing.stop()
             raise
         print("Connected. Call `.close()` to terminate connection gracefully.")
 
@@ -197,6 +288,8 @@ class Connection:
         Usage is recommended but optional.
         """
         client.stop()
+        metadata_cache.stop()
+        tracing.stop()
         self._model_api = None
         self._connected = False
         print("Connection closed.")
@@ -211,6 +304,9 @@ class Connection:
         trust_store_path: str = None,
         api_key_file: str = None,
         api_key_value: str = None,
+        connection_pool_configuration: Optional[Dict[str, Any]] = None,
+        metadata_cache_configuration: Optional[Dict[str, Any]] = None,
+        tracing_configuration: Optional[Dict[str, Any]] = None,
     ):
         """Connection factory method, accessible through `hsml.connection()`."""
         return cls(
@@ -221,6 +317,9 @@ class Connection:
             trust_store_path,
             api_key_file,
             api_key_value,
+            connection_pool_configuration,
+            metadata_cache_configuration,
+            tracing_configuration,
         )
 
     @property
@@ -286,6 +385,33 @@ class Connection:
     def api_key_value(self, api_key_value):
         self._api_key_value = api_key_value
 
+    @property
+    def connection_pool_configuration(self):
+        return self._connection_pool_configuration
+
+    @connection_pool_configuration.setter
+    @not_connected
+    def connection_pool_configuration(self, connection_pool_configuration):
+        self._connection_pool_configuration = connection_pool_configuration
+
+    @property
+    def metadata_cache_configuration(self):
+        return self._metadata_cache_configuration
+
+    @metadata_cache_configuration.setter
+    @not_connected
+    def metadata_cache_configuration(self, metadata_cache_configuration):
+        self._metadata_cache_configuration = metadata_cache_configuration
+
+    @property
+    def tracing_configuration(self):
+        return self._tracing_configuration
+
+    @tracing_configuration.setter
+    @not_connected
+    def tracing_configuration(self, tracing_configuration):
+        self._tracing_configuration = tracing_configuration
+
     def __enter__(self):
         self.connect()
         return self
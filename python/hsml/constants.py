@@ -29,6 +29,17 @@ class MODEL_REGISTRY:
     HOPSFS_MOUNT_PREFIX = "/hopsfs/"
 
 
+class MODEL_FILES:
+    MODE_AUTO = "auto"
+    MODE_FILES = "files"
+    MODE_ARCHIVE = "archive"
+    ARCHIVE_MIN_FILES = 100  # fewer files are transferred one by one
+    ARCHIVE_MAX_AVG_FILE_SIZE = 1_048_576  # bytes, on average per file
+    ARCHIVE_TIMEOUT = 600  # seconds to wait for the archive to be (un)zipped
+    # dataset where the archives of downloaded models are created, outside of Models
+    ARCHIVE_DATASET = "Resources"
+
+
 class MODEL_SERVING:
     MODELS_DATASET = "Models"
 
@@ -71,6 +82,13 @@ class DEPLOYMENT:
     ACTION_STOP = "STOP"
 
 
+class COMPRESSION:
+    ALGORITHM_GZIP = "gzip"
+    ALGORITHM_ZSTD = "zstd"
+    MIN_SIZE = 1024  # bytes, smaller request bodies are not compressed
+    GZIP_LEVEL = 6
+
+
 class PREDICTOR:
     # model server
     MODEL_SERVER_PYTHON = "PYTHON"
@@ -18,10 +18,12 @@ import copy
 import json
 import math
 import os
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, wait
+import weakref
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 
-from hsml import client, tag
+from hsml import client, polling, progress, tag
 from hsml.client.exceptions import RestAPIError
 from tqdm.auto import tqdm
 
@@ -43,8 +45,13 @@ class DatasetApi:
     DEFAULT_UPLOAD_MAX_CHUNK_RETRIES = 1
 
     DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE = 1_048_576
+    DEFAULT_LIST_PAGE_SIZE = 1000
+    ARCHIVE_BACKOFF = polling.Backoff(initial_interval=0.5, max_interval=10)
     FLOW_PERMANENT_ERRORS = [404, 413, 415, 500, 501]
 
+    # project datasets known to exist, {client: {dataset path}}, dropped with the client
+    _existing_datasets = weakref.WeakKeyDictionary()
+
     def upload(
         self,
         local_path: str,
@@ -54,6 +61,7 @@ class DatasetApi:
         simultaneous_uploads=DEFAULT_UPLOAD_SIMULTANEOUS_UPLOADS,
         max_chunk_retries=DEFAULT_UPLOAD_MAX_CHUNK_RETRIES,
         chunk_retry_interval=1,
+        progress_callback=None,
     ):
         """Upload a file to the Hopsworks filesystem.
 
@@ -74,6 +82,8 @@ class DatasetApi:
             simultaneous_uploads: number of simultaneous chunks to upload. Default 3
             max_chunk_retries: maximum retry for a chunk. Default is 1
             chunk_retry_interval: chunk retry interval in seconds. Default is 1sec
+            progress_callback: function called with a `TransferEvent` after each uploaded chunk,
+                from the threads uploading the chunks. Default `None`
         # Returns
             `str`: Path to uploaded file
         # Raises
@@ -111,15 +121,17 @@ class DatasetApi:
         chunk_number = 1
         with open(local_path, "rb") as f:
             pbar = None
-            try:
-                pbar = tqdm(
-                    total=file_size,
-                    bar_format="{desc}: {percentage:.3f}%|{bar}| {n_fmt}/{total_fmt} elapsed<{elapsed} remaining<{remaining}",
-                    desc="Uploading",
-                )
-            except Exception:
-                self._log.exception("Failed to initialize progress bar.")
-                self._log.info("Starting upload")
+            # the progress is reported to the callback instead, if any
+            if progress_callback is None:
+                try:
+                    pbar = tqdm(
+                        total=file_size,
+                        bar_format="{desc}: {percentage:.3f}%|{bar}| {n_fmt}/{total_fmt} elapsed<{elapsed} remaining<{remaining}",
+                        desc="Uploading",
+                    )
+                except Exception:
+                    self._log.exception("Failed to initialize progress bar.")
+                    self._log.info("Starting upload")
             with ThreadPoolExecutor(simultaneous_uploads) as executor:
                 while True:
                     chunks = []
@@ -144,6 +156,7 @@ class DatasetApi:
                             pbar,
                             max_chunk_retries,
                             chunk_retry_interval,
+                            progress_callback,
                         )
                         for chunk in chunks
                     ]
@@ -158,7 +171,7 @@ class DatasetApi:
 
             if pbar is not None:
                 pbar.close()
-            else:
+            elif progress_callback is None:
                 self._log.info("Upload finished")
 
         return upload_path + "/" + os.path.basename(local_path)
@@ -172,6 +185,7 @@ class DatasetApi:
         pbar,
         max_chunk_retries,
         chunk_retry_interval,
+        progress_callback=None,
     ):
         query_params = copy.copy(base_params)
         query_params["flowCurrentChunkSize"] = len(chunk.content)
@@ -179,6 +193,7 @@ class DatasetApi:
 
         chunk.status = "uploading"
         while True:
+            start = time.monotonic()
             try:
                 self._upload_request(
                     query_params, upload_path, file_name, chunk.content
@@ -192,13 +207,29 @@ class DatasetApi:
                 ):
                     chunk.status = "failed"
                     raise re
+                if progress_callback is not None:
+                    progress_callback(
+                        progress.RetryEvent(
+                            upload_path + "/" + file_name, chunk.retries, re
+                        )
+                    )
                 time.sleep(chunk_retry_interval)
                 continue
+        latency = time.monotonic() - start
 
         chunk.status = "uploaded"
 
         if pbar is not None:
             pbar.update(query_params["flowCurrentChunkSize"])
+        if progress_callback is not None:
+            progress_callback(
+                progress.TransferEvent(
+                    upload_path + "/" + file_name,
+                    query_params["flowCurrentChunkSize"],
+                    query_params["flowTotalSize"],
+                    latency=latency,
+                )
+            )
 
     def _get_flow_base_params(self, file_name, num_chunks, size, chunk_size):
         return {
@@ -220,12 +251,15 @@ class DatasetApi:
             "POST", path_params, data=params, files={"file": (file_name, chunk)}
         )
 
-    def download(self, path, local_path):
+    def download(self, path, local_path, progress_callback=None):
         """Download file/directory on a path in datasets.
         :param path: path to download
         :type path: str
         :param local_path: path to download in datasets
         :type local_path: str
+        :param progress_callback: function called with a `TransferEvent` after each
+            downloaded chunk
+        :type progress_callback: Callable, optional
         """
 
         _client = client.get_instance()
@@ -242,14 +276,29 @@ class DatasetApi:
         with _client._send_request(
             "GET", path_params, query_params=query_params, stream=True
         ) as response:
+            content_length = response.headers.get("Content-Length")
+            total_bytes = int(content_length) if content_length else None
             with open(local_path, "wb") as f:
                 downloaded = 0
+                start = time.monotonic()
                 # if not response.headers.get("Content-Length"), file is still downloading
                 for chunk in response.iter_content(
                     chunk_size=self.DEFAULT_DOWNLOAD_FLOW_CHUNK_SIZE
                 ):
                     f.write(chunk)
                     downloaded += len(chunk)
+                    if progress_callback is not None:
+                        end = time.monotonic()
+                        progress_callback(
+                            progress.TransferEvent(
+                                path,
+                                len(chunk),
+                                total_bytes,
+                                direction=progress.TransferEvent.DOWNLOAD,
+                                latency=end - start,
+                            )
+                        )
+                        start = end
 
     def get(self, remote_path):
         """Get metadata about a path in datasets.
@@ -278,7 +327,47 @@ class DatasetApi:
         except RestAPIError:
             return False
 
-    def list(self, remote_path, sort_by=None, limit=1000):
+    def dataset_exists(self, dataset_path):
+        """Check if a project dataset exists.
+
+        Datasets found are remembered, so that they are checked only once per client.
+        The remembered datasets are dropped when the connection is closed.
+
+        :param dataset_path: path of the dataset, for example `Models`
+        :type dataset_path: str
+        :return: boolean whether the dataset exists
+        :rtype: bool
+        """
+        _client = client.get_instance()
+        if dataset_path in DatasetApi._existing_datasets.get(_client, ()):
+            return True
+        if self.path_exists(dataset_path):
+            DatasetApi._existing_datasets.setdefault(_client, set()).add(dataset_path)
+            return True
+        return False
+
+    def list_if_exists(self, remote_path, sort_by=None, limit=1000):
+        """List all files in a directory in datasets, if the directory exists.
+
+        Checks the existence of a directory and lists it in a single request.
+
+        :param remote_path: path to list
+        :type remote_path: str
+        :param sort_by: sort string
+        :type sort_by: str
+        :param limit: max number of returned files
+        :type limit: int
+        :return: the listing, or None if the directory does not exist
+        :rtype: dict
+        """
+        try:
+            return self.list(remote_path, sort_by=sort_by, limit=limit)
+        except RestAPIError as e:
+            if e.response.status_code == 404:
+                return None
+            raise e
+
+    def list(self, remote_path, sort_by=None, limit=1000, offset=None):
         """List all files in a directory in datasets.
 
         :param remote_path: path to list
@@ -287,15 +376,86 @@ class DatasetApi:
         :type sort_by: str
         :param limit: max number of returned files
         :type limit: int
+        :param offset: number of files to skip
+        :type offset: int
         """
         _client = client.get_instance()
         path_params = ["project", _client._project_id, "dataset", remote_path]
-        query_params = {"action": "listing", "sort_by": sort_by, "limit": limit}
+        query_params = {
+            "action": "listing",
+            "sort_by": sort_by,
+            "limit": limit,
+            "offset": offset,
+        }
         headers = {"content-type": "application/json"}
         return _client._send_request(
             "GET", path_params, headers=headers, query_params=query_params
         )
 
+    def iter_list(
+        self,
+        remote_path,
+        sort_by=None,
+        page_size=None,
+        offset=0,
+        prefetch=True,
+    ):
+        """Iterate over all files in a directory in datasets, listing it page by page.
+
+        Entries are yielded as soon as their page is received, while the next page is
+        fetched in the background if `prefetch` is enabled.
+
+        :param remote_path: path to list
+        :type remote_path: str
+        :param sort_by: sort string
+        :type sort_by: str
+        :param page_size: number of files listed per request, defaults to `DEFAULT_LIST_PAGE_SIZE`
+        :type page_size: int
+        :param offset: number of files to skip
+        :type offset: int
+        :param prefetch: whether to fetch the next page while the current one is consumed
+        :type prefetch: bool
+        :return: generator of directory entries
+        :rtype: Iterator[dict]
+        """
+        page_size = page_size or self.DEFAULT_LIST_PAGE_SIZE
+        executor = None
+        try:
+            page = self.list(
+                remote_path, sort_by=sort_by, limit=page_size, offset=offset
+            )
+            while True:
+                items = page.get("items", [])
+                offset += len(items)
+                has_next_page = len(items) > 0 and offset < page["count"]
+
+                next_page = None
+                if has_next_page and prefetch:
+                    if executor is None:
+                        executor = ThreadPoolExecutor(1)
+                    next_page = executor.submit(
+                        self.list,
+                        remote_path,
+                        sort_by=sort_by,
+                        limit=page_size,
+                        offset=offset,
+                    )
+
+                yield from items
+
+                if not has_next_page:
+                    return
+                page = (
+                    next_page.result()
+                    if next_page is not None
+                    else self.list(
+                        remote_path, sort_by=sort_by, limit=page_size, offset=offset
+                    )
+                )
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def chmod(self, remote_path, permissions):
         """Chmod operation on file or directory in datasets.
 
@@ -379,48 +539,99 @@ class DatasetApi:
         )
 
         if block is True:
-            # Wait for zip file to appear. When it does, check that parent dir zipState is not set to CHOWNING
-            count = 0
-            while count < timeout:
-                if action == "zip":
-                    zip_path = remote_path + ".zip"
-                    # Get the status of the zipped file
-                    if destination_path is None:
-                        zip_exists = self.path_exists(zip_path)
-                    else:
-                        zip_exists = self.path_exists(
-                            destination_path + "/" + os.path.split(zip_path)[1]
-                        )
-                    # Get the zipState of the directory being zipped
-                    dir_status = self.get(remote_path)
-                    zip_state = (
-                        dir_status["zipState"] if "zipState" in dir_status else None
-                    )
-                    if zip_exists and zip_state == "NONE":
-                        return
-                    else:
-                        time.sleep(1)
-                elif action == "unzip":
-                    # Get the status of the unzipped dir
-                    unzipped_dir_exists = self.path_exists(
-                        remote_path[: remote_path.index(".")]
-                    )
-                    # Get the zipState of the zip being extracted
-                    dir_status = self.get(remote_path)
-                    zip_state = (
-                        dir_status["zipState"] if "zipState" in dir_status else None
+            self._wait_for_archive(
+                remote_path,
+                destination_path=destination_path,
+                timeout=timeout,
+                action=action,
+            )
+
+    def _archive_async(
+        self, remote_path, destination_path=None, timeout=120, action="unzip"
+    ):
+        """Internal non-blocking (de)compression logic.
+
+        The request is sent before returning, the completion is awaited in a background thread.
+
+        :return: future completed when the operation is complete
+        :rtype: concurrent.futures.Future
+        """
+        self._archive(remote_path, destination_path=destination_path, action=action)
+
+        future = Future()
+
+        def wait_for_archive():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                self._wait_for_archive(
+                    remote_path,
+                    destination_path=destination_path,
+                    timeout=timeout,
+                    action=action,
+                )
+                future.set_result(None)
+            except BaseException as e:
+                future.set_exception(e)
+
+        threading.Thread(target=wait_for_archive, daemon=True).start()
+        return future
+
+    def _wait_for_archive(
+        self, remote_path, destination_path=None, timeout=120, action="unzip"
+    ):
+        """Wait with backoff until a (de)compression is complete, raising an exception on timeout.
+
+        Only the zipState of the path being (un)zipped is requested while the operation
+        is in progress, the output path is checked once the state leaves ZIPPING or
+        UNZIPPING. The state is NONE before the operation starts too, so the output path
+        is also checked on the first poll, and once more on timeout.
+        """
+        output_path = self._get_archive_output_path(
+            remote_path, destination_path, action
+        )
+        status = {"started": False, "output_checked": False}
+
+        def is_complete():
+            if not self._is_archive_complete(remote_path):
+                status["started"] = True
+                return False
+            if status["output_checked"] and not status["started"]:
+                # not started yet, or complete since the last poll, see timeout
+                return False
+            status["output_checked"] = True
+            if self.path_exists(output_path):
+                return True
+            if status["started"]:
+                raise Exception(
+                    "The {} of {} completed without creating {}.".format(
+                        action, remote_path, output_path
                     )
-                    if unzipped_dir_exists and zip_state == "NONE":
-                        return
-                    else:
-                        time.sleep(1)
-                count += 1
-            raise Exception(
+                )
+            return False
+
+        if not polling.poll(
+            is_complete, timeout, backoff=self.ARCHIVE_BACKOFF
+        ) and not self.path_exists(output_path):
+            raise TimeoutError(
                 "Timeout of {} seconds exceeded while {} {}.".format(
                     timeout, action, remote_path
                 )
             )
 
+    def _is_archive_complete(self, remote_path):
+        """Check whether no (de)compression of a path is in progress, with a single request."""
+        return self.get(remote_path).get("zipState") == "NONE"
+
+    def _get_archive_output_path(self, remote_path, destination_path, action):
+        """Get the path of the zip file, or of the folder named after the archive."""
+        if action == "zip":
+            output_path = remote_path + ".zip"
+            if destination_path is not None:
+                output_path = destination_path + "/" + os.path.basename(output_path)
+            return output_path
+        return os.path.splitext(remote_path)[0]
+
     def unzip(self, remote_path, block=False, timeout=120):
         """Unzip an archive in the dataset.
 
@@ -453,6 +664,39 @@ class DatasetApi:
             action="zip",
         )
 
+    def unzip_async(self, remote_path, timeout=120):
+        """Unzip an archive in the dataset without blocking.
+
+        :param remote_path: path to file or directory to unzip
+        :type remote_path: str
+        :param timeout: timeout to wait for the operation to complete
+        :type timeout: int
+        :return: future completed when the archive is extracted, use
+            `add_done_callback` to be notified
+        :rtype: concurrent.futures.Future
+        """
+        return self._archive_async(remote_path, timeout=timeout, action="unzip")
+
+    def zip_async(self, remote_path, destination_path=None, timeout=120):
+        """Zip a file or directory in the dataset without blocking.
+
+        :param remote_path: path to file or directory to zip
+        :type remote_path: str
+        :param destination_path: path to upload the zip
+        :type destination_path: str
+        :param timeout: timeout to wait for the operation to complete
+        :type timeout: int
+        :return: future completed when the zip file is ready, use
+            `add_done_callback` to be notified
+        :rtype: concurrent.futures.Future
+        """
+        return self._archive_async(
+            remote_path,
+            destination_path=destination_path,
+            timeout=timeout,
+            action="zip",
+        )
+
     def move(self, source_path, destination_path):
         """Move a file or directory in the dataset.
 
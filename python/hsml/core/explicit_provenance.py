@@ -19,7 +19,7 @@ import logging
 from enum import Enum
 from typing import Set
 
-import humps
+from hsml import util
 
 
 _logger = logging.getLogger(__name__)
@@ -82,7 +82,7 @@ class Artifact:
 
     @staticmethod
     def from_response_json(json_dict: dict):
-        link_json = humps.decamelize(json_dict)
+        link_json = util.decamelize(json_dict)
         href = None
         exception_cause = None
         if link_json.get("exception_cause") is not None:
@@ -320,7 +320,7 @@ class Links:
     def __from_response_json_feature_store_artifacts(
         json_dict: dict, direction: Direction, artifact: Type
     ):
-        links_json = humps.decamelize(json_dict)
+        links_json = util.decamelize(json_dict)
         if direction == Links.Direction.UPSTREAM:
             if artifact == Links.Type.FEATURE_VIEW:
                 return Links.__parse_feature_views(
@@ -0,0 +1,163 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class MetadataCache:
+    """Thread-safe cache of metadata responses, with TTL and LRU eviction.
+
+    Entries are the json responses of the REST API, so that every lookup builds new
+    metadata objects that can be modified without affecting the cache.
+
+    # Arguments
+        ttl: Seconds after which an entry expires.
+        max_size: Maximum number of entries, the least recently used entry is
+            evicted when exceeded.
+    """
+
+    DEFAULT_TTL = 60
+    DEFAULT_MAX_SIZE = 1024
+
+    def __init__(self, ttl=DEFAULT_TTL, max_size=DEFAULT_MAX_SIZE):
+        self._ttl = ttl
+        self._max_size = max_size
+        self._entries = OrderedDict()  # {key: (expiration time, value)}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @classmethod
+    def from_configuration(cls, metadata_cache_configuration=None):
+        """Create a cache from a metadata cache configuration dictionary."""
+        configuration = metadata_cache_configuration or {}
+        return cls(
+            ttl=configuration.get("ttl", cls.DEFAULT_TTL),
+            max_size=configuration.get("max_size", cls.DEFAULT_MAX_SIZE),
+        )
+
+    def get(self, key):
+        """Get the value of a key, or None if not cached or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self._misses += 1
+            return None
+
+    def put(self, key, value):
+        """Cache the value of a key, evicting the least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def get_or_load(self, key, load):
+        """Get the value of a key, loading and caching it if not cached.
+
+        The lock is not held while loading, concurrent misses may load the value
+        more than once.
+        """
+        value = self.get(key)
+        if value is None:
+            value = load()
+            self.put(key, value)
+        return value
+
+    def invalidate(self, *keys):
+        """Remove keys from the cache."""
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all the entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+
+    def to_dict(self):
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "size": len(self._entries),
+            }
+
+    @property
+    def ttl(self):
+        """Seconds after which an entry expires."""
+        return self._ttl
+
+    @property
+    def max_size(self):
+        """Maximum number of entries."""
+        return self._max_size
+
+    def __repr__(self):
+        return "MetadataCache({})".format(self.to_dict())
+
+
+_metadata_cache = None
+
+
+def init(metadata_cache_configuration=None):
+    """Enable the metadata cache, replacing the current one."""
+    global _metadata_cache
+    _metadata_cache = MetadataCache.from_configuration(metadata_cache_configuration)
+
+
+def get_instance():
+    """Get the metadata cache, or None if not enabled."""
+    global _metadata_cache
+    return _metadata_cache
+
+
+def stop():
+    """Disable the metadata cache."""
+    global _metadata_cache
+    _metadata_cache = None
+
+
+def get_or_load(key, load):
+    """Get a value from the metadata cache if enabled, otherwise load it."""
+    metadata_cache = _metadata_cache
+    if metadata_cache is None:
+        return load()
+    return metadata_cache.get_or_load(key, load)
+
+
+def put(key, value):
+    """Cache a value if the metadata cache is enabled."""
+    metadata_cache = _metadata_cache
+    if metadata_cache is not None:
+        metadata_cache.put(key, value)
+
+
+def invalidate(*keys):
+    """Remove keys from the metadata cache if enabled."""
+    metadata_cache = _metadata_cache
+    if metadata_cache is not None:
+        metadata_cache.invalidate(*keys)
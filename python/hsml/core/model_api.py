@@ -18,7 +18,8 @@ import json
 from typing import Union
 
 from hsml import client, model, tag
-from hsml.core import explicit_provenance
+from hsml import summary as summary_mod
+from hsml.core import explicit_provenance, metadata_cache
 
 
 class ModelApi:
@@ -43,7 +44,7 @@ class ModelApi:
             model_instance.name + "_" + str(model_instance.version),
         ]
         headers = {"content-type": "application/json"}
-        return model_instance.update_from_response_json(
+        model_instance = model_instance.update_from_response_json(
             _client._send_request(
                 "PUT",
                 path_params,
@@ -52,6 +53,8 @@ class ModelApi:
                 data=model_instance.json(),
             )
         )
+        metadata_cache.invalidate(self._get_cache_key(_client, model_instance))
+        return model_instance
 
     def get(self, name, version, model_registry_id, shared_registry_project_name=None):
         """Get the metadata of a model with a certain name and version.
@@ -74,7 +77,10 @@ class ModelApi:
         ]
         query_params = {"expand": "trainingdatasets"}
 
-        model_json = _client._send_request("GET", path_params, query_params)
+        model_json = metadata_cache.get_or_load(
+            ("model", _client._project_id, str(model_registry_id), name, str(version)),
+            lambda: _client._send_request("GET", path_params, query_params),
+        )
         model_meta = model.Model.from_response_json(model_json)
 
         model_meta.shared_registry_project_name = shared_registry_project_name
@@ -88,6 +94,11 @@ class ModelApi:
         shared_registry_project_name=None,
         metric=None,
         direction=None,
+        summary=False,
+        offset=None,
+        limit=None,
+        expand=True,
+        sort_by=None,
     ):
         """Get the metadata of models based on the name or optionally the best model given a metric and direction.
 
@@ -97,6 +108,16 @@ class ModelApi:
         :type metric: str
         :param direction: Whether to maximize or minimize the metric, allowed values are 'max' or 'min'
         :type direction: str
+        :param summary: whether to return model summaries, built into full objects on first access
+        :type summary: bool
+        :param offset: number of models to skip
+        :type offset: int
+        :param limit: maximum number of models to get
+        :type limit: int
+        :param expand: whether to include the training datasets of the models
+        :type expand: bool
+        :param sort_by: order of the models, e.g. `version:asc`, overridden by the metric
+        :type sort_by: str
         :return: model metadata object
         :rtype: Model
         """
@@ -109,10 +130,15 @@ class ModelApi:
             model_registry_id,
             "models",
         ]
-        query_params = {
-            "expand": "trainingdatasets",
-            "filter_by": ["name_eq:" + name],
-        }
+        query_params = {"filter_by": ["name_eq:" + name]}
+        if expand:
+            query_params["expand"] = "trainingdatasets"
+        if offset is not None:
+            query_params["offset"] = offset
+        if limit is not None:
+            query_params["limit"] = limit
+        if sort_by is not None:
+            query_params["sort_by"] = sort_by
 
         if metric is not None and direction is not None:
             if direction.lower() == "max":
@@ -124,7 +150,10 @@ class ModelApi:
             query_params["limit"] = "1"
 
         model_json = _client._send_request("GET", path_params, query_params)
-        models_meta = model.Model.from_response_json(model_json)
+        if summary:
+            models_meta = summary_mod.ModelSummary.from_response_json(model_json)
+        else:
+            models_meta = model.Model.from_response_json(model_json)
 
         for model_meta in models_meta:
             model_meta.shared_registry_project_name = shared_registry_project_name
@@ -147,6 +176,7 @@ class ModelApi:
             model_instance.id,
         ]
         _client._send_request("DELETE", path_params)
+        metadata_cache.invalidate(self._get_cache_key(_client, model_instance))
 
     def set_tag(self, model_instance, name, value: Union[str, dict]):
         """Attach a name/value tag to a model.
@@ -175,6 +205,7 @@ class ModelApi:
         headers = {"content-type": "application/json"}
         json_value = json.dumps(value)
         _client._send_request("PUT", path_params, headers=headers, data=json_value)
+        metadata_cache.invalidate(self._get_cache_key(_client, model_instance))
 
     def delete_tag(self, model_instance, name):
         """Delete a tag.
@@ -198,6 +229,7 @@ class ModelApi:
             name,
         ]
         _client._send_request("DELETE", path_params)
+        metadata_cache.invalidate(self._get_cache_key(_client, model_instance))
 
     def get_tags(self, model_instance, name: str = None):
         """Get the tags.
@@ -299,3 +331,12 @@ class ModelApi:
             explicit_provenance.Links.Direction.UPSTREAM,
             explicit_provenance.Links.Type.TRAINING_DATASET,
         )
+
+    def _get_cache_key(self, _client, model_instance):
+        return (
+            "model",
+            _client._project_id,
+            str(model_instance.model_registry_id),
+            model_instance.name,
+            str(model_instance.version),
+        )
@@ -14,23 +14,28 @@
 #   limitations under the License.
 #
 
+from __future__ import annotations
+
 import json
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Union
 
 from hsml import (
     client,
     deployable_component_logs,
     deployment,
     inference_endpoint,
+    metrics,
     predictor_state,
 )
-from hsml.client.istio.utils.infer_type import (
-    InferInput,
-    InferOutput,
-    InferRequest,
-)
+from hsml import summary as summary_mod
+from hsml.client import compression
 from hsml.constants import ARTIFACT_VERSION
 from hsml.constants import INFERENCE_ENDPOINTS as IE
+from hsml.core import metadata_cache
+
+
+if TYPE_CHECKING:
+    from hsml.client.istio.utils.infer_type import InferInput, InferOutput
 
 
 class ServingApi:
@@ -53,7 +58,10 @@ class ServingApi:
             "serving",
             str(id),
         ]
-        deployment_json = _client._send_request("GET", path_params)
+        deployment_json = metadata_cache.get_or_load(
+            ("deployment_id", _client._project_id, int(id)),
+            lambda: _client._send_request("GET", path_params),
+        )
         deployment_instance = deployment.Deployment.from_response_json(deployment_json)
         deployment_instance.model_registry_id = _client._project_id
         return deployment_instance
@@ -70,16 +78,23 @@ class ServingApi:
         _client = client.get_instance()
         path_params = ["project", _client._project_id, "serving"]
         query_params = {"name": name}
-        deployment_json = _client._send_request(
-            "GET", path_params, query_params=query_params
+        deployment_json = metadata_cache.get_or_load(
+            ("deployment_name", _client._project_id, name),
+            lambda: _client._send_request(
+                "GET", path_params, query_params=query_params
+            ),
         )
         deployment_instance = deployment.Deployment.from_response_json(deployment_json)
         deployment_instance.model_registry_id = _client._project_id
         return deployment_instance
 
-    def get_all(self, model_name: str = None, status: str = None):
+    def get_all(
+        self, model_name: str = None, status: str = None, summary: bool = False
+    ):
         """Get the metadata of all deployments.
 
+        :param summary: whether to return deployment summaries, built into full objects on first access
+        :type summary: bool
         :return: model metadata objects
         :rtype: List[Deployment]
         """
@@ -93,9 +108,14 @@ class ServingApi:
         deployments_json = _client._send_request(
             "GET", path_params, query_params=query_params
         )
-        deployment_instances = deployment.Deployment.from_response_json(
-            deployments_json
-        )
+        if summary:
+            deployment_instances = summary_mod.DeploymentSummary.from_response_json(
+                deployments_json
+            )
+        else:
+            deployment_instances = deployment.Deployment.from_response_json(
+                deployments_json
+            )
         for deployment_instance in deployment_instances:
             deployment_instance.model_registry_id = _client._project_id
         return deployment_instances
@@ -137,6 +157,7 @@ class ServingApi:
             )
         )
         deployment_instance.model_registry_id = _client._project_id
+        metadata_cache.invalidate(*self._get_cache_keys(_client, deployment_instance))
         return deployment_instance
 
     def post(self, deployment_instance, action: str):
@@ -154,7 +175,9 @@ class ServingApi:
             deployment_instance.id,
         ]
         query_params = {"action": action}
-        return _client._send_request("POST", path_params, query_params=query_params)
+        response = _client._send_request("POST", path_params, query_params=query_params)
+        metadata_cache.invalidate(*self._get_cache_keys(_client, deployment_instance))
+        return response
 
     def delete(self, deployment_instance):
         """Delete the deployment and metadata.
@@ -170,7 +193,9 @@ class ServingApi:
             "serving",
             deployment_instance.id,
         ]
-        return _client._send_request("DELETE", path_params)
+        response = _client._send_request("DELETE", path_params)
+        metadata_cache.invalidate(*self._get_cache_keys(_client, deployment_instance))
+        return response
 
     def get_state(self, deployment_instance):
         """Get the state of a given deployment
@@ -207,6 +232,9 @@ class ServingApi:
             "GET", path_params, query_params=query_params
         )
         deployment_aux = deployment_instance.update_from_response_json(deployment_json)
+        # refresh the cached metadata as well, by name and by id
+        for key in self._get_cache_keys(_client, deployment_aux):
+            metadata_cache.put(key, deployment_json)
         # TODO: remove when model_registry_id is added properly to deployments in backend
         deployment_aux.model_registry_id = _client._project_id
         return deployment_aux
@@ -246,6 +274,19 @@ class ServingApi:
         through_hopsworks: bool = False,
     ) -> Dict:
         headers = {"content-type": "application/json"}
+        accept_encoding = compression.get_accept_encoding(
+            deployment_instance.compression_configuration
+        )
+        if accept_encoding is not None:
+            headers["accept-encoding"] = accept_encoding
+        with metrics.phase(metrics.SERIALIZATION):
+            body, content_encoding = compression.compress(
+                json.dumps(data).encode("utf-8"),
+                deployment_instance.compression_configuration,
+            )
+        if content_encoding is not None:
+            headers["content-encoding"] = content_encoding
+
         if through_hopsworks:
             # use Hopsworks client
             _client = client.get_instance()
@@ -270,14 +311,21 @@ class ServingApi:
                     _client._project_id, deployment_instance
                 )
 
-        # send inference request
-        return _client._send_request(
-            "POST", path_params, headers=headers, data=json.dumps(data)
-        )
+        # send inference request, the response is streamed to time its parsing apart
+        with metrics.phase(metrics.NETWORK):
+            response = _client._send_request(
+                "POST", path_params, headers=headers, data=body, stream=True
+            )
+            content = response.content
+        with metrics.phase(metrics.DESERIALIZATION):
+            return response.json() if len(content) > 0 else None
 
     def _send_inference_request_via_grpc_protocol(
         self, deployment_instance, data: List[InferInput]
     ) -> List[InferOutput]:
+        # grpc and protobuf are only imported when sending grpc requests
+        from hsml.client.istio.utils.infer_type import InferRequest
+
         # get grpc channel
         if deployment_instance._grpc_channel is None:
             # The gRPC channel is lazily initialized. The first call to deployment.predict() will initialize
@@ -415,3 +463,11 @@ class ServingApi:
 
     def _get_istio_inference_path(self, deployment_instance):
         return ["v1", "models", deployment_instance.name + ":predict"]
+
+    def _get_cache_keys(self, _client, deployment_instance):
+        keys = [("deployment_name", _client._project_id, deployment_instance.name)]
+        if deployment_instance.id is not None:
+            keys.append(
+                ("deployment_id", _client._project_id, int(deployment_instance.id))
+            )
+        return keys
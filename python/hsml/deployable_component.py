@@ -17,7 +17,6 @@ import json
 from abc import ABC, abstractmethod
 from typing import Optional, Union
 
-import humps
 from hsml import util
 from hsml.inference_batcher import InferenceBatcher
 from hsml.resources import Resources
@@ -48,7 +47,7 @@ class DeployableComponent(ABC):
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls.from_json(json_decamelized)
 
     def json(self):
@@ -15,7 +15,6 @@
 
 from datetime import datetime
 
-import humps
 from hsml import util
 
 
@@ -36,7 +35,7 @@ class DeployableComponentLogs:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         if len(json_decamelized) == 0:
             return []
         return [cls.from_json(logs) for logs in json_decamelized]
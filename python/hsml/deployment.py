@@ -13,22 +13,29 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from typing import Dict, List, Optional, Union
+from __future__ import annotations
 
-from hsml import client, util
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+
+from hsml import client, metrics, util
 from hsml import predictor as predictor_mod
+from hsml.client import compression
 from hsml.client.exceptions import ModelServingException
-from hsml.client.istio.utils.infer_type import InferInput
 from hsml.constants import DEPLOYABLE_COMPONENT, PREDICTOR_STATE
 from hsml.core import model_api, serving_api
 from hsml.engine import serving_engine
 from hsml.inference_batcher import InferenceBatcher
 from hsml.inference_logger import InferenceLogger
 from hsml.predictor_state import PredictorState
+from hsml.progress import ProgressEvent
 from hsml.resources import Resources
 from hsml.transformer import Transformer
 
 
+if TYPE_CHECKING:
+    from hsml.client.istio.utils.infer_type import InferInput
+
+
 class Deployment:
     """Metadata object representing a deployment in Model Serving."""
 
@@ -61,7 +68,11 @@ class Deployment:
         self._serving_engine = serving_engine.ServingEngine()
         self._model_api = model_api.ModelApi()
         self._grpc_channel = None
+        self._input_validator = None
+        # name and version of the model the input validator was compiled for
+        self._input_validator_model = None
         self._model_registry_id = None
+        self._compression_configuration = None
 
     def save(self, await_update: Optional[int] = 60):
         """Persist this deployment including the predictor and metadata to Model Serving.
@@ -74,27 +85,43 @@ class Deployment:
 
         self._serving_engine.save(self, await_update)
 
-    def start(self, await_running: Optional[int] = 60):
+    def start(
+        self,
+        await_running: Optional[int] = 60,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+    ):
         """Start the deployment
 
         # Arguments
             await_running: Awaiting time (seconds) for the deployment to start.
                            If the deployment has not started within this timespan, the call to this method returns while
                            it deploys in the background.
+            progress_callback: Function called with a `StepEvent` and a `StepCompletedEvent` when the deployment
+                           starts and completes a step, instead of showing a progress bar. Defaults to `None`.
         """
 
-        self._serving_engine.start(self, await_status=await_running)
+        self._serving_engine.start(
+            self, await_status=await_running, progress_callback=progress_callback
+        )
 
-    def stop(self, await_stopped: Optional[int] = 60):
+    def stop(
+        self,
+        await_stopped: Optional[int] = 60,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+    ):
         """Stop the deployment
 
         # Arguments
             await_stopped: Awaiting time (seconds) for the deployment to stop.
                            If the deployment has not stopped within this timespan, the call to this method returns while
                            it stopping in the background.
+            progress_callback: Function called with a `StepEvent` and a `StepCompletedEvent` when the deployment
+                           starts and completes a step, instead of showing a progress bar. Defaults to `None`.
         """
 
-        self._serving_engine.stop(self, await_status=await_stopped)
+        self._serving_engine.stop(
+            self, await_status=await_stopped, progress_callback=progress_callback
+        )
 
     def delete(self, force=False):
         """Delete the deployment
@@ -169,6 +196,7 @@ class Deployment:
         self,
         data: Union[Dict, InferInput] = None,
         inputs: Union[List, Dict] = None,
+        validate: bool = False,
     ):
         """Send inference requests to the deployment.
            One of data or inputs parameters must be set. If both are set, inputs will be ignored.
@@ -195,15 +223,66 @@ class Deployment:
             predictions = my_deployment.predict(data)
             ```
 
+        !!! example "Validate inputs against the model schema"
+            ```python
+            # inputs are checked before sending the request, and converted to typed
+            # InferInput objects for deployments using the gRPC protocol
+            predictions = my_deployment.predict(inputs=df, validate=True)
+            ```
+
         # Arguments
             data: Payload dictionary for the inference request including the model input(s)
             inputs: Model inputs used in the inference requests
+            validate: Whether to check the dtype and shape of the inputs against the input schema of the deployed
+                model before sending the request, defaults to `False`. See `get_input_validator()`.
 
         # Returns
             `dict`. Inference response.
         """
 
-        return self._serving_engine.predict(self, data, inputs)
+        input_validator = self.get_input_validator() if validate else None
+        return self._serving_engine.predict(
+            self, data, inputs, input_validator=input_validator
+        )
+
+    def get_input_validator(self):
+        """Get the validator of inference inputs, compiled from the model schema of the deployed model.
+
+        The model schema is downloaded and compiled the first time, and the validator is reused afterwards
+        until the name or version of the deployed model changes.
+        It checks numpy arrays, pandas DataFrames and lists of instances as a whole per tensor or column.
+
+        # Returns
+            `InputValidator`. The validator of inference inputs.
+        # Raises
+            `ModelServingException`: If the model has no input schema.
+        """
+        model = (self.model_name, self.model_version)
+        if self._input_validator is None or self._input_validator_model != model:
+            self._input_validator = self._serving_engine.get_input_validator(self)
+            self._input_validator_model = model
+        return self._input_validator
+
+    def get_client_stats(self):
+        """Get client-side metrics of the inference requests sent to the deployment.
+
+        The latency of each request is split into the time spent serializing the payload,
+        waiting for a pooled connection (queueing), on the network including the server
+        processing, and deserializing the response. Metrics are shared by all the
+        deployment objects with the same name in this process.
+
+        !!! example
+            ```python
+            my_deployment.predict(inputs=my_model.input_example)
+
+            stats = my_deployment.get_client_stats()
+            stats["latency"]["total"]["p99"]
+            ```
+
+        # Returns
+            `dict`. Number of requests and errors, and count, mean, p50, p90, p99 and max latency in seconds per phase.
+        """
+        return metrics.get_deployment_metrics(self.name).to_dict()
 
     def get_model(self):
         """Retrieve the metadata object for the model being used by this deployment"""
@@ -442,6 +521,31 @@ class Deployment:
     def model_registry_id(self, model_registry_id: int):
         self._model_registry_id = model_registry_id
 
+    @property
+    def compression_configuration(self):
+        """Compression of the REST inference requests sent to the deployment, `None` to send them uncompressed.
+
+        Client-side setting, it is not saved with the deployment. It can contain the following keys:
+        * key `algorithm`: compression algorithm, `"gzip"` or `"zstd"` (requires `zstandard`). Default `"gzip"`.
+        * key `min_size`: minimum size in bytes of the request body to be compressed. Default 1024.
+        * key `level`: compression level. Default is the algorithm default.
+
+        Responses compressed with the configured algorithm are preferred and decompressed transparently.
+
+        !!! example
+            ```python
+            my_deployment.compression_configuration = {"algorithm": "gzip", "min_size": 64 * 1024}
+            ```
+        """
+        return self._compression_configuration
+
+    @compression_configuration.setter
+    def compression_configuration(
+        self, compression_configuration: Optional[Dict[str, Any]]
+    ):
+        compression.validate_configuration(compression_configuration)
+        self._compression_configuration = compression_configuration
+
     @property
     def created_at(self):
         """Created at date of the predictor."""
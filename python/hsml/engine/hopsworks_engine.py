@@ -16,7 +16,7 @@
 
 import os
 
-from hsml import client
+from hsml import client, progress
 from hsml.core import model_api, native_hdfs_api
 
 
@@ -33,16 +33,36 @@ class HopsworksEngine:
     def delete(self, model_instance):
         self._model_api.delete(model_instance)
 
-    def upload(self, local_path: str, remote_path: str, upload_configuration=None):
+    def upload(
+        self,
+        local_path: str,
+        remote_path: str,
+        upload_configuration=None,
+        progress_callback=None,
+    ):
         local_path = self._get_abs_path(local_path)
         remote_path = self._prepend_project_path(remote_path)
         self._native_hdfs_api.upload(local_path, remote_path)
         self._native_hdfs_api.chmod(remote_path, "ug+rwx")
+        if progress_callback is not None:
+            size = os.path.getsize(local_path)
+            progress_callback(
+                progress.TransferEvent(
+                    remote_path + "/" + os.path.basename(local_path), size, size
+                )
+            )
 
-    def download(self, remote_path: str, local_path: str):
+    def download(self, remote_path: str, local_path: str, progress_callback=None):
         local_path = self._get_abs_path(local_path)
         remote_path = self._prepend_project_path(remote_path)
         self._native_hdfs_api.download(remote_path, local_path)
+        if progress_callback is not None:
+            size = os.path.getsize(local_path)
+            progress_callback(
+                progress.TransferEvent(
+                    remote_path, size, size, direction=progress.TransferEvent.DOWNLOAD
+                )
+            )
 
     def copy(self, source_path: str, destination_path: str):
         # both paths are hdfs paths
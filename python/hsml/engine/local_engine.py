@@ -32,7 +32,13 @@ class LocalEngine:
     def delete(self, model_instance):
         self._model_api.delete(model_instance)
 
-    def upload(self, local_path: str, remote_path: str, upload_configuration=None):
+    def upload(
+        self,
+        local_path: str,
+        remote_path: str,
+        upload_configuration=None,
+        progress_callback=None,
+    ):
         local_path = self._get_abs_path(local_path)
         remote_path = self._prepend_project_path(remote_path)
 
@@ -52,12 +58,15 @@ class LocalEngine:
                 "max_chunk_retries",
                 self._dataset_api.DEFAULT_UPLOAD_MAX_CHUNK_RETRIES,
             ),
+            progress_callback=progress_callback,
         )
 
-    def download(self, remote_path: str, local_path: str):
+    def download(self, remote_path: str, local_path: str, progress_callback=None):
         local_path = self._get_abs_path(local_path)
         remote_path = self._prepend_project_path(remote_path)
-        self._dataset_api.download(remote_path, local_path)
+        self._dataset_api.download(
+            remote_path, local_path, progress_callback=progress_callback
+        )
 
     def copy(self, source_path, destination_path):
         source_path = self._prepend_project_path(source_path)
@@ -14,13 +14,17 @@
 #   limitations under the License.
 #
 
+import itertools
 import json
 import os
+import shutil
 import tempfile
-import time
+import threading
 import uuid
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 
-from hsml import client, constants, util
+from hsml import client, constants, polling, progress, util
 from hsml.client.exceptions import ModelRegistryException, RestAPIError
 from hsml.core import dataset_api, model_api
 from hsml.engine import local_engine
@@ -28,6 +32,9 @@ from tqdm.auto import tqdm
 
 
 class ModelEngine:
+    DEFAULT_COPY_MOVE_CONCURRENCY = 8
+    REGISTRATION_BACKOFF = polling.Backoff(initial_interval=0.25, max_interval=5)
+
     def __init__(self):
         self._model_api = model_api.ModelApi()
         self._dataset_api = dataset_api.DatasetApi()
@@ -37,45 +44,50 @@ class ModelEngine:
     def _poll_model_available(self, model_instance, await_registration):
         if await_registration > 0:
             model_registry_id = model_instance.model_registry_id
-            sleep_seconds = 5
-            for _ in range(int(await_registration / sleep_seconds)):
+
+            def get_model_meta():
                 try:
-                    time.sleep(sleep_seconds)
-                    model_meta = self._model_api.get(
+                    return self._model_api.get(
                         model_instance.name,
                         model_instance.version,
                         model_registry_id,
                         model_instance.shared_registry_project_name,
                     )
-                    if model_meta is not None:
-                        return model_meta
                 except RestAPIError as e:
                     if e.response.status_code != 404:
                         raise e
+
+            model_meta = polling.poll(
+                get_model_meta, await_registration, backoff=self.REGISTRATION_BACKOFF
+            )
+            if model_meta is not None:
+                return model_meta
             print(
                 "Model not available during polling, set a higher value for await_registration to wait longer."
             )
 
     def _upload_additional_resources(self, model_instance):
+        # each file is written in its own temporary folder, models can be saved
+        # concurrently with save_async
         if model_instance._input_example is not None:
-            input_example_path = os.path.join(os.getcwd(), "input_example.json")
             input_example = util.input_example_to_json(model_instance._input_example)
 
-            with open(input_example_path, "w+") as out:
-                json.dump(input_example, out, cls=util.NumpyEncoder)
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                input_example_path = os.path.join(tmp_dir, "input_example.json")
+                with open(input_example_path, "w+") as out:
+                    json.dump(input_example, out, cls=util.NumpyEncoder)
 
-            self._engine.upload(input_example_path, model_instance.version_path)
-            os.remove(input_example_path)
+                self._engine.upload(input_example_path, model_instance.version_path)
             model_instance.input_example = None
         if model_instance._model_schema is not None:
-            model_schema_path = os.path.join(os.getcwd(), "model_schema.json")
             model_schema = model_instance._model_schema
 
-            with open(model_schema_path, "w+") as out:
-                out.write(model_schema.json())
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                model_schema_path = os.path.join(tmp_dir, "model_schema.json")
+                with open(model_schema_path, "w+") as out:
+                    out.write(model_schema.json())
 
-            self._engine.upload(model_schema_path, model_instance.version_path)
-            os.remove(model_schema_path)
+                self._engine.upload(model_schema_path, model_instance.version_path)
             model_instance.model_schema = None
         return model_instance
 
@@ -90,6 +102,33 @@ class ModelEngine:
         else:
             self._engine.move(path, to_hdfs_path)
 
+    def _copy_or_move_hopsfs_model_items(
+        self,
+        entries,
+        to_model_version_path,
+        keep_original_files,
+        update_upload_progress,
+    ):
+        """Copy or move model items to the model version folder with concurrent requests."""
+        n_dirs, n_files = 0, 0
+        with ThreadPoolExecutor(self.DEFAULT_COPY_MOVE_CONCURRENCY) as executor:
+            futures = {
+                executor.submit(
+                    self._copy_or_move_hopsfs_model_item,
+                    entry["attributes"],
+                    to_model_version_path,
+                    keep_original_files,
+                ): entry["attributes"]
+                for entry in entries
+            }
+            for future in as_completed(futures):
+                future.result()
+                if futures[future].get("dir", False):
+                    n_dirs += 1
+                else:
+                    n_files += 1
+                update_upload_progress(n_dirs=n_dirs, n_files=n_files)
+
     def _copy_or_move_hopsfs_model(
         self,
         from_hdfs_model_path,
@@ -116,19 +155,19 @@ class ModelEngine:
                 " Move the model to a sub-folder and try again."
             )
         elif model_path_attr.get("dir", False):
-            # if path is a directory, iterate of the directory content
-            for entry in self._dataset_api.list(
-                from_hdfs_model_path, sort_by="NAME:desc"
-            )["items"]:
-                path_attr = entry["attributes"]
-                self._copy_or_move_hopsfs_model_item(
-                    path_attr, to_model_version_path, keep_original_files
-                )
-                if path_attr.get("dir", False):
-                    n_dirs += 1
-                else:
-                    n_files += 1
-                update_upload_progress(n_dirs=n_dirs, n_files=n_files)
+            # if path is a directory, copy/move its entries into the model version
+            # folder, which keeps its permissions, and so does the source directory.
+            # The entries are listed before moving them, moved entries would shift the
+            # listing pages
+            entries = list(
+                self._dataset_api.iter_list(from_hdfs_model_path, sort_by="NAME:desc")
+            )
+            self._copy_or_move_hopsfs_model_items(
+                entries,
+                to_model_version_path,
+                keep_original_files,
+                update_upload_progress,
+            )
         else:
             # if path is a file, copy/move it
             self._copy_or_move_hopsfs_model_item(
@@ -137,60 +176,124 @@ class ModelEngine:
             n_files += 1
             update_upload_progress(n_dirs=n_dirs, n_files=n_files)
 
-    def _download_model_from_hopsfs_recursive(
-        self,
-        from_hdfs_model_path: str,
-        to_local_path: str,
-        update_download_progress,
-        n_dirs,
-        n_files,
-    ):
-        """Download model files from a model path in hdfs, recursively"""
+    def _list_hopsfs_model_recursive(self, from_hdfs_model_path, relative_path=""):
+        """List model files and folders in a model path in hdfs, recursively.
 
-        for entry in self._dataset_api.list(from_hdfs_model_path, sort_by="NAME:desc")[
-            "items"
-        ]:
+        Returns (relative path, attributes) pairs, folders precede their content.
+        """
+        entries = []
+        for entry in self._dataset_api.iter_list(
+            from_hdfs_model_path, sort_by="NAME:desc"
+        ):
             path_attr = entry["attributes"]
-            path = path_attr["path"]
-            basename = os.path.basename(path)
+            basename = os.path.basename(path_attr["path"])
+            entry_path = os.path.join(relative_path, basename)
 
             if path_attr.get("dir", False):
-                # otherwise, make a recursive call for the folder
+                # otherwise, list the folder recursively
                 if basename == "Artifacts":
                     continue  # skip Artifacts subfolder
-                local_folder_path = os.path.join(to_local_path, basename)
-                os.mkdir(local_folder_path)
-                n_dirs, n_files = self._download_model_from_hopsfs_recursive(
-                    from_hdfs_model_path=path,
-                    to_local_path=local_folder_path,
-                    update_download_progress=update_download_progress,
-                    n_dirs=n_dirs,
-                    n_files=n_files,
+                entries.append((entry_path, path_attr))
+                entries.extend(
+                    self._list_hopsfs_model_recursive(path_attr["path"], entry_path)
                 )
+            else:
+                entries.append((entry_path, path_attr))
+        return entries
+
+    def _download_model_from_hopsfs(
+        self,
+        entries,
+        to_local_path: str,
+        update_download_progress,
+        progress_callback=None,
+    ):
+        """Download listed model files from a model path in hdfs, one by one."""
+        n_dirs, n_files = 0, 0
+        for entry_path, path_attr in entries:
+            local_path = os.path.join(to_local_path, entry_path)
+            if path_attr.get("dir", False):
+                os.mkdir(local_path)
                 n_dirs += 1
-                update_download_progress(n_dirs=n_dirs, n_files=n_files)
             else:
                 # if it's a file, download it
-                local_file_path = os.path.join(to_local_path, basename)
-                self._engine.download(path, local_file_path)
+                self._engine.download(
+                    path_attr["path"], local_path, progress_callback=progress_callback
+                )
                 n_files += 1
-                update_download_progress(n_dirs=n_dirs, n_files=n_files)
-
-        return n_dirs, n_files
+            update_download_progress(n_dirs=n_dirs, n_files=n_files)
+        update_download_progress(n_dirs=n_dirs, n_files=n_files, done=True)
 
-    def _download_model_from_hopsfs(
-        self, from_hdfs_model_path: str, to_local_path: str, update_download_progress
+    def _download_model_archive(
+        self,
+        from_hdfs_model_path: str,
+        to_local_path: str,
+        update_download_progress,
+        progress_callback=None,
     ):
-        """Download model files from a model path in hdfs."""
-
-        n_dirs, n_files = self._download_model_from_hopsfs_recursive(
-            from_hdfs_model_path=from_hdfs_model_path,
-            to_local_path=to_local_path,
-            update_download_progress=update_download_progress,
-            n_dirs=0,
-            n_files=0,
+        """Download model files from a model path in hdfs in a single zip archive, created server-side.
+
+        Returns False if the archive could not be created in time.
+        """
+        _, version = os.path.split(from_hdfs_model_path.rstrip("/"))
+        # the archive is created in a folder of its own, not to collide with concurrent
+        # downloads of the same model version, and outside of the model folder
+        remote_archive_dir = (
+            constants.MODEL_FILES.ARCHIVE_DATASET + "/" + str(uuid.uuid4())
         )
+        remote_archive_path = remote_archive_dir + "/" + version + ".zip"
+        local_archive_path = to_local_path + ".zip"
+        try:
+            self._dataset_api.mkdir(remote_archive_dir)
+        except RestAPIError:
+            return False
+
+        try:
+            try:
+                self._dataset_api.zip(
+                    from_hdfs_model_path,
+                    destination_path=remote_archive_dir,
+                    block=True,
+                    timeout=constants.MODEL_FILES.ARCHIVE_TIMEOUT,
+                )
+            except (RestAPIError, TimeoutError):
+                return False
+            self._engine.download(
+                remote_archive_path,
+                local_archive_path,
+                progress_callback=progress_callback,
+            )
+            n_dirs, n_files = self._extract_model_archive(
+                local_archive_path, to_local_path, version
+            )
+        finally:
+            if os.path.exists(local_archive_path):
+                os.remove(local_archive_path)
+            self._dataset_api.rm(remote_archive_dir)
         update_download_progress(n_dirs=n_dirs, n_files=n_files, done=True)
+        return True
+
+    def _extract_model_archive(self, archive_path, to_local_path, root):
+        """Extract a model archive, whose entries can be under a root folder, skipping the Artifacts subfolder."""
+        local_dirs, n_files = set(), 0
+        with zipfile.ZipFile(archive_path) as archive:
+            for member in archive.infolist():
+                parts = [p for p in member.filename.split("/") if p]
+                if parts[:1] == [root]:
+                    parts = parts[1:]
+                if not parts or parts[0] == "Artifacts" or ".." in parts:
+                    continue
+                dir_parts = parts if member.is_dir() else parts[:-1]
+                for i in range(1, len(dir_parts) + 1):
+                    local_dirs.add(os.path.join(*dir_parts[:i]))
+                os.makedirs(os.path.join(to_local_path, *dir_parts), exist_ok=True)
+                if not member.is_dir():
+                    with archive.open(member) as src, open(
+                        os.path.join(to_local_path, *parts), "wb"
+                    ) as dst:
+                        shutil.copyfileobj(src, dst)
+                    n_files += 1
+        return len(local_dirs), n_files
 
     def _upload_local_model(
         self,
@@ -198,10 +301,22 @@ class ModelEngine:
         to_model_version_path,
         update_upload_progress,
         upload_configuration=None,
+        progress_callback=None,
     ):
         """Copy or upload model files from a local path to the model version folder in the Models dataset."""
         n_dirs, n_files = 0, 0
-        if os.path.isdir(from_local_model_path):
+        if os.path.isdir(from_local_model_path) and self._is_archive_upload(
+            from_local_model_path, upload_configuration
+        ):
+            # if path is a dir with many small files, upload them in a single archive
+            self._upload_local_model_archive(
+                from_local_model_path,
+                to_model_version_path,
+                update_upload_progress,
+                upload_configuration=upload_configuration,
+                progress_callback=progress_callback,
+            )
+        elif os.path.isdir(from_local_model_path):
             # if path is a dir, upload files and folders iteratively
             for root, dirs, files in os.walk(from_local_model_path):
                 # os.walk(local_model_path), where local_model_path is expected to be an absolute path
@@ -221,6 +336,7 @@ class ModelEngine:
                         root + "/" + f_name,
                         remote_base_path,
                         upload_configuration=upload_configuration,
+                        progress_callback=progress_callback,
                     )
                     n_files += 1
                     update_upload_progress(n_dirs, n_files)
@@ -230,10 +346,112 @@ class ModelEngine:
                 from_local_model_path,
                 to_model_version_path,
                 upload_configuration=upload_configuration,
+                progress_callback=progress_callback,
             )
             n_files += 1
             update_upload_progress(n_dirs, n_files)
 
+    def _use_archive(self, mode, n_files, total_size):
+        """Whether to transfer model files in a single archive, based on the number and size of the files."""
+        if mode not in (
+            constants.MODEL_FILES.MODE_AUTO,
+            constants.MODEL_FILES.MODE_FILES,
+            constants.MODEL_FILES.MODE_ARCHIVE,
+        ):
+            raise ValueError(
+                "Mode '{}' is not supported. Possible values are '{}', '{}' and '{}'".format(
+                    mode,
+                    constants.MODEL_FILES.MODE_AUTO,
+                    constants.MODEL_FILES.MODE_FILES,
+                    constants.MODEL_FILES.MODE_ARCHIVE,
+                )
+            )
+        if mode != constants.MODEL_FILES.MODE_AUTO:
+            return mode == constants.MODEL_FILES.MODE_ARCHIVE
+        return (
+            n_files >= constants.MODEL_FILES.ARCHIVE_MIN_FILES
+            and total_size <= n_files * constants.MODEL_FILES.ARCHIVE_MAX_AVG_FILE_SIZE
+        )
+
+    def _is_archive_upload(self, from_local_model_path, upload_configuration=None):
+        """Whether to upload the files of a local model directory in a single archive."""
+        mode = (upload_configuration or {}).get("mode", constants.MODEL_FILES.MODE_AUTO)
+        n_files, total_size = 0, 0
+        if mode == constants.MODEL_FILES.MODE_AUTO:
+            for root, _, files in os.walk(from_local_model_path):
+                n_files += len(files)
+                total_size += sum(
+                    os.path.getsize(os.path.join(root, f_name)) for f_name in files
+                )
+        return self._use_archive(mode, n_files, total_size)
+
+    def _upload_local_model_archive(
+        self,
+        from_local_model_path,
+        to_model_version_path,
+        update_upload_progress,
+        upload_configuration=None,
+        progress_callback=None,
+    ):
+        """Upload model files from a local directory in a single zip archive, extracted in the model version folder."""
+        # the archive is extracted in a folder of its own, whose zipState tells when the
+        # extraction is complete, and its entries are then moved to the version folder
+        version = os.path.basename(to_model_version_path.rstrip("/"))
+        remote_archive_dir = (
+            constants.MODEL_FILES.ARCHIVE_DATASET + "/" + str(uuid.uuid4())
+        )
+        n_dirs, n_files = 0, 0
+        with tempfile.TemporaryDirectory() as archive_dir:
+            archive_path = os.path.join(archive_dir, version + ".zip")
+            with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as archive:
+                for root, dirs, files in os.walk(from_local_model_path):
+                    archive_root = os.path.normpath(
+                        os.path.join(
+                            version, os.path.relpath(root, from_local_model_path)
+                        )
+                    )
+                    for d_name in dirs:
+                        archive.write(
+                            os.path.join(root, d_name),
+                            os.path.join(archive_root, d_name),
+                        )
+                        n_dirs += 1
+                    for f_name in files:
+                        archive.write(
+                            os.path.join(root, f_name),
+                            os.path.join(archive_root, f_name),
+                        )
+                        n_files += 1
+                    update_upload_progress(n_dirs, n_files)
+            if n_dirs + n_files == 0:
+                return  # empty model directory
+            self._dataset_api.mkdir(remote_archive_dir)
+            try:
+                self._engine.upload(
+                    archive_path,
+                    remote_archive_dir,
+                    upload_configuration=upload_configuration,
+                    progress_callback=progress_callback,
+                )
+                self._dataset_api.unzip(
+                    remote_archive_dir + "/" + version + ".zip",
+                    block=True,
+                    timeout=constants.MODEL_FILES.ARCHIVE_TIMEOUT,
+                )
+                entries = list(
+                    self._dataset_api.iter_list(
+                        remote_archive_dir + "/" + version, sort_by="NAME:desc"
+                    )
+                )
+                self._copy_or_move_hopsfs_model_items(
+                    entries,
+                    to_model_version_path,
+                    keep_original_files=False,
+                    update_upload_progress=lambda n_dirs, n_files: None,
+                )
+            finally:
+                self._dataset_api.rm(remote_archive_dir)
+
     def _save_model_from_local_or_hopsfs_mount(
         self,
         model_instance,
@@ -241,6 +459,7 @@ class ModelEngine:
         keep_original_files,
         update_upload_progress,
         upload_configuration=None,
+        progress_callback=None,
     ):
         """Save model files from a local path. The local path can be on hopsfs mount"""
         # check hopsfs mount
@@ -259,36 +478,35 @@ class ModelEngine:
                 to_model_version_path=model_instance.version_path,
                 update_upload_progress=update_upload_progress,
                 upload_configuration=upload_configuration,
+                progress_callback=progress_callback,
             )
 
-    def _set_model_version(
-        self, model_instance, dataset_models_root_path, dataset_model_path
-    ):
-        # Set model version if not defined
+    def _set_model_version(self, model_instance, dataset_model_path, model_listing):
+        """Set the model version if not defined, or check that it does not exist yet.
+
+        The versions are taken from the listing of the model folder, `None` if the folder
+        does not exist. If the listing is truncated, the remaining entries are listed.
+        """
+        entries = [] if model_listing is None else model_listing.get("items", [])
+        if model_listing is not None and model_listing["count"] > len(entries):
+            entries = itertools.chain(
+                entries,
+                self._dataset_api.iter_list(
+                    dataset_model_path, sort_by="NAME:desc", offset=len(entries)
+                ),
+            )
+
+        model_versions = set()
+        for item in entries:
+            _, file_name = os.path.split(item["attributes"]["path"])
+            try:
+                model_versions.add(int(file_name))
+            except ValueError:
+                continue
+
         if model_instance._version is None:
-            current_highest_version = 0
-            for item in self._dataset_api.list(dataset_model_path, sort_by="NAME:desc")[
-                "items"
-            ]:
-                _, file_name = os.path.split(item["attributes"]["path"])
-                try:
-                    try:
-                        current_version = int(file_name)
-                    except ValueError:
-                        continue
-                    if current_version > current_highest_version:
-                        current_highest_version = current_version
-                except RestAPIError:
-                    pass
-            model_instance._version = current_highest_version + 1
-
-        elif self._dataset_api.path_exists(
-            dataset_models_root_path
-            + "/"
-            + model_instance._name
-            + "/"
-            + str(model_instance._version)
-        ):
+            model_instance._version = max(model_versions, default=0) + 1
+        elif model_instance._version in model_versions:
             raise ModelRegistryException(
                 "Model with name {} and version {} already exists".format(
                     model_instance._name, model_instance._version
@@ -307,6 +525,7 @@ class ModelEngine:
         await_registration=480,
         keep_original_files=False,
         upload_configuration=None,
+        progress_callback=None,
     ):
         _client = client.get_instance()
 
@@ -324,20 +543,23 @@ class ModelEngine:
 
         util.validate_metrics(model_instance.training_metrics)
 
-        if not self._dataset_api.path_exists(dataset_models_root_path):
+        if not self._dataset_api.dataset_exists(dataset_models_root_path):
             raise AssertionError(
                 "{} dataset does not exist in this project. Please enable the Serving service or create it manually.".format(
                     dataset_models_root_path
                 )
             )
 
-        # Create /Models/{model_instance._name} folder
+        # Create /Models/{model_instance._name} folder, listing the existing versions
         dataset_model_name_path = dataset_models_root_path + "/" + model_instance._name
-        if not self._dataset_api.path_exists(dataset_model_name_path):
+        model_listing = self._dataset_api.list_if_exists(
+            dataset_model_name_path, sort_by="NAME:desc"
+        )
+        if model_listing is None:
             self._engine.mkdir(dataset_model_name_path)
 
         model_instance = self._set_model_version(
-            model_instance, dataset_models_root_path, dataset_model_name_path
+            model_instance, dataset_model_name_path, model_listing
         )
 
         # Attach model summary xattr to /Models/{model_instance._name}/{model_instance._version}
@@ -361,12 +583,16 @@ class ModelEngine:
                 {"id": 3, "desc": "Registering model"},
                 {"id": 4, "desc": "Waiting for model registration"},
                 {"id": 5, "desc": "Model export complete"},
-            ]
+            ],
+            # the progress is reported to the callback instead, if any
+            disable=progress_callback is not None,
         )
+        steps = progress.StepTracker(progress_callback)
 
         for step in pbar:
             try:
                 pbar.set_description("%s" % step["desc"])
+                steps.start(step["id"], step["desc"])
                 if step["id"] == 0:
                     # Create folders
                     self._engine.mkdir(model_instance.version_path)
@@ -388,6 +614,7 @@ class ModelEngine:
                             keep_original_files=keep_original_files,
                             update_upload_progress=update_upload_progress,
                             upload_configuration=upload_configuration,
+                            progress_callback=progress_callback,
                         )
                     # check local relative
                     elif os.path.exists(
@@ -399,6 +626,7 @@ class ModelEngine:
                             keep_original_files=keep_original_files,
                             update_upload_progress=update_upload_progress,
                             upload_configuration=upload_configuration,
+                            progress_callback=progress_callback,
                         )
                     # check project relative
                     elif self._dataset_api.path_exists(
@@ -431,12 +659,51 @@ class ModelEngine:
             except BaseException as be:
                 self._dataset_api.rm(model_instance.version_path)
                 raise be
+        steps.complete()
 
         print("Model created, explore it at " + model_instance.get_url())
 
         return model_instance
 
-    def download(self, model_instance):
+    def save_async(
+        self,
+        model_instance,
+        model_path,
+        await_registration=480,
+        keep_original_files=False,
+        upload_configuration=None,
+        progress_callback=None,
+    ):
+        """Save a model in a background thread, returning a future of the saved model."""
+        future = Future()
+
+        def save():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                future.set_result(
+                    self.save(
+                        model_instance,
+                        model_path,
+                        await_registration=await_registration,
+                        keep_original_files=keep_original_files,
+                        upload_configuration=upload_configuration,
+                        progress_callback=progress_callback,
+                    )
+                )
+            except BaseException as e:
+                future.set_exception(e)
+
+        # not a daemon thread, the interpreter waits for the model to be saved on exit
+        threading.Thread(target=save, name="save-" + model_instance.name).start()
+        return future
+
+    def download(
+        self,
+        model_instance,
+        mode=constants.MODEL_FILES.MODE_AUTO,
+        progress_callback=None,
+    ):
         model_name_path = os.path.join(
             tempfile.gettempdir(), str(uuid.uuid4()), model_instance._name
         )
@@ -444,6 +711,8 @@ class ModelEngine:
         os.makedirs(model_version_path)
 
         def update_download_progress(n_dirs, n_files, done=False):
+            if progress_callback is not None:
+                return  # the progress is reported to the callback instead
             print(
                 "Downloading model artifact (%s dirs, %s files)... %s"
                 % (n_dirs, n_files, "DONE" if done else ""),
@@ -456,11 +725,33 @@ class ModelEngine:
                 projects_index = from_hdfs_model_path.find("/Projects", 0)
                 from_hdfs_model_path = from_hdfs_model_path[projects_index:]
 
-            self._download_model_from_hopsfs(
+            # in auto mode, the listing tells whether the files are many and small
+            entries, n_files, total_size = None, 0, 0
+            if mode == constants.MODEL_FILES.MODE_AUTO:
+                entries = self._list_hopsfs_model_recursive(from_hdfs_model_path)
+                for _, path_attr in entries:
+                    if not path_attr.get("dir", False):
+                        n_files += 1
+                        total_size += path_attr.get("size", 0)
+
+            downloaded = self._use_archive(
+                mode, n_files, total_size
+            ) and self._download_model_archive(
                 from_hdfs_model_path=from_hdfs_model_path,
                 to_local_path=model_version_path,
                 update_download_progress=update_download_progress,
+                progress_callback=progress_callback,
             )
+            if not downloaded:
+                # download the files one by one, also if the archive was not created
+                if entries is None:
+                    entries = self._list_hopsfs_model_recursive(from_hdfs_model_path)
+                self._download_model_from_hopsfs(
+                    entries=entries,
+                    to_local_path=model_version_path,
+                    update_download_progress=update_download_progress,
+                    progress_callback=progress_callback,
+                )
         except BaseException as be:
             raise be
 
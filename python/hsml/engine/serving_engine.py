@@ -14,14 +14,14 @@
 #   limitations under the License.
 #
 
+from __future__ import annotations
+
 import os
-import time
 import uuid
-from typing import Dict, List, Union
+from typing import TYPE_CHECKING, Dict, List, Union
 
-from hsml import util
+from hsml import metrics, polling, progress, util
 from hsml.client.exceptions import ModelServingException, RestAPIError
-from hsml.client.istio.utils.infer_type import InferInput
 from hsml.constants import (
     DEPLOYMENT,
     PREDICTOR,
@@ -34,6 +34,11 @@ from hsml.core import dataset_api, serving_api
 from tqdm.auto import tqdm
 
 
+if TYPE_CHECKING:
+    from hsml.client.istio.utils.infer_type import InferInput
+    from hsml.utils.schema.input_validator import InputValidator
+
+
 class ServingEngine:
     START_STEPS = [
         PREDICTOR_STATE.CONDITION_TYPE_STOPPED,
@@ -46,6 +51,7 @@ class ServingEngine:
         PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED,
         PREDICTOR_STATE.CONDITION_TYPE_STOPPED,
     ]
+    STATUS_BACKOFF = polling.Backoff(initial_interval=0.5, max_interval=5)
 
     def __init__(self):
         self._serving_api = serving_api.ServingApi()
@@ -55,9 +61,11 @@ class ServingEngine:
         self, deployment_instance, status: str, await_status: int, update_progress=None
     ):
         if await_status > 0:
-            sleep_seconds = 5
-            for _ in range(int(await_status / sleep_seconds)):
-                time.sleep(sleep_seconds)
+            num_checks = 0
+
+            def get_state_if_reached():
+                nonlocal num_checks
+                num_checks += 1
                 state = deployment_instance.get_state()
                 num_instances = self._get_available_instances(state)
                 if update_progress is not None:
@@ -67,6 +75,8 @@ class ServingEngine:
                 elif (
                     status == PREDICTOR_STATE.STATUS_RUNNING
                     and state.status == PREDICTOR_STATE.STATUS_FAILED
+                    # right after the start request, the status can still be the one of a previous run
+                    and num_checks > 1
                 ):
                     error_msg = state.condition.reason
                     if (
@@ -86,13 +96,21 @@ class ServingEngine:
                             + "')`"
                         )
                     raise ModelServingException(error_msg)
+
+            state = polling.poll(
+                get_state_if_reached, await_status, backoff=self.STATUS_BACKOFF
+            )
+            if state is not None:
+                return state
             raise ModelServingException(
                 "Deployment has not reached the desired status within the expected awaiting time. Check the current status by using `.get_state()`, "
                 + "explore the server logs using `.get_logs()` or set a higher value for await_"
                 + status.lower()
             )
 
-    def start(self, deployment_instance, await_status: int) -> bool:
+    def start(
+        self, deployment_instance, await_status: int, progress_callback=None
+    ) -> bool:
         (done, state) = self._check_status(
             deployment_instance, PREDICTOR_STATE.STATUS_RUNNING
         )
@@ -102,17 +120,23 @@ class ServingEngine:
             num_steps = (len(self.START_STEPS) - 1) + min_instances
             if deployment_instance._predictor._state.condition is None:
                 num_steps = min_instances  # backward compatibility
-            pbar = tqdm(total=num_steps)
+            # the progress is reported to the callback instead, if any
+            pbar = tqdm(total=num_steps, disable=progress_callback is not None)
             pbar.set_description("Creating deployment")
+            steps = progress.StepTracker(progress_callback)
+            current_step = 0
 
             # set progress function
             def update_progress(state, num_instances):
-                (progress, desc) = self._get_starting_progress(
-                    pbar.n, state, num_instances
+                nonlocal current_step
+                (step_progress, desc) = self._get_starting_progress(
+                    current_step, state, num_instances
                 )
-                pbar.update(progress)
+                current_step += step_progress
+                pbar.update(step_progress)
                 if desc is not None:
                     pbar.set_description(desc)
+                    steps.start(self._get_progress_step(state), desc)
 
             try:
                 update_progress(state, num_instances=0)
@@ -138,11 +162,14 @@ class ServingEngine:
             except RestAPIError as re:
                 self.stop(deployment_instance, await_status=0)
                 raise re
+            steps.complete()
 
         if state.status == PREDICTOR_STATE.STATUS_RUNNING:
             print("Start making predictions by using `.predict()`")
 
-    def stop(self, deployment_instance, await_status: int) -> bool:
+    def stop(
+        self, deployment_instance, await_status: int, progress_callback=None
+    ) -> bool:
         (done, state) = self._check_status(
             deployment_instance, PREDICTOR_STATE.STATUS_STOPPED
         )
@@ -156,17 +183,23 @@ class ServingEngine:
             if deployment_instance._predictor._state.condition is None:
                 # backward compatibility
                 num_steps = self._get_min_starting_instances(deployment_instance)
-            pbar = tqdm(total=num_steps)
+            # the progress is reported to the callback instead, if any
+            pbar = tqdm(total=num_steps, disable=progress_callback is not None)
             pbar.set_description("Preparing to stop deployment")
+            steps = progress.StepTracker(progress_callback)
+            current_step = 0
 
             # set progress function
             def update_progress(state, num_instances):
-                (progress, desc) = self._get_stopping_progress(
-                    pbar.total, pbar.n, state, num_instances
+                nonlocal current_step
+                (step_progress, desc) = self._get_stopping_progress(
+                    num_steps, current_step, state, num_instances
                 )
-                pbar.update(progress)
+                current_step += step_progress
+                pbar.update(step_progress)
                 if desc is not None:
                     pbar.set_description(desc)
+                    steps.start(self._get_progress_step(state), desc)
 
             update_progress(state, num_instances)
             self._serving_api.post(
@@ -179,6 +212,7 @@ class ServingEngine:
                 await_status,
                 update_progress,
             )
+            steps.complete()
 
         # free grpc channel
         deployment_instance._grpc_channel = None
@@ -282,6 +316,10 @@ class ServingEngine:
 
         return (progress, desc)
 
+    def _get_progress_step(self, state):
+        # steps are identified by the condition type, or the status for backward compatibility
+        return state.condition.type if state.condition is not None else state.status
+
     def _get_min_starting_instances(self, deployment_instance):
         min_start_instances = 1  # predictor
         if deployment_instance.transformer is not None:
@@ -491,22 +529,33 @@ class ServingEngine:
         deployment_instance,
         data: Union[Dict, List[InferInput]],
         inputs: Union[Dict, List[Dict]],
+        input_validator: InputValidator = None,
     ):
+        if input_validator is not None and data is None and inputs is not None:
+            # check the inputs against the model schema before sending any request,
+            # and convert them to the raw payload
+            data = self._build_validated_payload(
+                deployment_instance.api_protocol, inputs, input_validator
+            )
+            inputs = None
+
         # validate user-provided payload
         self._validate_inference_payload(deployment_instance.api_protocol, data, inputs)
 
-        # build inference payload based on API protocol
-        payload = self._build_inference_payload(
-            deployment_instance.api_protocol, data, inputs
-        )
-
         # if not KServe, send request through Hopsworks
         serving_tool = deployment_instance.predictor.serving_tool
         through_hopsworks = serving_tool != PREDICTOR.SERVING_TOOL_KSERVE
         try:
-            return self._serving_api.send_inference_request(
-                deployment_instance, payload, through_hopsworks
-            )
+            with metrics.time_inference(deployment_instance.name):
+                # build inference payload based on API protocol
+                with metrics.phase(metrics.SERIALIZATION):
+                    payload = self._build_inference_payload(
+                        deployment_instance.api_protocol, data, inputs
+                    )
+
+                return self._serving_api.send_inference_request(
+                    deployment_instance, payload, through_hopsworks
+                )
         except RestAPIError as re:
             if (
                 re.response.status_code == RestAPIError.STATUS_CODE_NOT_FOUND
@@ -522,6 +571,36 @@ class ServingEngine:
             )
             raise re
 
+    def get_input_validator(self, deployment_instance):
+        """Compile the validator of inference inputs from the model schema of the deployed model."""
+        from hsml.utils.schema.input_validator import InputValidator
+
+        model_schema = deployment_instance.get_model().model_schema
+        if model_schema is None or "input_schema" not in model_schema:
+            raise ModelServingException(
+                "Model `{}` version `{}` has no input schema, inference inputs cannot be validated. "
+                "Save the model with a `model_schema` to enable the validation.".format(
+                    deployment_instance.model_name, deployment_instance.model_version
+                )
+            )
+        return InputValidator(model_schema)
+
+    def _build_validated_payload(
+        self,
+        api_protocol,
+        inputs,
+        input_validator: InputValidator,
+    ):
+        """Validate the inputs with the model schema and build the inference payload.
+        For the REST protocol, arrays and DataFrames are converted to lists of instances. For the gRPC protocol,
+        one InferInput object typed as in the model schema is built per tensor or column.
+        """
+        if api_protocol == IE.API_PROTOCOL_REST:
+            return self._parse_inference_inputs(
+                api_protocol, input_validator.to_instances(inputs)
+            )
+        return input_validator.to_infer_inputs(inputs)
+
     def _validate_inference_payload(
         self,
         api_protocol,
@@ -547,6 +626,8 @@ class ServingEngine:
         in the inference request and should have the corresponding type and format depending on the API protocol.
         For the REST protocol, data should be a dictionary. For GRPC protocol, one or more InferInput objects is expected.
         """
+        from hsml.client.istio.utils.infer_type import InferInput
+
         if api_protocol == IE.API_PROTOCOL_REST:  # REST protocol
             if isinstance(data, Dict):
                 if "instances" not in data and "inputs" not in data:
@@ -608,6 +689,8 @@ class ServingEngine:
         """Validates the inference payload when provided through the `inputs` parameter. The inputs parameter contains only the payload values,
         which will be parsed when building the request payload. It can be either a dictionary or a list.
         """
+        from hsml.client.istio.utils.infer_type import InferInput
+
         if isinstance(inputs, List):
             if len(inputs) == 0:
                 raise ModelServingException("Inference inputs cannot be an empty list.")
@@ -666,6 +749,8 @@ class ServingEngine:
                         data = {"instances": [inputs]}
                         break
         else:  # gRPC protocol
+            from hsml.client.istio.utils.infer_type import InferInput
+
             if isinstance(inputs, Dict):  # Dict
                 data = InferInput(
                     name=inputs["name"],
@@ -16,7 +16,6 @@
 import random
 from typing import List, Optional
 
-import humps
 from hsml import util
 
 
@@ -36,7 +35,7 @@ class InferenceEndpointPort:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls.from_json(json_decamelized)
 
     @classmethod
@@ -102,7 +101,7 @@ class InferenceEndpoint:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         if isinstance(json_decamelized, list):
             if len(json_decamelized) == 0:
                 return []
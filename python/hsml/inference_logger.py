@@ -16,7 +16,6 @@
 import json
 from typing import Optional, Union
 
-import humps
 from hsml import util
 from hsml.constants import DEFAULT, INFERENCE_LOGGER
 from hsml.kafka_topic import KafkaTopic
@@ -69,7 +68,7 @@ class InferenceLogger:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls.from_json(json_decamelized)
 
     @classmethod
@@ -89,7 +88,7 @@ class InferenceLogger:
         return kwargs
 
     def update_from_response_json(self, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         self.__init__(**self.extract_fields_from_json(json_decamelized))
         return self
 
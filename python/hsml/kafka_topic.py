@@ -16,7 +16,6 @@
 import json
 from typing import Optional
 
-import humps
 from hsml import util
 from hsml.constants import KAFKA_TOPIC
 
@@ -70,7 +69,7 @@ class KafkaTopic:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls.from_json(json_decamelized)
 
     @classmethod
@@ -90,7 +89,7 @@ class KafkaTopic:
         return kwargs
 
     def update_from_response_json(self, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         self.__init__(**self.extract_fields_from_json(json_decamelized))
         return self
 
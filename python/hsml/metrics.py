@@ -0,0 +1,469 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import threading
+import time
+import weakref
+from contextlib import nullcontext
+
+
+# phases of an inference request
+TOTAL = "total"
+QUEUEING = "queueing"
+SERIALIZATION = "serialization"
+NETWORK = "network"
+DESERIALIZATION = "deserialization"
+PHASES = [TOTAL, QUEUEING, SERIALIZATION, NETWORK, DESERIALIZATION]
+
+# upper bounds in seconds of the buckets of the exported Prometheus histograms
+PROMETHEUS_BUCKETS = [
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+]
+
+# name, type and help of the exported Prometheus metric families, in export order
+REQUESTS_FAMILY = "hsml_inference_requests_total"
+ERRORS_FAMILY = "hsml_inference_errors_total"
+LATENCY_FAMILY = "hsml_inference_latency_seconds"
+PROMETHEUS_FAMILIES = [
+    (REQUESTS_FAMILY, "counter", "Inference requests sent to the deployment."),
+    (ERRORS_FAMILY, "counter", "Inference requests that failed."),
+    (
+        LATENCY_FAMILY,
+        "histogram",
+        "Client-side latency of the inference requests per phase.",
+    ),
+]
+
+
+class LatencyHistogram:
+    """Histogram of latencies with a bounded relative error, in the style of HdrHistogram.
+
+    Latencies are recorded in microseconds. Each power of two is split in
+    `2 ** (sub_bucket_bits - 1)` linear buckets, so that percentiles are accurate to
+    about 1.5% with the default 7 bits, whatever the magnitude of the latencies.
+
+    # Arguments
+        sub_bucket_bits: Number of bits of the linear buckets per power of two.
+    """
+
+    DEFAULT_SUB_BUCKET_BITS = 7
+
+    def __init__(self, sub_bucket_bits=DEFAULT_SUB_BUCKET_BITS):
+        self._sub_bucket_bits = sub_bucket_bits
+        self._half_count = 1 << (sub_bucket_bits - 1)
+        self._counts = {}  # {bucket index: count}
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+
+    def _get_index(self, value):
+        shift = value.bit_length() - self._sub_bucket_bits
+        if shift <= 0:
+            return value
+        return shift * self._half_count + (value >> shift)
+
+    def _get_highest_value(self, index):
+        """Highest value, in microseconds, counted in a bucket."""
+        if index < 2 * self._half_count:
+            return index
+        shift = index // self._half_count - 1
+        sub_bucket = index % self._half_count + self._half_count
+        return ((sub_bucket + 1) << shift) - 1
+
+    def record(self, seconds):
+        """Record a latency in seconds."""
+        index = self._get_index(max(int(seconds * 1e6), 0))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self._count += 1
+        self._sum += seconds
+        if seconds > self._max:
+            self._max = seconds
+
+    def merge(self, other):
+        """Add the latencies recorded by another histogram."""
+        # copying a dict is atomic, the other histogram can be recorded concurrently
+        for index, count in dict(other._counts).items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self._count += other._count
+        self._sum += other._sum
+        self._max = max(self._max, other._max)
+
+    def get_percentile(self, percentile):
+        """Get the latency in seconds below which a percentage of the latencies fall."""
+        if self._count == 0:
+            return None
+        threshold = self._count * percentile / 100
+        cumulative = 0
+        for index in sorted(self._counts):
+            cumulative += self._counts[index]
+            if cumulative >= threshold:
+                return min(self._get_highest_value(index) / 1e6, self._max)
+        return self._max
+
+    def get_cumulative_counts(self, upper_bounds):
+        """Get the number of latencies lower or equal to each upper bound in seconds."""
+        counts = [0] * len(upper_bounds)
+        for index, count in self._counts.items():
+            value = self._get_highest_value(index) / 1e6
+            for i, upper_bound in enumerate(upper_bounds):
+                if value <= upper_bound:
+                    counts[i] += count
+        return counts
+
+    def to_dict(self):
+        return {
+            "count": self._count,
+            "mean": self._sum / self._count if self._count > 0 else None,
+            "p50": self.get_percentile(50),
+            "p90": self.get_percentile(90),
+            "p99": self.get_percentile(99),
+            "max": self._max if self._count > 0 else None,
+        }
+
+    @property
+    def count(self):
+        """Number of recorded latencies."""
+        return self._count
+
+    @property
+    def sum(self):
+        """Sum of the recorded latencies in seconds."""
+        return self._sum
+
+    def __repr__(self):
+        return "LatencyHistogram({})".format(self.to_dict())
+
+
+class _Shard:
+    """Metrics recorded by a single thread."""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.histograms = {phase: LatencyHistogram() for phase in PHASES}
+
+    def merge(self, other):
+        """Add the metrics recorded by another shard."""
+        self.requests += other.requests
+        self.errors += other.errors
+        for phase, histogram in other.histograms.items():
+            self.histograms[phase].merge(histogram)
+
+
+class DeploymentMetrics:
+    """Client-side metrics of the inference requests sent to a deployment.
+
+    Each thread records into its own shard, so that concurrent predictions do not
+    contend on a lock. Shards are merged when the metrics are read, and the shards of
+    finished threads are folded into a base shard, so that the number of shards is
+    bounded by the number of live threads.
+
+    # Arguments
+        name: Name of the deployment.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._local = threading.local()
+        self._base_shard = _Shard()  # metrics of the finished threads
+        self._shards = []  # [(weak reference to the thread, shard)]
+        self._lock = threading.Lock()  # guards the shards
+
+    def _get_shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            thread = weakref.ref(threading.current_thread())
+            with self._lock:
+                self._fold_finished_shards()
+                self._shards.append((thread, shard))
+        return shard
+
+    def _fold_finished_shards(self):
+        """Merge the shards of finished threads into the base shard, with the lock held."""
+        live_shards = []
+        for thread, shard in self._shards:
+            t = thread()
+            if t is not None and t.is_alive():
+                live_shards.append((thread, shard))
+            else:
+                # the thread cannot record anymore
+                self._base_shard.merge(shard)
+        self._shards = live_shards
+
+    def record(self, phases, error=False):
+        """Record an inference request.
+
+        :param phases: seconds spent in each phase of the request
+        :type phases: dict
+        :param error: whether the request failed
+        :type error: bool
+        """
+        shard = self._get_shard()
+        shard.requests += 1
+        if error:
+            shard.errors += 1
+        for phase, seconds in phases.items():
+            shard.histograms[phase].record(seconds)
+
+    def _merge(self):
+        merged = _Shard()
+        with self._lock:
+            self._fold_finished_shards()
+            merged.merge(self._base_shard)
+            shards = [shard for _, shard in self._shards]
+        for shard in shards:
+            merged.merge(shard)
+        return merged.requests, merged.errors, merged.histograms
+
+    def to_dict(self):
+        requests, errors, histograms = self._merge()
+        return {
+            "requests": requests,
+            "errors": errors,
+            "latency": {
+                phase: histogram.to_dict() for phase, histogram in histograms.items()
+            },
+        }
+
+    def to_prometheus(self):
+        """Get the samples of each metric family in the Prometheus text exposition format.
+
+        :return: sample lines per metric family name, without HELP and TYPE lines
+        :rtype: dict
+        """
+        requests, errors, histograms = self._merge()
+        name = _escape_label_value(self._name)
+        latency_lines = []
+        for phase, histogram in histograms.items():
+            labels = 'deployment="{}",phase="{}"'.format(name, phase)
+            counts = histogram.get_cumulative_counts(PROMETHEUS_BUCKETS)
+            for upper_bound, count in zip(PROMETHEUS_BUCKETS, counts):
+                latency_lines.append(
+                    '{}_bucket{{{},le="{}"}} {}'.format(
+                        LATENCY_FAMILY, labels, upper_bound, count
+                    )
+                )
+            latency_lines.append(
+                '{}_bucket{{{},le="+Inf"}} {}'.format(
+                    LATENCY_FAMILY, labels, histogram.count
+                )
+            )
+            latency_lines.append(
+                "{}_sum{{{}}} {}".format(LATENCY_FAMILY, labels, histogram.sum)
+            )
+            latency_lines.append(
+                "{}_count{{{}}} {}".format(LATENCY_FAMILY, labels, histogram.count)
+            )
+        return {
+            REQUESTS_FAMILY: [
+                '{}{{deployment="{}"}} {}'.format(REQUESTS_FAMILY, name, requests)
+            ],
+            ERRORS_FAMILY: [
+                '{}{{deployment="{}"}} {}'.format(ERRORS_FAMILY, name, errors)
+            ],
+            LATENCY_FAMILY: latency_lines,
+        }
+
+    @property
+    def name(self):
+        """Name of the deployment."""
+        return self._name
+
+    def __repr__(self):
+        return "DeploymentMetrics({!r}, {})".format(self._name, self.to_dict())
+
+
+def _escape_label_value(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class InferenceTimer:
+    """Measure the phases of an inference request sent by the current thread.
+
+    The timer is active while used as a context manager. The phases are measured
+    where they happen with `phase()` and `add_phase_time()`, and recorded in the
+    metrics of the deployment on exit.
+
+    # Arguments
+        deployment_metrics: Metrics of the deployment the request is sent to.
+    """
+
+    def __init__(self, deployment_metrics):
+        self._deployment_metrics = deployment_metrics
+        self._phases = {}
+        self._start = None
+        self._previous = None
+
+    def add(self, phase, seconds):
+        self._phases[phase] = self._phases.get(phase, 0) + seconds
+
+    def __enter__(self):
+        self._previous = getattr(_active, "timer", None)
+        _active.timer = self
+        self._start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._phases[TOTAL] = time.monotonic() - self._start
+        _active.timer = self._previous
+        # waiting for a pooled connection happens while sending the request
+        if NETWORK in self._phases and QUEUEING in self._phases:
+            self._phases[NETWORK] = max(
+                self._phases[NETWORK] - self._phases[QUEUEING], 0
+            )
+        self._deployment_metrics.record(self._phases, error=exc_type is not None)
+
+    @property
+    def phases(self):
+        """Seconds spent in each phase."""
+        return self._phases
+
+
+class _Phase:
+    def __init__(self, timer, phase):
+        self._timer = timer
+        self._phase = phase
+
+    def __enter__(self):
+        self._start = time.monotonic()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._timer.add(self._phase, time.monotonic() - self._start)
+
+
+# timer of the inference request being sent by each thread
+_active = threading.local()
+_NO_PHASE = nullcontext()
+
+_lock = threading.Lock()
+_deployment_metrics = {}  # {deployment name: DeploymentMetrics}
+
+
+def get_deployment_metrics(name):
+    """Get the metrics of a deployment, creating them if needed."""
+    deployment_metrics = _deployment_metrics.get(name)
+    if deployment_metrics is None:
+        with _lock:
+            deployment_metrics = _deployment_metrics.setdefault(
+                name, DeploymentMetrics(name)
+            )
+    return deployment_metrics
+
+
+def time_inference(name):
+    """Start timing an inference request sent to a deployment.
+
+    :param name: name of the deployment
+    :type name: str
+    :return: context manager measuring the request
+    :rtype: InferenceTimer
+    """
+    return InferenceTimer(get_deployment_metrics(name))
+
+
+def phase(name):
+    """Measure a phase of the inference request of the current thread, if any.
+
+    :param name: name of the phase, e.g. `SERIALIZATION`
+    :type name: str
+    :return: context manager measuring the phase
+    """
+    timer = getattr(_active, "timer", None)
+    if timer is None:
+        return _NO_PHASE
+    return _Phase(timer, name)
+
+
+def add_phase_time(name, seconds):
+    """Add time to a phase of the inference request of the current thread, if any."""
+    timer = getattr(_active, "timer", None)
+    if timer is not None:
+        timer.add(name, seconds)
+
+
+def get_stats():
+    """Get the client-side metrics of the inference requests sent to each deployment.
+
+    !!! example
+        ```python
+        from hsml import metrics
+        deployment.predict(inputs=[[1, 2, 3]])
+        metrics.get_stats()
+        # {'mydeployment': {'requests': 1, 'errors': 0, 'latency': {'total': {'count': 1, 'mean': 0.05,
+        #   'p50': 0.05, 'p90': 0.05, 'p99': 0.05, 'max': 0.05}, 'network': {...}, ...}}}
+        ```
+
+    # Returns
+        `dict`. Number of requests and errors, and latency percentiles of each phase, per deployment.
+    """
+    with _lock:
+        deployment_metrics = list(_deployment_metrics.values())
+    return {m.name: m.to_dict() for m in deployment_metrics}
+
+
+def to_prometheus():
+    """Export the client-side inference metrics in the Prometheus text exposition format.
+
+    !!! example
+        ```python
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        from hsml import metrics
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = metrics.to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.end_headers()
+                self.wfile.write(body)
+
+        HTTPServer(("", 9090), MetricsHandler).serve_forever()
+        ```
+
+    # Returns
+        `str`. Request and error counters, and latency histograms per deployment and phase.
+    """
+    with _lock:
+        deployment_metrics = list(_deployment_metrics.values())
+    samples = [m.to_prometheus() for m in deployment_metrics]
+    lines = []
+    # the samples of a metric family form a single group, after its HELP and TYPE
+    for family, family_type, family_help in PROMETHEUS_FAMILIES:
+        lines.append("# HELP {} {}".format(family, family_help))
+        lines.append("# TYPE {} {}".format(family, family_type))
+        for deployment_samples in samples:
+            lines.extend(deployment_samples[family])
+    return "\n".join(lines) + "\n"
+
+
+def reset():
+    """Remove the metrics of all the deployments."""
+    with _lock:
+        _deployment_metrics.clear()
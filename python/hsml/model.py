@@ -18,17 +18,17 @@ import json
 import logging
 import os
 import warnings
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, Optional, Union
 
-import humps
 from hsml import client, util
-from hsml.constants import ARTIFACT_VERSION
+from hsml.constants import ARTIFACT_VERSION, MODEL_FILES
 from hsml.constants import INFERENCE_ENDPOINTS as IE
 from hsml.core import explicit_provenance
 from hsml.engine import model_engine
 from hsml.inference_batcher import InferenceBatcher
 from hsml.inference_logger import InferenceLogger
 from hsml.predictor import Predictor
+from hsml.progress import ProgressEvent
 from hsml.resources import PredictorResources
 from hsml.transformer import Transformer
 
@@ -116,6 +116,7 @@ class Model:
         await_registration=480,
         keep_original_files=False,
         upload_configuration: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
     ):
         """Persist this model including model files and metadata to the model registry.
 
@@ -129,6 +130,13 @@ class Model:
                 * key `chunk_size`: size of each chunk in megabytes. Default 10.
                 * key `simultaneous_uploads`: number of chunks to upload in parallel. Default 3.
                 * key `max_chunk_retries`: number of times to retry the upload of a chunk in case of failure. Default 1.
+                * key `mode`: how to upload the files of a model directory, `"files"` uploads them one by one, `"archive"` uploads them
+                  in a single zip archive that is extracted in Hopsworks, which is faster for many small files. Default `"auto"`, which uses an archive
+                  for directories with at least 100 files of 1 MB or less on average.
+            progress_callback: Function called with the progress events of the export instead of showing progress bars: a `StepEvent`
+                and a `StepCompletedEvent` when a step starts and completes, a `TransferEvent` after each uploaded chunk of a model file
+                and a `RetryEvent` when the upload of a chunk is retried. See `hsml.progress.TqdmProgress` and `hsml.progress.MetricsProgress`.
+                Defaults to `None`.
 
         # Returns
             `Model`: The model metadata object.
@@ -139,15 +147,71 @@ class Model:
             await_registration=await_registration,
             keep_original_files=keep_original_files,
             upload_configuration=upload_configuration,
+            progress_callback=progress_callback,
         )
 
-    def download(self):
+    def save_async(
+        self,
+        model_path,
+        await_registration=480,
+        keep_original_files=False,
+        upload_configuration: Optional[Dict[str, Any]] = None,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+    ):
+        """Persist this model to the model registry in a background thread, without blocking.
+
+        The arguments are the same as in `save()`. The progress callback is called from the background thread.
+
+        !!! example
+            ```python
+            future = model.save_async("/tmp/model", progress_callback=print)
+            # continue training or evaluating
+            ...
+            model = future.result()
+            ```
+
+        # Arguments
+            model_path: Local or remote (Hopsworks file system) path to the folder where the model files are located, or path to a specific model file.
+            await_registration: Awaiting time for the model to be registered in Hopsworks.
+            keep_original_files: If the model files are located in hopsfs, whether to move or copy those files into the Models dataset. Default is False (i.e., model files will be moved)
+            upload_configuration: Configuration of the upload of the model files, see `save()`.
+            progress_callback: Function called with the progress events of the export instead of showing progress bars: a `StepEvent`
+                and a `StepCompletedEvent` when a step starts and completes, a `TransferEvent` after each uploaded chunk of a model file
+                and a `RetryEvent` when the upload of a chunk is retried. See `hsml.progress.TqdmProgress` and `hsml.progress.MetricsProgress`.
+                Defaults to `None`.
+
+        # Returns
+            `concurrent.futures.Future`: Future of the model metadata object, raising the exception of the export if it failed.
+        """
+        return self._model_engine.save_async(
+            model_instance=self,
+            model_path=model_path,
+            await_registration=await_registration,
+            keep_original_files=keep_original_files,
+            upload_configuration=upload_configuration,
+            progress_callback=progress_callback,
+        )
+
+    def download(
+        self,
+        mode: str = MODEL_FILES.MODE_AUTO,
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+    ):
         """Download the model files.
 
+        # Arguments
+            mode: How to download the model files, `"files"` downloads them one by one, `"archive"` zips them in Hopsworks and downloads
+                a single archive, which is faster for many small files. Default `"auto"`, which uses an archive for models with at least
+                100 files of 1 MB or less on average.
+            progress_callback: Function called with a `TransferEvent` after each downloaded chunk of a model file,
+                instead of printing the progress. Defaults to `None`.
+
         # Returns
             `str`: Absolute path to local folder containing the model files.
         """
-        return self._model_engine.download(model_instance=self)
+        return self._model_engine.download(
+            model_instance=self, mode=mode, progress_callback=progress_callback
+        )
 
     def delete(self):
         """Delete the model
@@ -341,7 +405,7 @@ class Model:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         if "count" in json_decamelized:
             if json_decamelized["count"] == 0:
                 return []
@@ -350,7 +414,7 @@ class Model:
             return util.set_model_class(json_decamelized)
 
     def update_from_response_json(self, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         if "type" in json_decamelized:  # backwards compatibility
             _ = json_decamelized.pop("type")
         self.__init__(**json_decamelized)
@@ -14,10 +14,12 @@
 #   limitations under the License.
 #
 
+import datetime
 import warnings
+from typing import Any, Dict, Optional, Tuple, Union
 
-import humps
 from hsml import util
+from hsml.client.exceptions import ModelRegistryException
 from hsml.core import model_api
 from hsml.python import signature as python_signature  # noqa: F401
 from hsml.sklearn import signature as sklearn_signature  # noqa: F401
@@ -27,6 +29,10 @@ from hsml.torch import signature as torch_signature  # noqa: F401
 
 class ModelRegistry:
     DEFAULT_VERSION = 1
+    # number of versions fetched per request when filtering models client-side
+    DEFAULT_PAGE_SIZE = 100
+    # order of the versions when fetched page by page, so that pages do not overlap
+    PAGE_SORT_BY = "version:asc"
 
     def __init__(
         self,
@@ -56,7 +62,7 @@ class ModelRegistry:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls(**json_decamelized)
 
     def get_model(self, name: str, version: int = None):
@@ -91,24 +97,153 @@ class ModelRegistry:
             shared_registry_project_name=self.shared_registry_project_name,
         )
 
-    def get_models(self, name: str):
+    def get_models(
+        self,
+        name: str,
+        summary: bool = False,
+        metrics: Optional[Dict[str, Tuple[Optional[float], Optional[float]]]] = None,
+        tags: Optional[Dict[str, Any]] = None,
+        created_after: Optional[Union[datetime.datetime, int]] = None,
+        created_before: Optional[Union[datetime.datetime, int]] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+        page_size: Optional[int] = None,
+        expand: bool = True,
+    ):
         """Get all model entities from the model registry for a specified name.
         Getting all models from the Model Registry for a given name returns a list of model entities, one for each version registered under
         the specified model name.
 
+        !!! example "Browse many versions with summaries"
+            ```python
+            # only the summary fields are parsed
+            models = mr.get_models("mnist", summary=True)
+            latest = max(models, key=lambda m: m.version)
+
+            # the full model object is built on first access of any other attribute
+            latest.training_metrics
+            ```
+
+        !!! example "Iterate over filtered versions page by page"
+            ```python
+            import datetime
+
+            models = mr.get_models(
+                "mnist",
+                metrics={"accuracy": (0.9, None)},
+                created_after=datetime.datetime(2024, 1, 1),
+                page_size=50,
+                expand=False,
+            )
+            for model in models:  # pages of 50 versions are fetched as needed
+                print(model.version, model.training_metrics["accuracy"])
+            ```
+
         # Arguments
             name: Name of the model to get.
+            summary: Whether to return compact `ModelSummary` objects instead of full model objects, defaults to `False`.
+                Summaries expose the `id`, `name`, `version`, `description`, `created`, `framework`, `training_metrics` and
+                `model_registry_id` of the model and build the full model object the first time any other attribute is accessed.
+            metrics: Ranges of training metrics the models must be in, e.g. `{"accuracy": (0.9, None)}`. Bounds are
+                inclusive, `None` for no bound. Defaults to `None`.
+            tags: Tags the models must have, e.g. `{"team": "fraud"}`. Tags are fetched for each model matching the
+                other filters, which costs one request per model. Defaults to `None`.
+            created_after: Only get models created at or after this date, or timestamp in milliseconds. Defaults to `None`.
+            created_before: Only get models created at or before this date, or timestamp in milliseconds. Defaults to `None`.
+            offset: Number of versions to skip, before filtering. Defaults to `0`.
+            limit: Maximum number of models to get, defaults to `None` for all of them.
+            page_size: If set, return a lazy iterator fetching this number of versions per request, instead of a list.
+                Defaults to `None`.
+            expand: Whether to include the training datasets of the models, defaults to `True`. Set it to `False` to
+                transfer less data when the training datasets are not needed.
         # Returns
-            `List[Model]`: A list of model metadata objects.
+            `List[Model]`: A list of model metadata objects, or an iterator over them if `page_size` is set.
         # Raises
             `RestAPIError`: If unable to retrieve model versions from the model registry.
         """
 
-        return self._model_api.get_models(
+        models = self._iterate_models(
             name,
-            self.model_registry_id,
-            shared_registry_project_name=self.shared_registry_project_name,
+            summary,
+            self._get_model_filter(metrics, tags, created_after, created_before),
+            offset,
+            limit,
+            page_size,
+            expand,
         )
+        return models if page_size is not None else list(models)
+
+    def _iterate_models(
+        self, name, summary, model_filter, offset, limit, page_size, expand
+    ):
+        if page_size is None:
+            # fetch all the models at once, unless filtered client-side
+            page_size = self.DEFAULT_PAGE_SIZE if model_filter is not None else limit
+        num_models = 0
+        while limit is None or num_models < limit:
+            page_limit = page_size
+            if model_filter is None and limit is not None:
+                # the server filters the models, do not fetch more than needed
+                page_limit = min(page_size, limit - num_models)
+            page = self._model_api.get_models(
+                name,
+                self.model_registry_id,
+                shared_registry_project_name=self.shared_registry_project_name,
+                summary=summary,
+                offset=offset if offset > 0 else None,
+                limit=page_limit,
+                expand=expand,
+                sort_by=self.PAGE_SORT_BY
+                if page_limit is not None or offset > 0
+                else None,
+            )
+            for model in page:
+                if model_filter is not None and not model_filter(model):
+                    continue
+                yield model
+                num_models += 1
+                if limit is not None and num_models >= limit:
+                    return
+            if page_limit is None or len(page) < page_limit:
+                return
+            offset += len(page)
+
+    def _get_model_filter(self, metrics, tags, created_after, created_before):
+        """Get a function checking whether a model matches the filters, or None."""
+        if (
+            not metrics
+            and not tags
+            and created_after is None
+            and created_before is None
+        ):
+            return None
+        created_after = _to_timestamp(created_after)
+        created_before = _to_timestamp(created_before)
+
+        def model_filter(model):
+            if created_after is not None or created_before is not None:
+                created = _get_created_timestamp(model)
+                if created_after is not None and created < created_after:
+                    return False
+                if created_before is not None and created > created_before:
+                    return False
+            training_metrics = model.training_metrics or {}
+            for metric, (min_value, max_value) in (metrics or {}).items():
+                if metric not in training_metrics:
+                    return False
+                value = float(training_metrics[metric])
+                if min_value is not None and value < min_value:
+                    return False
+                if max_value is not None and value > max_value:
+                    return False
+            if tags:
+                model_tags = self._model_api.get_tags(model)
+                for tag_name, tag_value in tags.items():
+                    if tag_name not in model_tags or model_tags[tag_name] != tag_value:
+                        return False
+            return True
+
+        return model_filter
 
     def get_best_model(self, name: str, metric: str, direction: str):
         """Get the best performing model entity from the model registry.
@@ -194,3 +329,35 @@ class ModelRegistry:
             else self._project_name
         )
         return f"ModelRegistry(project: {project_name!r})"
+
+
+def _to_timestamp(date):
+    """Convert a date to a timestamp in milliseconds, as the created date of models."""
+    if isinstance(date, datetime.datetime):
+        return int(date.timestamp() * 1000)
+    if isinstance(date, datetime.date):
+        return _to_timestamp(datetime.datetime(date.year, date.month, date.day))
+    return date
+
+
+def _get_created_timestamp(model):
+    """Get the created date of a model as a timestamp in milliseconds."""
+    created = model.created
+    if isinstance(created, str) and created.isdigit():
+        created = int(created)
+    elif isinstance(created, str):
+        try:
+            # e.g. 2024-01-02T10:00:00.000Z
+            created = datetime.datetime.fromisoformat(created.replace("Z", "+00:00"))
+        except ValueError:
+            pass
+    if isinstance(created, (datetime.date, datetime.datetime)):
+        created = _to_timestamp(created)
+    if not isinstance(created, int) or isinstance(created, bool):
+        raise ModelRegistryException(
+            "Model {} version {} cannot be filtered by creation date, its created "
+            "date {!r} is not a timestamp or a date.".format(
+                model.name, model.version, model.created
+            )
+        )
+    return created
@@ -14,10 +14,14 @@
 #   limitations under the License.
 #
 
+from __future__ import annotations
+
 import json
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
 
-from hsml.schema import Schema
+if TYPE_CHECKING:
+    from hsml.schema import Schema
 
 
 class ModelSchema:
@@ -93,7 +93,9 @@ class ModelServing:
             name = os.environ["DEPLOYMENT_NAME"]
         return self._serving_api.get(name)
 
-    def get_deployments(self, model: Model = None, status: str = None):
+    def get_deployments(
+        self, model: Model = None, status: str = None, summary: bool = False
+    ):
         """Get all deployments from model serving.
         !!! example
             ```python
@@ -116,6 +118,9 @@ class ModelServing:
         # Arguments
             model: Filter by model served in the deployments
             status: Filter by status of the deployments
+            summary: Whether to return compact `DeploymentSummary` objects instead of full deployment objects, defaults to `False`.
+                Summaries expose the `id`, `name`, `description`, `model_name`, `model_version`, `model_server` and `serving_tool`
+                of the deployment and build the full deployment object the first time any other attribute is accessed.
         # Returns
             `List[Deployment]`: A list of deployments.
         # Raises
@@ -126,7 +131,7 @@ class ModelServing:
         if status is not None:
             self._validate_deployment_status(status)
 
-        return self._serving_api.get_all(model_name, status)
+        return self._serving_api.get_all(model_name, status, summary=summary)
 
     def _validate_deployment_status(self, status):
         statuses = list(util.get_members(PREDICTOR_STATE, prefix="STATUS"))
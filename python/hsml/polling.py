@@ -0,0 +1,87 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import time
+
+
+class Backoff:
+    """Capped exponential backoff between polls.
+
+    # Arguments
+        initial_interval: Seconds to wait after the first poll.
+        max_interval: Maximum seconds to wait between polls.
+        multiplier: Factor by which the interval grows after each poll.
+    """
+
+    DEFAULT_INITIAL_INTERVAL = 0.5
+    DEFAULT_MAX_INTERVAL = 10
+    DEFAULT_MULTIPLIER = 2
+
+    def __init__(
+        self,
+        initial_interval=DEFAULT_INITIAL_INTERVAL,
+        max_interval=DEFAULT_MAX_INTERVAL,
+        multiplier=DEFAULT_MULTIPLIER,
+    ):
+        self._initial_interval = initial_interval
+        self._max_interval = max_interval
+        self._multiplier = multiplier
+
+    def intervals(self):
+        """Generate the seconds to wait between consecutive polls."""
+        interval = self._initial_interval
+        while True:
+            yield min(interval, self._max_interval)
+            interval *= self._multiplier
+
+    @property
+    def initial_interval(self):
+        """Seconds to wait after the first poll."""
+        return self._initial_interval
+
+    @property
+    def max_interval(self):
+        """Maximum seconds to wait between polls."""
+        return self._max_interval
+
+    @property
+    def multiplier(self):
+        """Factor by which the interval grows after each poll."""
+        return self._multiplier
+
+
+def poll(check, timeout, backoff=None):
+    """Call `check` until it returns a truthy value or the timeout expires.
+
+    The first call is immediate, the next ones are spaced by the backoff intervals,
+    shortened to not wait past the timeout.
+
+    :param check: function called without arguments
+    :type check: Callable
+    :param timeout: seconds after which polling stops
+    :type timeout: float
+    :param backoff: intervals between calls, defaults to `Backoff()`
+    :type backoff: Backoff, optional
+    :return: the last result of `check`, falsy if the timeout expired
+    """
+    intervals = (backoff or Backoff()).intervals()
+    deadline = time.monotonic() + timeout
+    while True:
+        result = check()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result
+        time.sleep(min(next(intervals), remaining))
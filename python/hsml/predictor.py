@@ -16,7 +16,6 @@
 import json
 from typing import Optional, Union
 
-import humps
 from hsml import client, deployment, util
 from hsml.constants import (
     ARTIFACT_VERSION,
@@ -217,7 +216,7 @@ class Predictor(DeployableComponent):
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         if isinstance(json_decamelized, list):
             if len(json_decamelized) == 0:
                 return []
@@ -276,7 +275,7 @@ class Predictor(DeployableComponent):
         return kwargs
 
     def update_from_response_json(self, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         self.__init__(**self.extract_fields_from_json(json_decamelized))
         self._set_state(PredictorState.from_response_json(json_decamelized))
         return self
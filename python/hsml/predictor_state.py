@@ -15,7 +15,6 @@
 
 from typing import Optional
 
-import humps
 from hsml import util
 from hsml.predictor_state_condition import PredictorStateCondition
 
@@ -52,7 +51,7 @@ class PredictorState:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return PredictorState(*cls.extract_fields_from_json(json_decamelized))
 
     @classmethod
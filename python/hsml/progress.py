@@ -0,0 +1,385 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+import threading
+import time
+
+from tqdm.auto import tqdm
+
+
+class ProgressEvent:
+    """Base class of the progress events passed to progress callbacks.
+
+    # Arguments
+        timestamp: Time of the event in seconds since the epoch.
+    """
+
+    def __init__(self, timestamp=None):
+        self._timestamp = time.time() if timestamp is None else timestamp
+
+    def to_dict(self):
+        return {"type": type(self).__name__, "timestamp": self._timestamp}
+
+    @property
+    def timestamp(self):
+        """Time of the event in seconds since the epoch."""
+        return self._timestamp
+
+    def __repr__(self):
+        return "{}({})".format(
+            type(self).__name__,
+            ", ".join(
+                "{}={!r}".format(k, v) for k, v in self.to_dict().items() if k != "type"
+            ),
+        )
+
+
+class StepEvent(ProgressEvent):
+    """Event emitted when an operation starts one of its steps.
+
+    # Arguments
+        step: Identifier of the step, e.g. its index or the deployment condition.
+        description: Description of the step.
+    """
+
+    def __init__(self, step, description, timestamp=None):
+        super().__init__(timestamp)
+        self._step = step
+        self._description = description
+
+    def to_dict(self):
+        return {
+            **super().to_dict(),
+            "step": self._step,
+            "description": self._description,
+        }
+
+    @property
+    def step(self):
+        """Identifier of the step."""
+        return self._step
+
+    @property
+    def description(self):
+        """Description of the step."""
+        return self._description
+
+
+class StepCompletedEvent(ProgressEvent):
+    """Event emitted when an operation completes one of its steps.
+
+    # Arguments
+        step: Identifier of the step, e.g. its index or the deployment condition.
+        description: Description of the step.
+        duration: Seconds spent in the step.
+    """
+
+    def __init__(self, step, description, duration, timestamp=None):
+        super().__init__(timestamp)
+        self._step = step
+        self._description = description
+        self._duration = duration
+
+    def to_dict(self):
+        return {
+            **super().to_dict(),
+            "step": self._step,
+            "description": self._description,
+            "duration": self._duration,
+        }
+
+    @property
+    def step(self):
+        """Identifier of the step."""
+        return self._step
+
+    @property
+    def description(self):
+        """Description of the step."""
+        return self._description
+
+    @property
+    def duration(self):
+        """Seconds spent in the step."""
+        return self._duration
+
+
+class TransferEvent(ProgressEvent):
+    """Event emitted when a part of a file is transferred.
+
+    # Arguments
+        path: Path of the file being transferred.
+        n_bytes: Number of bytes transferred since the previous event for this file.
+        total_bytes: Size of the file in bytes, `None` if unknown.
+        direction: `"upload"` or `"download"`.
+        latency: Seconds spent transferring the bytes, `None` if unknown.
+    """
+
+    UPLOAD = "upload"
+    DOWNLOAD = "download"
+
+    def __init__(
+        self,
+        path,
+        n_bytes,
+        total_bytes,
+        direction=UPLOAD,
+        latency=None,
+        timestamp=None,
+    ):
+        super().__init__(timestamp)
+        self._path = path
+        self._n_bytes = n_bytes
+        self._total_bytes = total_bytes
+        self._direction = direction
+        self._latency = latency
+
+    def to_dict(self):
+        return {
+            **super().to_dict(),
+            "path": self._path,
+            "n_bytes": self._n_bytes,
+            "total_bytes": self._total_bytes,
+            "direction": self._direction,
+            "latency": self._latency,
+        }
+
+    @property
+    def path(self):
+        """Path of the file being transferred."""
+        return self._path
+
+    @property
+    def n_bytes(self):
+        """Number of bytes transferred since the previous event for this file."""
+        return self._n_bytes
+
+    @property
+    def total_bytes(self):
+        """Size of the file in bytes, `None` if unknown."""
+        return self._total_bytes
+
+    @property
+    def direction(self):
+        """`"upload"` or `"download"`."""
+        return self._direction
+
+    @property
+    def latency(self):
+        """Seconds spent transferring the bytes, `None` if unknown."""
+        return self._latency
+
+
+class RetryEvent(ProgressEvent):
+    """Event emitted when a failed request is retried.
+
+    # Arguments
+        path: Path of the file being transferred.
+        attempt: Number of the retry, starting at 1.
+        error: Exception raised by the failed request.
+    """
+
+    def __init__(self, path, attempt, error, timestamp=None):
+        super().__init__(timestamp)
+        self._path = path
+        self._attempt = attempt
+        self._error = error
+
+    def to_dict(self):
+        return {
+            **super().to_dict(),
+            "path": self._path,
+            "attempt": self._attempt,
+            "error": str(self._error),
+        }
+
+    @property
+    def path(self):
+        """Path of the file being transferred."""
+        return self._path
+
+    @property
+    def attempt(self):
+        """Number of the retry, starting at 1."""
+        return self._attempt
+
+    @property
+    def error(self):
+        """Exception raised by the failed request."""
+        return self._error
+
+
+class StepTracker:
+    """Emit the step events of an operation, completing the current step when the next one starts.
+
+    # Arguments
+        progress_callback: Function called with the events, `None` to not emit them.
+    """
+
+    def __init__(self, progress_callback):
+        self._progress_callback = progress_callback
+        self._current = None  # (step, description, start time)
+
+    def start(self, step, description):
+        """Complete the current step, if any, and start a new one.
+
+        Nothing is emitted if the step is already the current one.
+        """
+        if self._current is not None and self._current[:2] == (step, description):
+            return
+        self.complete()
+        if self._progress_callback is not None:
+            self._current = (step, description, time.monotonic())
+            self._progress_callback(StepEvent(step, description))
+
+    def complete(self):
+        """Complete the current step, if any."""
+        if self._current is not None:
+            step, description, start = self._current
+            self._current = None
+            self._progress_callback(
+                StepCompletedEvent(step, description, time.monotonic() - start)
+            )
+
+
+class TqdmProgress:
+    """Progress callback displaying the events with tqdm progress bars.
+
+    A bar shows the current step of the operation, and a bar per file shows the
+    bytes transferred.
+
+    !!! example
+        ```python
+        from hsml.progress import TqdmProgress
+        model.save("/tmp/model", progress_callback=TqdmProgress())
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._step_bar = None
+        self._file_bars = {}
+
+    def __call__(self, event):
+        with self._lock:
+            if isinstance(event, StepEvent):
+                if self._step_bar is None:
+                    self._step_bar = tqdm()
+                self._step_bar.set_description(event.description)
+            elif isinstance(event, StepCompletedEvent):
+                if self._step_bar is not None:
+                    self._step_bar.update(1)
+            elif isinstance(event, TransferEvent):
+                bar = self._file_bars.get(event.path)
+                if bar is None:
+                    bar = self._file_bars[event.path] = tqdm(
+                        total=event.total_bytes,
+                        desc=os.path.basename(event.path),
+                        unit="B",
+                        unit_scale=True,
+                    )
+                bar.update(event.n_bytes)
+                if event.total_bytes is not None and bar.n >= event.total_bytes:
+                    bar.close()
+                    del self._file_bars[event.path]
+
+    def close(self):
+        """Close the progress bars."""
+        with self._lock:
+            for bar in self._file_bars.values():
+                bar.close()
+            self._file_bars = {}
+            if self._step_bar is not None:
+                self._step_bar.close()
+                self._step_bar = None
+
+
+class MetricsProgress:
+    """Progress callback aggregating the events into metrics, to export to a monitoring system.
+
+    !!! example
+        ```python
+        from hsml.progress import MetricsProgress
+        metrics = MetricsProgress()
+        model.save("/tmp/model", progress_callback=metrics)
+        metrics.to_dict()
+        # {'upload': {'bytes': 10485760, 'chunks': 1, 'seconds': 0.52, 'throughput': 20164923.1, 'max_latency': 0.52},
+        #  'download': {...}, 'retries': 0, 'steps': {'Creating model folder': 0.04, ...}}
+        ```
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._transfers = {
+            TransferEvent.UPLOAD: self._new_transfer_metrics(),
+            TransferEvent.DOWNLOAD: self._new_transfer_metrics(),
+        }
+        self._retries = 0
+        self._steps = {}
+
+    def _new_transfer_metrics(self):
+        return {"bytes": 0, "chunks": 0, "start": None, "end": None, "max_latency": 0}
+
+    def __call__(self, event):
+        with self._lock:
+            if isinstance(event, StepCompletedEvent):
+                self._steps[event.description] = (
+                    self._steps.get(event.description, 0) + event.duration
+                )
+            elif isinstance(event, TransferEvent):
+                metrics = self._transfers[event.direction]
+                latency = event.latency or 0
+                metrics["bytes"] += event.n_bytes
+                metrics["chunks"] += 1
+                metrics["max_latency"] = max(metrics["max_latency"], latency)
+                # chunks can be transferred in parallel, the throughput is computed
+                # over the time elapsed between the first and the last one
+                start = event.timestamp - latency
+                if metrics["start"] is None or start < metrics["start"]:
+                    metrics["start"] = start
+                if metrics["end"] is None or event.timestamp > metrics["end"]:
+                    metrics["end"] = event.timestamp
+            elif isinstance(event, RetryEvent):
+                self._retries += 1
+
+    def to_dict(self):
+        with self._lock:
+            metrics = {
+                direction: {
+                    "bytes": m["bytes"],
+                    "chunks": m["chunks"],
+                    "seconds": self._get_seconds(m),
+                    "throughput": (
+                        m["bytes"] / self._get_seconds(m)
+                        if self._get_seconds(m) > 0
+                        else None
+                    ),
+                    "max_latency": m["max_latency"],
+                }
+                for direction, m in self._transfers.items()
+            }
+            metrics["retries"] = self._retries
+            metrics["steps"] = dict(self._steps)
+            return metrics
+
+    def _get_seconds(self, metrics):
+        if metrics["start"] is None:
+            return 0
+        return metrics["end"] - metrics["start"]
+
+    def __repr__(self):
+        return "MetricsProgress({})".format(self.to_dict())
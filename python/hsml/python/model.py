@@ -14,7 +14,7 @@
 #   limitations under the License.
 #
 
-import humps
+from hsml import util
 from hsml.constants import MODEL
 from hsml.model import Model
 
@@ -71,7 +71,7 @@ class Model(Model):
         )
 
     def update_from_response_json(self, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         json_decamelized.pop("framework")
         if "type" in json_decamelized:  # backwards compatibility
             _ = json_decamelized.pop("type")
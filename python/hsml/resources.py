@@ -17,7 +17,6 @@ import json
 from abc import ABC, abstractmethod
 from typing import Optional, Union
 
-import humps
 from hsml import client, util
 from hsml.constants import RESOURCES
 
@@ -50,7 +49,7 @@ class Resources:
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls.from_json(json_decamelized)
 
     @classmethod
@@ -260,7 +259,7 @@ class ComponentResources(ABC):
 
     @classmethod
     def from_response_json(cls, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         return cls.from_json(json_decamelized)
 
     @classmethod
@@ -356,8 +355,8 @@ class PredictorResources(ComponentResources):
 
     def to_dict(self):
         return {
-            humps.camelize(self.NUM_INSTANCES_KEY): self._num_instances,
-            humps.camelize(self.RESOURCES_CONFIG_KEY): {
+            util.camelize(self.NUM_INSTANCES_KEY): self._num_instances,
+            util.camelize(self.RESOURCES_CONFIG_KEY): {
                 "requests": (
                     self._requests.to_dict() if self._requests is not None else None
                 ),
@@ -384,8 +383,8 @@ class TransformerResources(ComponentResources):
 
     def to_dict(self):
         return {
-            humps.camelize(self.NUM_INSTANCES_KEY): self._num_instances,
-            humps.camelize(self.RESOURCES_CONFIG_KEY): {
+            util.camelize(self.NUM_INSTANCES_KEY): self._num_instances,
+            util.camelize(self.RESOURCES_CONFIG_KEY): {
                 "requests": (
                     self._requests.to_dict() if self._requests is not None else None
                 ),
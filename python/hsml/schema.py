@@ -15,6 +15,7 @@
 #
 
 import json
+import os
 from typing import Optional, TypeVar, Union
 
 import numpy
@@ -27,7 +28,9 @@ class Schema:
     """Create a schema for a model input or output.
 
     # Arguments
-        object: The object to construct the schema from.
+        object: The object to construct the schema from. pyarrow tables, Arrow datasets
+            and paths to Parquet files or directories result in a columnar schema,
+            built from their metadata without reading the data.
 
     # Returns
         `Schema`. The schema object.
@@ -41,8 +44,12 @@ class Schema:
                 pandas.Series,
                 TypeVar("pyspark.sql.dataframe.DataFrame"),  # noqa: F821
                 TypeVar("hsfs.training_dataset.TrainingDataset"),  # noqa: F821
+                TypeVar("pyarrow.Table"),  # noqa: F821
+                TypeVar("pyarrow.dataset.Dataset"),  # noqa: F821
                 numpy.ndarray,
                 list,
+                str,
+                os.PathLike,
             ]
         ] = None,
         **kwargs,
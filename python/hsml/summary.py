@@ -0,0 +1,188 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from hsml import util
+
+
+class Summary:
+    """Compact stand-in for a metadata object returned by a listing.
+
+    A summary keeps the json of the entry and the few fields needed to browse a
+    listing. The full metadata object is built from the json the first time any other
+    attribute is read, and every attribute access and assignment is forwarded to it
+    from then on.
+    """
+
+    __slots__ = ("_json", "_instance", "_pending")
+
+    # fields read without building the full object
+    FIELDS = ()
+    # {field: json field} of the fields named differently in the json
+    JSON_FIELDS = {}
+
+    def __init__(self, json, **attributes):
+        object.__setattr__(self, "_json", json)
+        object.__setattr__(self, "_instance", None)
+        # attributes to set on the full object once built
+        object.__setattr__(self, "_pending", attributes)
+        for field in self.FIELDS:
+            json_field = self.JSON_FIELDS.get(field, field)
+            camelized = util.camelize(json_field)
+            value = json[camelized] if camelized in json else json.get(json_field)
+            if isinstance(value, (dict, list)):
+                # nested keys are decamelized in the full object too
+                value = util.decamelize(value)
+            object.__setattr__(self, field, value)
+
+    @classmethod
+    def from_response_json(cls, json_dict, **attributes):
+        if isinstance(json_dict, list):
+            items = json_dict
+        else:
+            items = json_dict["items"] if json_dict.get("count", 0) > 0 else []
+        return [cls(item, **attributes) for item in items]
+
+    def _build(self, json):
+        """Build the full metadata object from the json of the entry."""
+        raise NotImplementedError
+
+    def materialize(self):
+        """Build the full metadata object, if not built yet.
+
+        # Returns
+            The full metadata object.
+        """
+        instance = self._instance
+        if instance is None:
+            instance = self._build(self._json)
+            for name, value in self._pending.items():
+                setattr(instance, name, value)
+            object.__setattr__(self, "_instance", instance)
+            # drop the json and the summary fields, which are read from the full
+            # object from now on since it can be modified
+            object.__setattr__(self, "_json", None)
+            object.__setattr__(self, "_pending", None)
+            for field in self.FIELDS:
+                object.__delattr__(self, field)
+        return instance
+
+    @property
+    def is_materialized(self):
+        """Whether the full metadata object is built."""
+        return self._instance is not None
+
+    def __reduce__(self):
+        # copied and pickled from the json of the entry, or from the full object
+        if self._instance is not None:
+            return _restore_materialized, (type(self), self._instance)
+        return _restore, (type(self), self._json, dict(self._pending))
+
+    def __getattr__(self, name):
+        # only called for attributes that are not set on the summary
+        if name.startswith("__") or name in Summary.__slots__:
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __setattr__(self, name, value):
+        if name in Summary.__slots__:
+            object.__setattr__(self, name, value)
+        elif _get_slot(self, "_instance") is None and name not in self.FIELDS:
+            # e.g. set by the REST API implementations on every entry of a listing
+            self._pending[name] = value
+        else:
+            setattr(self.materialize(), name, value)
+
+    def __repr__(self):
+        if self._instance is not None:
+            return repr(self._instance)
+        fields = ", ".join(
+            "{}={!r}".format(field, getattr(self, field)) for field in self.FIELDS
+        )
+        return "{}({})".format(type(self).__name__, fields)
+
+
+def _get_slot(summary, name):
+    """Get a slot of a summary, None if not set yet, e.g. while unpickling."""
+    try:
+        return object.__getattribute__(summary, name)
+    except AttributeError:
+        return None
+
+
+def _restore(cls, json, pending):
+    return cls(json, **pending)
+
+
+def _restore_materialized(cls, instance):
+    summary = object.__new__(cls)
+    object.__setattr__(summary, "_json", None)
+    object.__setattr__(summary, "_instance", instance)
+    object.__setattr__(summary, "_pending", None)
+    return summary
+
+
+class ModelSummary(Summary):
+    """Summary of a model version, as returned by `ModelRegistry.get_models(summary=True)`.
+
+    The `id`, `name`, `version`, `description`, `created`, `framework`,
+    `training_metrics` and `model_registry_id` of the model are read without building
+    the full `Model` object.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "version",
+        "description",
+        "created",
+        "framework",
+        "training_metrics",
+        "model_registry_id",
+    )
+
+    FIELDS = __slots__
+    JSON_FIELDS = {"training_metrics": "metrics"}
+
+    def _build(self, json):
+        from hsml.model import Model
+
+        return Model.from_response_json(json)
+
+
+class DeploymentSummary(Summary):
+    """Summary of a deployment, as returned by `ModelServing.get_deployments(summary=True)`.
+
+    The `id`, `name`, `description`, `model_name`, `model_version`, `model_server` and
+    `serving_tool` of the deployment are read without building the full `Deployment`
+    object, with its predictor, resources, inference logger and transformer.
+    """
+
+    __slots__ = (
+        "id",
+        "name",
+        "description",
+        "model_name",
+        "model_version",
+        "model_server",
+        "serving_tool",
+    )
+
+    FIELDS = __slots__
+
+    def _build(self, json):
+        from hsml.deployment import Deployment
+
+        return Deployment.from_response_json(json)
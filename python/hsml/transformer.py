@@ -15,7 +15,6 @@
 
 from typing import Optional, Union
 
-import humps
 from hsml import client, util
 from hsml.constants import RESOURCES
 from hsml.deployable_component import DeployableComponent
@@ -82,7 +81,7 @@ class Transformer(DeployableComponent):
         return sf, rc
 
     def update_from_response_json(self, json_dict):
-        json_decamelized = humps.decamelize(json_dict)
+        json_decamelized = util.decamelize(json_dict)
         self.__init__(*self.extract_fields_from_json(json_decamelized))
         return self
 
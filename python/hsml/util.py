@@ -17,27 +17,18 @@
 from __future__ import annotations
 
 import datetime
+import functools
 import inspect
 import os
 import shutil
+import warnings
+from collections.abc import Mapping
 from json import JSONEncoder, dumps
 from urllib.parse import urljoin, urlparse
 
 import humps
-import numpy as np
-import pandas as pd
 from hsml import client
 from hsml.constants import DEFAULT, MODEL, PREDICTOR
-from hsml.model import Model as BaseModel
-from hsml.predictor import Predictor as BasePredictor
-from hsml.python.model import Model as PyModel
-from hsml.python.predictor import Predictor as PyPredictor
-from hsml.sklearn.model import Model as SkLearnModel
-from hsml.sklearn.predictor import Predictor as SkLearnPredictor
-from hsml.tensorflow.model import Model as TFModel
-from hsml.tensorflow.predictor import Predictor as TFPredictor
-from hsml.torch.model import Model as TorchModel
-from hsml.torch.predictor import Predictor as TorchPredictor
 from six import string_types
 
 
@@ -62,35 +53,37 @@ class NumpyEncoder(JSONEncoder):
     Note that some numpy types doesn't have native python equivalence,
     hence json.dumps will raise TypeError.
     In this case, you'll need to convert your numpy types into its closest python equivalence.
+
+    Arrays, DataFrames and Series are converted as a whole per column, instead of
+    element by element. DataFrames are encoded as a list of rows.
     """
 
     def convert(self, obj):
-        import base64
-
         import numpy as np
         import pandas as pd
 
-        def encode_binary(x):
-            return base64.encodebytes(x).decode("ascii")
-
         if isinstance(obj, np.ndarray):
-            if obj.dtype == np.object:
-                return [self.convert(x)[0] for x in obj.tolist()]
-            elif obj.dtype == np.bytes_:
-                return np.vectorize(encode_binary)(obj), True
-            else:
-                return obj.tolist(), True
-
+            return _array_to_list(obj, self._convert_value), True
+        if isinstance(obj, pd.DataFrame):
+            return _dataframe_to_list(obj, self._convert_value), True
+        if isinstance(obj, pd.Series):
+            return _series_to_list(obj, self._convert_value), True
+
+        if obj is pd.NA or obj is pd.NaT:
+            return None, True
         if isinstance(obj, (pd.Timestamp, datetime.date)):
             return obj.isoformat(), True
         if isinstance(obj, bytes) or isinstance(obj, bytearray):
-            return encode_binary(obj), True
+            return _encode_binary(obj), True
         if isinstance(obj, np.generic):
             return obj.item(), True
         if isinstance(obj, np.datetime64):
             return np.datetime_as_string(obj), True
         return obj, False
 
+    def _convert_value(self, obj):
+        return self.convert(obj)[0]
+
     def default(self, obj):  # pylint: disable=E0202
         res, converted = self.convert(obj)
         if converted:
@@ -99,12 +92,67 @@ class NumpyEncoder(JSONEncoder):
             return super().default(obj)
 
 
+def _encode_binary(value):
+    import base64
+
+    return base64.encodebytes(value).decode("ascii")
+
+
+def _array_to_list(array, convert_value):
+    """Convert a numpy array to nested lists of json serializable values."""
+    import numpy as np
+
+    if array.dtype.kind in "biufU":
+        # booleans, numbers and strings are converted in C
+        return array.tolist()
+    if array.dtype.kind == "M":
+        return np.datetime_as_string(array).tolist()
+    if array.ndim == 0:
+        return convert_value(array.item())
+    if array.dtype.kind == "S":
+        return np.frompyfunc(_encode_binary, 1, 1)(array).tolist()
+    # objects, and other types falling back to python objects
+    return np.frompyfunc(convert_value, 1, 1)(array.astype(object)).tolist()
+
+
+def _series_to_list(series, convert_value):
+    """Convert a pandas series to a list of json serializable values."""
+    import numpy as np
+    import pandas as pd
+
+    if isinstance(series.dtype, pd.DatetimeTZDtype) or series.dtype.kind == "M":
+        # same format as pandas timestamps
+        return [None if pd.isna(t) else t.isoformat() for t in series]
+    if not isinstance(series.dtype, np.dtype):
+        # extension types, e.g. nullable integers, keep their values and missing ones
+        return _array_to_list(
+            series.to_numpy(dtype=object, na_value=None), convert_value
+        )
+    return _array_to_list(series.to_numpy(), convert_value)
+
+
+def _dataframe_to_list(dataframe, convert_value):
+    """Convert a pandas dataframe to a list of rows of json serializable values."""
+    columns = [
+        _series_to_list(dataframe.iloc[:, i], convert_value)
+        for i in range(dataframe.shape[1])
+    ]
+    return [list(row) for row in zip(*columns)]
+
+
 # Model registry
 
 # - schema and types
 
 
 def set_model_class(model):
+    # framework modules are imported on first use to keep `import hsml` fast
+    from hsml.model import Model as BaseModel
+    from hsml.python.model import Model as PyModel
+    from hsml.sklearn.model import Model as SkLearnModel
+    from hsml.tensorflow.model import Model as TFModel
+    from hsml.torch.model import Model as TorchModel
+
     if "href" in model:
         _ = model.pop("href")
     if "type" in model:  # backwards compatibility
@@ -131,6 +179,13 @@ def set_model_class(model):
 
 
 def input_example_to_json(input_example):
+    """Convert an input example to json serializable values.
+
+    Only the first `INPUT_EXAMPLE_MAX_ROWS` rows of arrays and series are kept, and the
+    first row of dataframes.
+    """
+    import numpy as np
+
     if isinstance(input_example, np.ndarray):
         if input_example.size > 0:
             return _handle_tensor_input(input_example)
@@ -144,21 +199,44 @@ def input_example_to_json(input_example):
         return _handle_dataframe_input(input_example)
 
 
+# maximum number of rows of arrays and series kept in input examples
+INPUT_EXAMPLE_MAX_ROWS = 100
+
+
+def _get_first_rows(input_ex):
+    if input_ex.ndim > 0 and len(input_ex) > INPUT_EXAMPLE_MAX_ROWS:
+        warnings.warn(
+            "Only the first {} rows of the input example are kept, out of {}.".format(
+                INPUT_EXAMPLE_MAX_ROWS, len(input_ex)
+            ),
+            # attributed to the caller of input_example_to_json
+            stacklevel=4,
+        )
+        return input_ex[:INPUT_EXAMPLE_MAX_ROWS]
+    return input_ex
+
+
 def _handle_tensor_input(input_tensor):
-    return input_tensor.tolist()
+    return _array_to_list(_get_first_rows(input_tensor), NumpyEncoder()._convert_value)
 
 
 def _handle_dataframe_input(input_ex):
+    import pandas as pd
+
     if isinstance(input_ex, pd.DataFrame):
         if not input_ex.empty:
-            return input_ex.iloc[0].tolist()
+            return _dataframe_to_list(input_ex.iloc[:1], NumpyEncoder()._convert_value)[
+                0
+            ]
         else:
             raise ValueError(
                 "input_example of type {} can not be empty".format(type(input_ex))
             )
     elif isinstance(input_ex, pd.Series):
         if not input_ex.empty:
-            return input_ex.tolist()
+            return _series_to_list(
+                _get_first_rows(input_ex), NumpyEncoder()._convert_value
+            )
         else:
             raise ValueError(
                 "input_example of type {} can not be empty".format(type(input_ex))
@@ -236,6 +314,17 @@ def validate_metrics(metrics):
 
 
 def get_predictor_for_model(model, **kwargs):
+    from hsml.model import Model as BaseModel
+    from hsml.predictor import Predictor as BasePredictor
+    from hsml.python.model import Model as PyModel
+    from hsml.python.predictor import Predictor as PyPredictor
+    from hsml.sklearn.model import Model as SkLearnModel
+    from hsml.sklearn.predictor import Predictor as SkLearnPredictor
+    from hsml.tensorflow.model import Model as TFModel
+    from hsml.tensorflow.predictor import Predictor as TFPredictor
+    from hsml.torch.model import Model as TorchModel
+    from hsml.torch.predictor import Predictor as TorchPredictor
+
     if not isinstance(model, BaseModel):
         raise ValueError(
             "model is of type {}, but an instance of {} class is expected".format(
@@ -279,7 +368,7 @@ def pretty_print(obj):
         for logs in obj:
             pretty_print(logs)
     else:
-        json_decamelized = humps.decamelize(obj.to_dict())
+        json_decamelized = decamelize(obj.to_dict())
         print(dumps(json_decamelized, indent=4, sort_keys=True))
 
 
@@ -294,6 +383,57 @@ def get_members(cls, prefix=None):
 
 # - json
 
+# maximum number of key conversions cached, response keys are mostly field names
+KEY_CACHE_SIZE = 4096
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def _decamelize_key(key):
+    return humps.decamelize(key)
+
+
+@functools.lru_cache(maxsize=KEY_CACHE_SIZE)
+def _camelize_key(key):
+    return humps.camelize(key)
+
+
+def _convert_keys(obj, convert_key, convert):
+    if isinstance(obj, list):
+        return [_convert_keys(v, convert_key, convert) for v in obj]
+    if isinstance(obj, Mapping):
+        return {
+            (convert_key(k) if type(k) is str else convert(k)): _convert_keys(
+                v, convert_key, convert
+            )
+            for k, v in obj.items()
+        }
+    return obj
+
+
+def decamelize(obj):
+    """Convert the keys of a json object to snake case, same as `humps.decamelize`.
+
+    The conversion of each key is cached, since the same field names appear in every
+    response. Dicts and lists are always copied, so the result can be modified.
+    """
+    if type(obj) is str:
+        return _decamelize_key(obj)
+    if isinstance(obj, (list, Mapping)):
+        return _convert_keys(obj, _decamelize_key, humps.decamelize)
+    return humps.decamelize(obj)
+
+
+def camelize(obj):
+    """Convert the keys of a json object to camel case, same as `humps.camelize`.
+
+    The conversion of each key is cached. Dicts and lists are always copied.
+    """
+    if type(obj) is str:
+        return _camelize_key(obj)
+    if isinstance(obj, (list, Mapping)):
+        return _convert_keys(obj, _camelize_key, humps.camelize)
+    return humps.camelize(obj)
+
 
 def extract_field_from_json(obj, fields, default=None, as_instance_of=None):
     if isinstance(fields, list):
@@ -341,7 +481,5 @@ def feature_view_to_json(obj):
         if isinstance(obj, feature_view.FeatureView):
             import json
 
-            import humps
-
-            return humps.camelize(json.loads(obj.json()))
+            return camelize(json.loads(obj.json()))
     return None
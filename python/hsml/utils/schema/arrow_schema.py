@@ -0,0 +1,82 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""Read the schema of pyarrow tables, Arrow datasets and Parquet files.
+
+Only the metadata is read: the footers of Parquet files hold their schema and number
+of rows, so building a model schema from them does not depend on the number of rows.
+pyarrow is imported on first use, it is not needed by the other schema sources.
+"""
+
+import importlib
+import os
+import sys
+
+
+def is_arrow_object(obj) -> bool:
+    """Check whether an object is a pyarrow table, record batch, schema or dataset."""
+    # objects of pyarrow cannot exist if it was not imported yet
+    pyarrow = sys.modules.get("pyarrow")
+    if pyarrow is None:
+        return False
+    if isinstance(obj, (pyarrow.Table, pyarrow.RecordBatch, pyarrow.Schema)):
+        return True
+    dataset = sys.modules.get("pyarrow.dataset")
+    return dataset is not None and isinstance(obj, dataset.Dataset)
+
+
+def is_path(obj) -> bool:
+    """Check whether an object is a path or URI to Parquet files."""
+    if not isinstance(obj, (str, os.PathLike)):
+        return False
+    path = os.fspath(obj)
+    return "://" in path or os.path.exists(path)
+
+
+def get_schema(obj):
+    """Get the `pyarrow.Schema` of an Arrow object, or of Parquet files without reading rows."""
+    if is_path(obj):
+        return _get_parquet_dataset(obj).schema
+    if isinstance(obj, _import("pyarrow").Schema):
+        return obj
+    return obj.schema
+
+
+def get_num_rows(obj):
+    """Get the number of rows of an Arrow object or Parquet files, or None if unknown."""
+    if is_path(obj):
+        # counted from the row group metadata in the footers
+        return _get_parquet_dataset(obj).count_rows()
+    if isinstance(obj, _import("pyarrow").Schema):
+        return None
+    if isinstance(obj, _import("pyarrow.dataset").Dataset):
+        return obj.count_rows()
+    return obj.num_rows
+
+
+def _get_parquet_dataset(path):
+    # a single Parquet file, a directory of Parquet files or a URI, e.g. s3://
+    return _import("pyarrow.dataset").dataset(os.fspath(path), format="parquet")
+
+
+def _import(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise ModuleNotFoundError(
+            "Reading the schema of Parquet files requires pyarrow, install it with "
+            "`pip install hsml[arrow]`."
+        ) from e
@@ -17,6 +17,7 @@
 import importlib
 
 import pandas
+from hsml.utils.schema import arrow_schema
 from hsml.utils.schema.column import Column
 
 
@@ -49,6 +50,10 @@ class ColumnarSchema:
             columnar_obj, hsfs.training_dataset.TrainingDataset
         ):
             self.columns = self._convert_td_to_schema(columnar_obj)
+        elif arrow_schema.is_arrow_object(columnar_obj) or arrow_schema.is_path(
+            columnar_obj
+        ):
+            self.columns = self._convert_arrow_to_schema(columnar_obj)
         else:
             raise TypeError(
                 "{} is not supported in a columnar schema.".format(type(columnar_obj))
@@ -88,6 +93,12 @@ class ColumnarSchema:
             columns.append(Column(feature.type, name=feature.name))
         return columns
 
+    def _convert_arrow_to_schema(self, arrow_obj):
+        columns = []
+        for field in arrow_schema.get_schema(arrow_obj):
+            columns.append(Column(field.type, name=field.name))
+        return columns
+
     def _build_column(self, columnar_obj):
         type = None
         name = None
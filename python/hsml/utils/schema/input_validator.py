@@ -0,0 +1,363 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import ast
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy
+import pandas
+from hsml import util
+from hsml.client.exceptions import ModelServingException
+from hsml.client.istio.utils.numpy_codec import from_np_dtype
+
+
+# types of Spark, Hive and Arrow schemas that are not numpy type names, or that
+# numpy would read as a different type
+_TYPE_ALIASES = {
+    "tinyint": "int8",
+    "smallint": "int16",
+    "int": "int32",
+    "integer": "int32",
+    "bigint": "int64",
+    "long": "int64",
+    "halffloat": "float16",
+    "float": "float32",
+    "boolean": "bool",
+    "string": "object",
+    "large_string": "object",
+    "str": "object",
+    "binary": "object",
+}
+
+# types of python objects inferred by pandas that can be cast to each kind of dtype
+_INFERRED_TYPES = {
+    "b": ("boolean", "empty"),
+    "i": ("integer", "empty"),
+    "u": ("integer", "empty"),
+    "f": ("floating", "integer", "mixed-integer-float", "decimal", "empty"),
+}
+
+
+class _InputSpec:
+    """Compiled name, type and shape of a tensor or column of the input schema."""
+
+    __slots__ = ("name", "dtype", "dims")
+
+    def __init__(self, name, type, shape=None):
+        self.name = name
+        self.dtype = _to_dtype(type)
+        # dimensions of a tensor after the batch dimension, None if not checked
+        self.dims = _to_dims(shape)
+
+    def get_label(self, index):
+        return repr(self.name) if self.name is not None else "#{}".format(index)
+
+
+class InputValidator:
+    """Validator of inference inputs, compiled once from the input schema of a model.
+
+    Inputs are checked as a whole per tensor or column, comparing their dtype and shape
+    with the model schema, so that malformed inputs are rejected before sending any
+    request. Valid inputs are converted to `InferInput` objects for the gRPC protocol,
+    typed as in the model schema, or to lists of instances for the REST protocol.
+
+    # Arguments
+        model_schema: `ModelSchema` of the model, or its dictionary as returned by
+            `Model.model_schema`.
+
+    # Raises
+        `ValueError`: If the model schema has no tensor or columnar input schema.
+    """
+
+    def __init__(self, model_schema: Union[Dict[str, Any], Any]):
+        if not isinstance(model_schema, dict):
+            model_schema = model_schema.to_dict()
+        input_schema = model_schema.get("input_schema") or {}
+
+        if "tensor_schema" in input_schema:
+            tensors = input_schema["tensor_schema"]
+            if isinstance(tensors, dict):
+                # schemas built from a single ndarray
+                tensors = [tensors]
+            self._columnar = False
+            self._specs = [
+                _InputSpec(t.get("name"), t.get("type"), t.get("shape"))
+                for t in tensors
+            ]
+        elif "columnar_schema" in input_schema:
+            self._columnar = True
+            self._specs = [
+                _InputSpec(c.get("name"), c.get("type"))
+                for c in input_schema["columnar_schema"]
+            ]
+        else:
+            raise ValueError("The model schema does not contain an input schema.")
+
+    def validate(self, inputs):
+        """Check inference inputs against the input schema of the model.
+
+        # Arguments
+            inputs: Model inputs as a numpy array, pandas DataFrame, list of instances
+                or, for tensor schemas with several tensors, a dictionary of arrays per
+                tensor name.
+
+        # Raises
+            `ModelServingException`: If the inputs do not match the input schema.
+        """
+        self._get_values(inputs)
+
+    def to_infer_inputs(self, inputs) -> List[Any]:
+        """Check inference inputs and convert them to `InferInput` objects for gRPC.
+
+        One `InferInput` is built per tensor of a tensor schema, or per column of a
+        columnar schema, with the datatype of the model schema. Tensors without a name in
+        the model schema are named after their position, e.g. `input-0`.
+
+        # Arguments
+            inputs: Model inputs, as in `validate()`.
+
+        # Returns
+            `List[InferInput]`. The inputs of the gRPC inference request.
+
+        # Raises
+            `ModelServingException`: If the inputs do not match the input schema.
+        """
+        from hsml.client.istio.utils.infer_type import InferInput
+
+        infer_inputs = []
+        for index, (spec, values) in enumerate(self._get_values(inputs)):
+            values = _cast(spec, values)
+            infer_inputs.append(
+                InferInput(
+                    name=spec.name
+                    if spec.name is not None
+                    else "input-{}".format(index),
+                    shape=list(values.shape),
+                    datatype=from_np_dtype(values.dtype),
+                    data=values,
+                )
+            )
+        return infer_inputs
+
+    def to_instances(self, inputs):
+        """Check inference inputs and convert arrays and DataFrames to lists for REST.
+
+        # Arguments
+            inputs: Model inputs, as in `validate()`.
+
+        # Returns
+            `list`. The instances, or the inputs unchanged if they are not an array or
+            DataFrame.
+
+        # Raises
+            `ModelServingException`: If the inputs do not match the input schema.
+        """
+        self._get_values(inputs)
+        if isinstance(inputs, pandas.DataFrame) and self._columnar:
+            names = [spec.name for spec in self._specs]
+            if all(name in inputs.columns for name in names):
+                # send the columns in the order of the model schema
+                inputs = inputs[names]
+        if isinstance(inputs, (numpy.ndarray, pandas.DataFrame)):
+            return util.NumpyEncoder().convert(inputs)[0]
+        return inputs
+
+    def _get_values(self, inputs) -> List[Tuple[_InputSpec, numpy.ndarray]]:
+        """Get the array of values of each tensor or column, raising on any mismatch."""
+        if self._columnar:
+            values, errors = self._get_column_values(inputs)
+        else:
+            values, errors = self._get_tensor_values(inputs)
+        for index, (spec, array) in enumerate(values):
+            errors.extend(_check(spec, array, self._columnar, index))
+        if errors:
+            raise ModelServingException(
+                "Inference inputs do not match the model schema:\n - "
+                + "\n - ".join(errors)
+            )
+        return values
+
+    def _get_column_values(self, inputs):
+        if isinstance(inputs, list) and len(inputs) > 0:
+            # per column dtypes are inferred by pandas
+            if not isinstance(inputs[0], (list, tuple, dict)):
+                inputs = [inputs]  # single instance
+            inputs = pandas.DataFrame(inputs)
+        if isinstance(inputs, numpy.ndarray):
+            if inputs.ndim == 1:
+                inputs = inputs.reshape(1, -1)  # single instance
+            if inputs.ndim != 2 or inputs.shape[1] != len(self._specs):
+                return [], [
+                    "expected an array of shape (n, {}), got {}".format(
+                        len(self._specs), inputs.shape
+                    )
+                ]
+            return [(spec, inputs[:, i]) for i, spec in enumerate(self._specs)], []
+        if not isinstance(inputs, pandas.DataFrame):
+            return [], [_get_type_error(inputs)]
+
+        if not any(isinstance(column, str) for column in inputs.columns):
+            # unnamed columns, matched by position
+            if inputs.shape[1] != len(self._specs):
+                return [], [
+                    "expected {} columns, got {}".format(
+                        len(self._specs), inputs.shape[1]
+                    )
+                ]
+            return [
+                (spec, inputs.iloc[:, i].to_numpy())
+                for i, spec in enumerate(self._specs)
+            ], []
+        names = [spec.name for spec in self._specs]
+        errors = []
+        missing = [name for name in names if name not in inputs.columns]
+        if missing:
+            errors.append("missing columns {}".format(missing))
+        unexpected = [column for column in inputs.columns if column not in names]
+        if unexpected:
+            errors.append("unexpected columns {}".format(unexpected))
+        if errors:
+            return [], errors
+        return [(spec, inputs[spec.name].to_numpy()) for spec in self._specs], []
+
+    def _get_tensor_values(self, inputs):
+        if isinstance(inputs, dict):
+            names = [spec.name for spec in self._specs]
+            missing = [name for name in names if name not in inputs]
+            unexpected = [name for name in inputs if name not in names]
+            errors = []
+            if missing:
+                errors.append("missing tensors {}".format(missing))
+            if unexpected:
+                errors.append("unexpected tensors {}".format(unexpected))
+            if errors:
+                return [], errors
+            try:
+                return [
+                    (spec, numpy.asarray(inputs[spec.name])) for spec in self._specs
+                ], []
+            except ValueError as e:
+                return [], ["tensors are not regular arrays: {}".format(e)]
+        if len(self._specs) > 1:
+            return [], [
+                "expected a dictionary of arrays for the {} tensors {}".format(
+                    len(self._specs), [spec.name for spec in self._specs]
+                )
+            ]
+        if isinstance(inputs, pandas.DataFrame):
+            inputs = inputs.to_numpy()
+        elif isinstance(inputs, list) and len(inputs) > 0:
+            try:
+                inputs = numpy.asarray(inputs)
+            except ValueError as e:
+                return [], ["inputs are not a regular array: {}".format(e)]
+        if not isinstance(inputs, numpy.ndarray):
+            return [], [_get_type_error(inputs)]
+        return [(self._specs[0], inputs)], []
+
+
+def _check(spec: _InputSpec, values: numpy.ndarray, columnar: bool, index: int):
+    """Check the dtype and shape of the values of a tensor or column."""
+    label = ("column " if columnar else "tensor ") + spec.get_label(index)
+    errors = []
+    if spec.dims is not None:
+        shape = values.shape[1:]
+        if len(shape) != len(spec.dims) or any(
+            dim is not None and dim != size for dim, size in zip(spec.dims, shape)
+        ):
+            errors.append(
+                "{}: expected shape {}, got {}".format(
+                    label,
+                    tuple(-1 if dim is None else dim for dim in (None,) + spec.dims),
+                    values.shape,
+                )
+            )
+    if not _is_castable(values, spec.dtype):
+        errors.append(
+            "{}: expected values of type {}, got {}".format(
+                label, spec.dtype, values.dtype
+            )
+        )
+    return errors
+
+
+def _is_castable(values: numpy.ndarray, dtype: Optional[numpy.dtype]) -> bool:
+    if dtype is None or dtype.kind == "O":
+        # any value can be sent as an object or string
+        return True
+    if values.dtype.kind == "O":
+        # python objects, whose type is inferred in a single pass, e.g. to not accept
+        # numbers as strings
+        inferred_types = _INFERRED_TYPES.get(dtype.kind)
+        if (
+            inferred_types is not None
+            and pandas.api.types.infer_dtype(values, skipna=True) not in inferred_types
+        ):
+            return False
+        try:
+            values.astype(dtype)
+        except (TypeError, ValueError, OverflowError):
+            # e.g. missing values of integers
+            return False
+        return True
+    return numpy.can_cast(values.dtype, dtype, casting="same_kind")
+
+
+def _cast(spec: _InputSpec, values: numpy.ndarray) -> numpy.ndarray:
+    """Cast the values to the type of the model schema, or to objects sent as bytes."""
+    dtype = spec.dtype if spec.dtype is not None else values.dtype
+    if from_np_dtype(dtype) is None or dtype.kind in "US":
+        # e.g. strings and dates
+        dtype = numpy.dtype(object)
+    return values.astype(dtype, copy=False)
+
+
+def _get_type_error(inputs):
+    return "inputs of type {} cannot be validated".format(type(inputs).__name__)
+
+
+def _to_dtype(type) -> Optional[numpy.dtype]:
+    """Get the numpy dtype of a type of the model schema, or None if unknown."""
+    if type is None:
+        return None
+    type = _TYPE_ALIASES.get(type.lower(), type)
+    try:
+        return numpy.dtype(type)
+    except TypeError:
+        pass
+    try:
+        # pandas extension types, e.g. Int64
+        return getattr(pandas.api.types.pandas_dtype(type), "numpy_dtype", None)
+    except TypeError:
+        return None
+
+
+def _to_dims(shape) -> Optional[Tuple[Optional[int], ...]]:
+    """Get the dimensions of a shape after the batch dimension, None for any size."""
+    if shape is None:
+        return None
+    if isinstance(shape, str):
+        try:
+            shape = ast.literal_eval(shape)
+        except (ValueError, SyntaxError):
+            return None
+    if isinstance(shape, int):
+        shape = (shape,)
+    if not isinstance(shape, (list, tuple)) or len(shape) == 0:
+        return None
+    return tuple(
+        dim if isinstance(dim, int) and dim >= 0 else None for dim in shape[1:]
+    )
@@ -15,6 +15,7 @@
 #
 
 import numpy
+from hsml.utils.schema import arrow_schema
 from hsml.utils.schema.tensor import Tensor
 
 
@@ -26,6 +27,10 @@ class TensorSchema:
             self.tensors = self._convert_list_to_schema(tensor_obj)
         elif isinstance(tensor_obj, numpy.ndarray):
             self.tensors = self._convert_tensor_to_schema(tensor_obj)
+        elif arrow_schema.is_arrow_object(tensor_obj) or arrow_schema.is_path(
+            tensor_obj
+        ):
+            self.tensors = self._convert_arrow_to_schema(tensor_obj)
         else:
             raise TypeError(
                 "{} is not supported in a tensor schema.".format(type(tensor_obj))
@@ -34,6 +39,24 @@ class TensorSchema:
     def _convert_tensor_to_schema(self, tensor_obj):
         return Tensor(tensor_obj.dtype, tensor_obj.shape)
 
+    def _convert_arrow_to_schema(self, arrow_obj):
+        # one tensor per column, with the number of rows as first dimension
+        num_rows = arrow_schema.get_num_rows(arrow_obj)
+        tensors = []
+        for field in arrow_schema.get_schema(arrow_obj):
+            type = field.type
+            shape = (num_rows if num_rows is not None else -1,)
+            # fixed size lists are the Arrow representation of tensors
+            while hasattr(type, "list_size"):
+                shape += (type.list_size,)
+                type = type.value_type
+            try:
+                type = numpy.dtype(type.to_pandas_dtype())
+            except NotImplementedError:
+                pass
+            tensors.append(Tensor(type, shape, name=field.name))
+        return tensors
+
     def _convert_list_to_schema(self, tensor_obj):
         if len(tensor_obj) == 1:
             return [self._build_tensor(tensor_obj[0])]
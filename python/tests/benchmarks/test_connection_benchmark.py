@@ -0,0 +1,59 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsml.connection import Connection
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _connect(backend):
+    conn = Connection(
+        host=backend.host,
+        port=backend.port,
+        project=backend.project,
+        api_key_value="api_key",
+    )
+    conn.close()
+    return conn
+
+
+class TestConnectionBenchmark:
+    def test_connect(self, benchmark, hopsworks_backend):
+        # Act
+        conn = benchmark.pedantic(_connect, args=(hopsworks_backend,), rounds=20)
+
+        # Assert
+        benchmark.extra_info["requests"] = len(hopsworks_backend.requests) // 20
+        assert conn.project == hopsworks_backend.project
+
+    def test_connect_with_latency(self, benchmark, hopsworks_backend):
+        # Arrange
+        hopsworks_backend.latency = 0.005
+
+        # Act
+        conn = benchmark.pedantic(_connect, args=(hopsworks_backend,), rounds=5)
+
+        # Assert
+        assert conn.project == hopsworks_backend.project
+
+    def test_get_model_registry(self, benchmark, hopsworks_connection):
+        # Act
+        mr = benchmark.pedantic(hopsworks_connection.get_model_registry, rounds=20)
+
+        # Assert
+        assert mr.project_name == hopsworks_connection.project
@@ -0,0 +1,65 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+import statistics
+import subprocess
+import sys
+
+import pytest
+
+
+pytest.importorskip("pytest_benchmark")
+
+# the import is timed in a fresh interpreter, modules cached by the test session
+# would hide the cost of a cold start
+IMPORT_SCRIPT = """
+import json, sys, time
+num_modules = len(sys.modules)
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": len(sys.modules) - num_modules}}))
+"""
+
+
+def _run_import(module, results):
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    results.append(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+class TestImportBenchmark:
+    @pytest.mark.parametrize("module", ["hsml", "hsml.model_registry"])
+    def test_import(self, benchmark, module):
+        # Arrange
+        results = []
+
+        # Act
+        benchmark.pedantic(_run_import, args=(module, results), rounds=5)
+
+        # Assert
+        # the interpreter startup is included in the benchmark timings, the import
+        # alone and the number of modules it loads are stored as extra info
+        benchmark.extra_info["import_seconds"] = statistics.median(
+            r["seconds"] for r in results
+        )
+        benchmark.extra_info["modules"] = results[-1]["modules"]
+        assert results[-1]["modules"] > 0
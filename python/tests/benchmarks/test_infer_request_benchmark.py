@@ -0,0 +1,65 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import numpy as np
+import pytest
+from hsml.client.istio.utils.infer_type import InferInput, InferRequest
+
+
+pytest.importorskip("pytest_benchmark")
+
+# number of elements of the input tensor
+TENSOR_SIZES = [1, 1_000, 100_000]
+
+
+def _get_infer_request(size, datatype):
+    if datatype == "BYTES":
+        data = np.array([b"value"] * size, dtype=np.object_)
+    else:
+        data = np.arange(size, dtype=np.float32)
+    # the encoding replaces the data of the inputs, each round needs a new request
+    infer_input = InferInput(name="input", shape=[size], datatype=datatype, data=data)
+    return (InferRequest(model_name="mnist", infer_inputs=[infer_input]),), {}
+
+
+class TestInferRequestBenchmark:
+    @pytest.mark.parametrize("size", TENSOR_SIZES)
+    @pytest.mark.parametrize("datatype", ["FP32", "BYTES"])
+    def test_to_rest(self, benchmark, size, datatype):
+        # Act
+        result = benchmark.pedantic(
+            InferRequest.to_rest,
+            setup=lambda: _get_infer_request(size, datatype),
+            rounds=10,
+        )
+
+        # Assert
+        benchmark.extra_info["size"] = size
+        assert len(result["inputs"][0]["data"]) == size
+
+    @pytest.mark.parametrize("size", TENSOR_SIZES)
+    @pytest.mark.parametrize("datatype", ["FP32", "BYTES"])
+    def test_to_grpc(self, benchmark, size, datatype):
+        # Act
+        result = benchmark.pedantic(
+            InferRequest.to_grpc,
+            setup=lambda: _get_infer_request(size, datatype),
+            rounds=10,
+        )
+
+        # Assert
+        benchmark.extra_info["size"] = size
+        assert len(result.raw_input_contents) == 1
@@ -0,0 +1,89 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+import warnings
+
+import numpy as np
+import pandas as pd
+import pytest
+from hsml import util
+
+
+pytest.importorskip("pytest_benchmark")
+
+NUM_ROWS = [1000, 1000000]
+
+
+def _get_dataframe(num_rows):
+    return pd.DataFrame(
+        {
+            "int": np.arange(num_rows),
+            "float": np.random.rand(num_rows),
+            "time": pd.date_range("2024-01-01", periods=num_rows, freq="s"),
+            "string": np.array(["value"] * num_rows, dtype=object),
+        }
+    )
+
+
+class TestInputExampleBenchmark:
+    @pytest.mark.parametrize("num_rows", NUM_ROWS)
+    def test_input_example_to_json_numpy(self, benchmark, num_rows):
+        # Arrange
+        input_example = np.random.rand(num_rows, 10)
+
+        # Act
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = benchmark(util.input_example_to_json, input_example)
+
+        # Assert
+        benchmark.extra_info["rows"] = num_rows
+        assert len(result) <= util.INPUT_EXAMPLE_MAX_ROWS
+
+    @pytest.mark.parametrize("num_rows", NUM_ROWS)
+    def test_input_example_to_json_series(self, benchmark, num_rows):
+        # Arrange
+        input_example = _get_dataframe(num_rows)["time"]
+
+        # Act
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            result = benchmark(util.input_example_to_json, input_example)
+
+        # Assert
+        benchmark.extra_info["rows"] = num_rows
+        assert len(result) <= util.INPUT_EXAMPLE_MAX_ROWS
+
+    def test_numpy_encoder_dataframe(self, benchmark):
+        # Arrange
+        df = _get_dataframe(100000)
+
+        # Act
+        result = benchmark(json.dumps, df, cls=util.NumpyEncoder)
+
+        # Assert
+        assert result.startswith("[[0, ")
+
+    def test_numpy_encoder_object_array(self, benchmark):
+        # Arrange
+        array = np.array([b"bytes", "string", 1, None] * 25000, dtype=object)
+
+        # Act
+        result = benchmark(json.dumps, array, cls=util.NumpyEncoder)
+
+        # Assert
+        assert result.startswith('["Ynl0ZXM=\\n", "string", 1, null')
@@ -0,0 +1,128 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import copy
+
+import humps
+import pytest
+from hsml import util
+from hsml.deployment import Deployment
+from hsml.model import Model
+from hsml.summary import DeploymentSummary, ModelSummary
+
+
+pytest.importorskip("pytest_benchmark")
+
+NUM_ITEMS = [1, 100, 1000]
+
+
+def _get_list_response(item_json, num_items):
+    items = []
+    for i in range(num_items):
+        item = copy.deepcopy(item_json)
+        item["id"] = i
+        item["name"] = "{}_{}".format(item["name"], i)
+        items.append(item)
+    return {"count": num_items, "items": items}
+
+
+class TestParsingBenchmark:
+    @pytest.mark.parametrize("num_items", NUM_ITEMS)
+    def test_model_from_response_json(self, benchmark, backend_fixtures, num_items):
+        # Arrange
+        json = _get_list_response(
+            backend_fixtures["model"]["get_python"]["response"]["items"][0], num_items
+        )
+
+        # Act
+        models = benchmark(Model.from_response_json, json)
+
+        # Assert
+        benchmark.extra_info["items"] = num_items
+        assert len(models) == num_items
+
+    @pytest.mark.parametrize("num_items", NUM_ITEMS)
+    def test_deployment_from_response_json(
+        self, benchmark, backend_fixtures, hopsworks_connection, num_items
+    ):
+        # Arrange
+        # the connection loads the serving resource limits used to fill the defaults
+        json = _get_list_response(
+            backend_fixtures["predictor"]["get_deployment_tf_kserve_rest_trans"][
+                "response"
+            ],
+            num_items,
+        )
+
+        # Act
+        deployments = benchmark(Deployment.from_response_json, json)
+
+        # Assert
+        benchmark.extra_info["items"] = num_items
+        assert len(deployments) == num_items
+
+    @pytest.mark.parametrize("num_items", NUM_ITEMS)
+    def test_model_summaries_from_response_json(
+        self, benchmark, backend_fixtures, num_items
+    ):
+        # Arrange
+        json = _get_list_response(
+            backend_fixtures["model"]["get_python"]["response"]["items"][0], num_items
+        )
+
+        # Act
+        models = benchmark(ModelSummary.from_response_json, json)
+
+        # Assert
+        benchmark.extra_info["items"] = num_items
+        assert len(models) == num_items
+
+    @pytest.mark.parametrize("num_items", NUM_ITEMS)
+    def test_deployment_summaries_from_response_json(
+        self, benchmark, backend_fixtures, num_items
+    ):
+        # Arrange
+        json = _get_list_response(
+            backend_fixtures["predictor"]["get_deployment_tf_kserve_rest_trans"][
+                "response"
+            ],
+            num_items,
+        )
+
+        # Act
+        deployments = benchmark(DeploymentSummary.from_response_json, json)
+
+        # Assert
+        benchmark.extra_info["items"] = num_items
+        assert len(deployments) == num_items
+
+    @pytest.mark.parametrize(
+        "decamelize", [humps.decamelize, util.decamelize], ids=["humps", "cached"]
+    )
+    def test_decamelize(self, benchmark, backend_fixtures, decamelize):
+        # Arrange
+        json = _get_list_response(
+            backend_fixtures["predictor"]["get_deployment_tf_kserve_rest_trans"][
+                "response"
+            ],
+            1000,
+        )
+
+        # Act
+        json_decamelized = benchmark(decamelize, json)
+
+        # Assert
+        assert len(json_decamelized["items"]) == 1000
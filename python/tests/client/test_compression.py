@@ -0,0 +1,114 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import gzip
+
+import pytest
+from hsml.client import compression
+from hsml.constants import COMPRESSION
+
+
+class TestCompression:
+    # compress
+
+    def test_compress_none(self):
+        # Arrange
+        body = b"x" * 10 * COMPRESSION.MIN_SIZE
+
+        # Act
+        result = compression.compress(body, None)
+
+        # Assert
+        assert result == (body, None)
+
+    def test_compress_below_min_size(self):
+        # Arrange
+        body = b"x" * 100
+
+        # Act
+        result = compression.compress(body, {"algorithm": "gzip"})
+
+        # Assert
+        assert result == (body, None)
+
+    def test_compress_gzip(self):
+        # Arrange
+        body = b"x" * 100
+
+        # Act
+        compressed, content_encoding = compression.compress(
+            body, {"algorithm": "gzip", "min_size": 10, "level": 1}
+        )
+
+        # Assert
+        assert content_encoding == "gzip"
+        assert len(compressed) < len(body)
+        assert gzip.decompress(compressed) == body
+
+    def test_compress_zstd(self):
+        # Arrange
+        zstandard = pytest.importorskip("zstandard")
+        body = b"x" * 10 * COMPRESSION.MIN_SIZE
+
+        # Act
+        compressed, content_encoding = compression.compress(body, {"algorithm": "zstd"})
+
+        # Assert
+        assert content_encoding == "zstd"
+        assert zstandard.ZstdDecompressor().decompress(compressed) == body
+
+    # validate_configuration
+
+    def test_validate_configuration_unknown_algorithm(self):
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            compression.validate_configuration({"algorithm": "brotli"})
+
+        # Assert
+        assert "not supported" in str(e_info.value)
+
+    def test_validate_configuration_zstd_not_installed(self, mocker):
+        # Arrange
+        mocker.patch("hsml.client.compression.zstandard", None)
+
+        # Act
+        with pytest.raises(ModuleNotFoundError):
+            compression.validate_configuration({"algorithm": "zstd"})
+
+    # get_accept_encoding
+
+    def test_get_accept_encoding(self, mocker):
+        # Arrange
+        mocker.patch("hsml.client.compression.ACCEPT_ENCODING", "gzip,deflate,br,zstd")
+
+        # Act and Assert
+        assert compression.get_accept_encoding({}) == "gzip, deflate, br, zstd"
+        assert (
+            compression.get_accept_encoding({"algorithm": "zstd"})
+            == "zstd, gzip, deflate, br"
+        )
+
+    def test_get_accept_encoding_zstd_not_decodable(self, mocker):
+        # Arrange
+        mocker.patch("hsml.client.compression.ACCEPT_ENCODING", "gzip,deflate")
+        mocker.patch("hsml.client.compression.zstandard", mocker.MagicMock())
+
+        # Act and Assert
+        assert compression.get_accept_encoding({"algorithm": "zstd"}) == "gzip, deflate"
+
+    def test_get_accept_encoding_not_configured(self):
+        # Act and Assert
+        assert compression.get_accept_encoding() is None
@@ -0,0 +1,97 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from hsml import client
+from hsml.client.hopsworks import base as hopsworks
+from hsml.core import dataset_api
+
+
+NUM_THREADS = 64
+
+
+def _run_concurrently(fn, num_threads=NUM_THREADS):
+    barrier = threading.Barrier(num_threads)
+
+    def _run(i):
+        barrier.wait()
+        return fn(i)
+
+    with ThreadPoolExecutor(max_workers=num_threads) as executor:
+        return list(executor.map(_run, range(num_threads)))
+
+
+class TestConcurrency:
+    def test_token_refresh_single_flight(
+        self, mocker, monkeypatch, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        monkeypatch.setenv(hopsworks.Client.REST_ENDPOINT, hopsworks_backend.base_url)
+
+        def _read_jwt():
+            time.sleep(0.05)  # widen the window for concurrent refreshes
+            return "jwt"
+
+        mock_read_jwt = mocker.patch(
+            "hsml.client.hopsworks.external.Client._read_jwt", side_effect=_read_jwt
+        )
+        hopsworks_backend.authorization = "Bearer jwt"  # expire the api key
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        results = _run_concurrently(lambda i: d_api.path_exists("Models"))
+
+        # Assert
+        assert all(results)
+        mock_read_jwt.assert_called_once()
+        assert client.get_instance()._auth._token == "jwt"
+        assert hopsworks_backend.count_requests(contains="Models") <= 2 * NUM_THREADS
+
+    def test_token_refresh_expired_again(
+        self, mocker, monkeypatch, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        monkeypatch.setenv(hopsworks.Client.REST_ENDPOINT, hopsworks_backend.base_url)
+        mock_read_jwt = mocker.patch(
+            "hsml.client.hopsworks.external.Client._read_jwt",
+            side_effect=["jwt1", "jwt2"],
+        )
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        for token in ["jwt1", "jwt2"]:
+            hopsworks_backend.authorization = "Bearer " + token
+            results = _run_concurrently(lambda i: d_api.path_exists("Models"))
+
+            # Assert
+            assert all(results)
+        assert mock_read_jwt.call_count == 2
+
+    def test_set_istio_client_once(self, mocker, hopsworks_connection):
+        # Arrange
+        mock_istio_client = mocker.patch("hsml.client.ist_external.Client")
+
+        # Act
+        _run_concurrently(
+            lambda i: client.set_istio_client("hopsworks.test", 8080, "test_project")
+        )
+
+        # Assert
+        mock_istio_client.assert_called_once()
+        assert client.get_istio_instance() is mock_istio_client.return_value
@@ -0,0 +1,108 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import requests
+from hsml import metrics
+from hsml.client.connection_pool import PooledHTTPAdapter
+
+
+class TestPooledHTTPAdapter:
+    def _session(self, adapter):
+        session = requests.session()
+        session.mount("http://", adapter)
+        return session
+
+    def test_from_configuration_default(self):
+        # Act
+        adapter = PooledHTTPAdapter.from_configuration(None)
+
+        # Assert
+        assert adapter._pool_connections == PooledHTTPAdapter.DEFAULT_POOL_CONNECTIONS
+        assert adapter._pool_maxsize == PooledHTTPAdapter.DEFAULT_POOL_MAXSIZE
+        assert adapter._pool_block == PooledHTTPAdapter.DEFAULT_POOL_BLOCK
+        assert adapter._keep_alive == PooledHTTPAdapter.DEFAULT_KEEP_ALIVE
+        assert adapter._idle_timeout == PooledHTTPAdapter.DEFAULT_IDLE_TIMEOUT
+
+    def test_from_configuration(self):
+        # Act
+        adapter = PooledHTTPAdapter.from_configuration(
+            {"pool_maxsize": 32, "pool_block": True, "idle_timeout": 30}
+        )
+
+        # Assert
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block
+        assert adapter._idle_timeout == 30
+
+    def test_statistics_reuse_connection(self, http_server_url):
+        # Arrange
+        adapter = PooledHTTPAdapter()
+        session = self._session(adapter)
+
+        # Act
+        for _ in range(3):
+            session.get(http_server_url)
+
+        # Assert
+        assert adapter.statistics.to_dict() == {
+            "requests": 3,
+            "hits": 2,
+            "misses": 1,
+            "evictions": 0,
+        }
+
+    def test_queueing_time(self, http_server_url):
+        # Arrange
+        adapter = PooledHTTPAdapter()
+        session = self._session(adapter)
+
+        # Act
+        with metrics.time_inference("mnist") as timer:
+            session.get(http_server_url)
+        metrics.reset()
+
+        # Assert
+        assert timer.phases[metrics.QUEUEING] >= 0
+
+    def test_statistics_no_keep_alive(self, http_server_url):
+        # Arrange
+        adapter = PooledHTTPAdapter(keep_alive=False)
+        session = self._session(adapter)
+
+        # Act
+        for _ in range(3):
+            response = session.get(http_server_url)
+
+        # Assert
+        assert response.request.headers["Connection"] == "close"
+        assert adapter.statistics.misses == 3
+
+    def test_idle_timeout(self, mocker, http_server_url):
+        # Arrange
+        mock_monotonic = mocker.patch(
+            "hsml.client.connection_pool.time.monotonic", return_value=0
+        )
+        adapter = PooledHTTPAdapter(idle_timeout=10)
+        session = self._session(adapter)
+        session.get(http_server_url)
+
+        # Act
+        mock_monotonic.return_value = 11
+        session.get(http_server_url)
+
+        # Assert
+        assert adapter.statistics.evictions == 1
+        assert adapter.statistics.misses == 2
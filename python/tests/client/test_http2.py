@@ -0,0 +1,137 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from hsml.client import http2
+from hsml.client.istio import external as istio_external
+
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+class TestHttp2Adapter:
+    def _session(self, adapter):
+        session = requests.session()
+        session.mount("http://", adapter)
+        return session
+
+    def test_from_configuration(self):
+        # Act
+        adapter = http2.Http2Adapter.from_configuration(
+            {"http2": True, "pool_maxsize": 32, "http2_prior_knowledge": True}
+        )
+
+        # Assert
+        assert adapter._limits.max_keepalive_connections == 32
+        assert adapter._prior_knowledge
+
+    def test_prior_knowledge(self, http2_server):
+        # Arrange
+        session = self._session(http2.Http2Adapter(prior_knowledge=True))
+
+        # Act
+        responses = [session.get(http2_server.url) for _ in range(3)]
+
+        # Assert
+        assert [r.raw.version for r in responses] == [20, 20, 20]
+        assert responses[0].json() == {}
+        # consecutive streams of a single connection
+        assert [r.headers["x-stream-id"] for r in responses] == ["1", "3", "5"]
+        assert http2_server.connections == 1
+
+    def test_prior_knowledge_concurrent(self, http2_server):
+        # Arrange
+        session = self._session(http2.Http2Adapter(prior_knowledge=True))
+
+        # Act
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(
+                executor.map(lambda _: session.get(http2_server.url), range(16))
+            )
+
+        # Assert
+        assert all(r.raw.version == 20 for r in responses)
+        # concurrent requests are multiplexed over a single connection
+        assert len({r.headers["x-stream-id"] for r in responses}) == 16
+        assert http2_server.connections == 1
+
+    def test_send_get(self, http_server_url):
+        # Arrange
+        adapter = http2.Http2Adapter()
+        session = self._session(adapter)
+
+        # Act
+        responses = [session.get(http_server_url) for _ in range(3)]
+
+        # Assert
+        assert [r.status_code for r in responses] == [200, 200, 200]
+        # plain HTTP connections use HTTP/1.1 without prior knowledge
+        assert [r.raw.version for r in responses] == [11, 11, 11]
+        assert responses[0].json() == {}
+        assert adapter.statistics.to_dict() == {
+            "requests": 3,
+            "hits": 2,
+            "misses": 1,
+            "evictions": 0,
+        }
+
+    def test_send_post_stream(self, http_server_url):
+        # Arrange
+        adapter = http2.Http2Adapter()
+        session = self._session(adapter)
+        body = b"x" * 100000
+
+        # Act
+        response = session.post(
+            http_server_url,
+            data=body,
+            headers={"Content-Type": "application/octet-stream"},
+            stream=True,
+        )
+
+        # Assert
+        assert b"".join(response.iter_content(chunk_size=4096)) == body
+
+    def test_send_connection_error(self):
+        # Arrange
+        session = self._session(http2.Http2Adapter())
+
+        # Act and Assert
+        with pytest.raises(requests.exceptions.ConnectionError):
+            session.get("http://127.0.0.1:1/")
+
+    def test_client_session(self, http_server_url):
+        # Arrange
+        host, port = http_server_url[len("http://") : -1].split(":")
+
+        # Act
+        client = istio_external.Client(
+            host,
+            port,
+            "project",
+            "api_key",
+            connection_pool_configuration={"http2": True},
+        )
+        response = client._send_request("GET", [""])
+
+        # Assert
+        assert isinstance(client._connection_pool, http2.Http2Adapter)
+        assert response == {}
+        assert client._get_connection_pool_stats()["requests"] == 1
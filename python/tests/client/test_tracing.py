@@ -0,0 +1,246 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import pytest
+from hsml.client import tracing
+from hsml.client.exceptions import RestAPIError
+from hsml.constants import INFERENCE_ENDPOINTS
+from hsml.core import serving_api
+
+
+@pytest.fixture
+def span_exporter():
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+        InMemorySpanExporter,
+    )
+
+    exporter = InMemorySpanExporter()
+    tracer_provider = sdk_trace.TracerProvider()
+    tracer_provider.add_span_processor(SimpleSpanProcessor(exporter))
+    exporter.tracer_provider = tracer_provider
+    yield exporter
+    tracing.stop()
+
+
+class TestTracing:
+    # get_path_template
+
+    @pytest.mark.parametrize(
+        "path_params, template",
+        [
+            (
+                ["project", 119, "modelregistries", 119, "models", "mnist_1"],
+                "/project/{id}/modelregistries/{id}/models/{name}",
+            ),
+            (
+                ["project", 119, "dataset", "upload", "Models/mnist/1"],
+                "/project/{id}/dataset/upload/{path}",
+            ),
+            (
+                ["project", 119, "dataset", "Models", "mnist"],
+                "/project/{id}/dataset/{path}",
+            ),
+            (["v1", "models", "mnist:predict"], "/v1/models/{name}:predict"),
+            (
+                ["variables", "kube_kserve_installed"],
+                "/variables/kube_kserve_installed",
+            ),
+        ],
+    )
+    def test_get_path_template(self, path_params, template):
+        # Act
+        result = tracing.get_path_template(path_params)
+
+        # Assert
+        assert result == template
+
+    # init
+
+    def test_init_not_available(self, mocker):
+        # Arrange
+        mocker.patch("importlib.util.find_spec", return_value=None)
+
+        # Act
+        with pytest.raises(ModuleNotFoundError) as e_info:
+            tracing.init({})
+
+        # Assert
+        assert "pip install hsml[tracing]" in str(e_info.value)
+        assert not tracing.is_enabled()
+
+    def test_request_span_disabled(self):
+        # Act
+        with tracing.request_span("GET", ["project", 119], "hopsworks.test") as span:
+            pass
+
+        # Assert
+        assert span is None
+
+    # send_request
+
+    def test_send_request_span(self, span_exporter, hopsworks_connection):
+        # Arrange
+        tracing.init({"tracer_provider": span_exporter.tracer_provider})
+
+        # Act
+        hopsworks_connection.get_model_registry()
+
+        # Assert
+        span = span_exporter.get_finished_spans()[-1]
+        assert span.name == "GET /project/{id}/dataset/{path}"
+        assert span.attributes["http.request.method"] == "GET"
+        assert span.attributes["url.template"] == "/project/{id}/dataset/{path}"
+        assert span.attributes["server.address"] == "hopsworks.test"
+        assert span.attributes["http.response.status_code"] == 200
+        assert span.attributes["http.response.body.size"] > 0
+        assert "http.request.resend_count" not in span.attributes
+
+    def test_send_request_error_span(self, span_exporter, hopsworks_connection):
+        # Arrange
+        tracing.init({"tracer_provider": span_exporter.tracer_provider})
+        mr = hopsworks_connection.get_model_registry()
+
+        # Act
+        with pytest.raises(RestAPIError):
+            mr.get_model("missing", version=1)
+
+        # Assert
+        span = span_exporter.get_finished_spans()[-1]
+        assert span.attributes["http.response.status_code"] == 404
+        assert span.status.is_ok is False
+        assert span.events[0].name == "exception"
+
+    def test_send_request_disabled(self, span_exporter, hopsworks_connection):
+        # Act
+        hopsworks_connection.get_model_registry()
+
+        # Assert
+        assert span_exporter.get_finished_spans() == ()
+
+    def test_connection_tracing_configuration(self, span_exporter, hopsworks_backend):
+        # Arrange
+        from hsml.connection import Connection
+
+        # Act
+        conn = Connection(
+            host=hopsworks_backend.host,
+            port=hopsworks_backend.port,
+            project=hopsworks_backend.project,
+            api_key_value="api_key",
+            tracing_configuration={"tracer_provider": span_exporter.tracer_provider},
+        )
+        conn.close()
+
+        # Assert
+        assert len(span_exporter.get_finished_spans()) == len(
+            hopsworks_backend.requests
+        )
+        assert not tracing.is_enabled()
+
+    # context propagation
+
+    def _send_inference_request(self, mocker, hopsworks_backend):
+        deployment_json = hopsworks_backend._put_deployment({"name": "mnist"})
+        deployment_json["status"] = "Running"
+        mock_deployment = mocker.MagicMock()
+        mock_deployment.name = "mnist"
+        mock_deployment.api_protocol = INFERENCE_ENDPOINTS.API_PROTOCOL_REST
+        mock_deployment.compression_configuration = None
+        serving_api.ServingApi().send_inference_request(
+            mock_deployment, {"instances": [[1, 2]]}, through_hopsworks=True
+        )
+
+    def test_inference_request_propagates_context(
+        self, mocker, span_exporter, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        tracing.init({"tracer_provider": span_exporter.tracer_provider})
+
+        # Act
+        self._send_inference_request(mocker, hopsworks_backend)
+
+        # Assert
+        span = span_exporter.get_finished_spans()[-1]
+        assert span.name == "POST /project/{id}/inference/models/{name}:predict"
+        headers = hopsworks_backend.requests[-1][3]
+        trace_id = "{:032x}".format(span.context.trace_id)
+        assert headers["traceparent"].split("-")[1] == trace_id
+
+    def test_inference_request_propagate_disabled(
+        self, mocker, span_exporter, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        tracing.init(
+            {"tracer_provider": span_exporter.tracer_provider, "propagate": False}
+        )
+
+        # Act
+        self._send_inference_request(mocker, hopsworks_backend)
+
+        # Assert
+        assert len(span_exporter.get_finished_spans()) == 1
+        assert "traceparent" not in hopsworks_backend.requests[-1][3]
+
+    def test_metadata_request_not_propagated(
+        self, span_exporter, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        tracing.init({"tracer_provider": span_exporter.tracer_provider})
+
+        # Act
+        hopsworks_connection.get_model_registry()
+
+        # Assert
+        assert "traceparent" not in hopsworks_backend.requests[-1][3]
+
+    # grpc infer
+
+    def test_grpc_infer_span(self, mocker, span_exporter):
+        # Arrange
+        from hsml.client.istio.grpc.inference_client import GRPCInferenceServerClient
+        from hsml.client.istio.grpc.proto.grpc_predict_v2_pb2 import (
+            ModelInferResponse,
+        )
+        from hsml.client.istio.utils.infer_type import InferInput, InferRequest
+
+        tracing.init({"tracer_provider": span_exporter.tracer_provider})
+        grpc_client = GRPCInferenceServerClient(
+            url="istio.test:8080", serving_api_key="api_key"
+        )
+        mock_stub = mocker.MagicMock()
+        mock_stub.ModelInfer.return_value = ModelInferResponse(model_name="mnist")
+        grpc_client._client_stub = mock_stub
+        request = InferRequest(
+            model_name="mnist",
+            infer_inputs=[InferInput("input", [2], "INT32", data=[1, 2])],
+        )
+
+        # Act
+        grpc_client.infer(request)
+
+        # Assert
+        span = span_exporter.get_finished_spans()[-1]
+        assert span.name == "inference.GRPCInferenceService/ModelInfer"
+        assert span.attributes["rpc.system"] == "grpc"
+        assert span.attributes["server.address"] == "istio.test:8080"
+        assert span.attributes["rpc.grpc.status_code"] == 0
+        assert span.attributes["rpc.request.size"] > 0
+        metadata = dict(mock_stub.ModelInfer.call_args.kwargs["metadata"])
+        assert metadata["authorization"] == "ApiKey api_key"
+        assert "traceparent" in metadata
+        grpc_client.close()
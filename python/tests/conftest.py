@@ -17,4 +17,6 @@
 pytest_plugins = [
     "tests.fixtures.backend_fixtures",
     "tests.fixtures.model_fixtures",
+    "tests.fixtures.hopsworks_backend",
+    "tests.fixtures.http_server",
 ]
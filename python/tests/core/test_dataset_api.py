@@ -0,0 +1,406 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+import time
+import weakref
+
+import pytest
+from hsml.client.exceptions import RestAPIError
+from hsml.core import dataset_api
+
+
+class TestDatasetApi:
+    # upload / download
+
+    def test_upload_download(self, hopsworks_connection, tmp_path):
+        # Arrange
+        content = os.urandom(3 * 1024 * 1024 + 17)
+        local_file = tmp_path / "model.bin"
+        local_file.write_bytes(content)
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        uploaded_path = d_api.upload(str(local_file), "Resources", chunk_size=1)
+        d_api.download(uploaded_path, str(tmp_path / "downloaded.bin"))
+
+        # Assert
+        assert uploaded_path == "Resources/model.bin"
+        assert (tmp_path / "downloaded.bin").read_bytes() == content
+
+    def test_upload_existing_without_overwrite(self, hopsworks_connection, tmp_path):
+        # Arrange
+        local_file = tmp_path / "model.bin"
+        local_file.write_bytes(b"content")
+        d_api = dataset_api.DatasetApi()
+        d_api.upload(str(local_file), "Resources")
+
+        # Act
+        with pytest.raises(Exception) as e_info:
+            d_api.upload(str(local_file), "Resources")
+
+        # Assert
+        assert "set overwrite=True" in str(e_info.value)
+
+    # get / path_exists / list
+
+    def test_path_exists(self, hopsworks_connection):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+
+        # Act and Assert
+        assert d_api.path_exists("Models")
+        assert not d_api.path_exists("Models/missing")
+
+    def test_get_not_found(self, hopsworks_connection):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        with pytest.raises(RestAPIError) as e_info:
+            d_api.get("Models/missing")
+
+        # Assert
+        assert e_info.value.response.status_code == 404
+
+    def test_mkdir_list(self, hopsworks_connection):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        for name in ["a", "b", "c"]:
+            d_api.mkdir("Models/" + name)
+        listing = d_api.list("Models", sort_by="NAME:desc")
+
+        # Assert
+        assert listing["count"] == 3
+        assert [item["attributes"]["path"] for item in listing["items"]] == [
+            "/Projects/test_project/Models/c",
+            "/Projects/test_project/Models/b",
+            "/Projects/test_project/Models/a",
+        ]
+
+    def test_list_if_exists(self, hopsworks_connection):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Models/a")
+
+        # Act
+        listing = d_api.list_if_exists("Models")
+        missing = d_api.list_if_exists("Models/missing")
+
+        # Assert
+        assert listing["count"] == 1
+        assert missing is None
+
+    def test_dataset_exists_cached(
+        self, mocker, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        mocker.patch.object(
+            dataset_api.DatasetApi, "_existing_datasets", weakref.WeakKeyDictionary()
+        )
+        d_api = dataset_api.DatasetApi()
+
+        # Act
+        results = [d_api.dataset_exists("Models") for _ in range(3)]
+        missing = [d_api.dataset_exists("Missing") for _ in range(2)]
+
+        # Assert
+        assert results == [True, True, True]
+        assert missing == [False, False]
+        assert hopsworks_backend.count_requests("GET", contains="Models") == 1
+        assert hopsworks_backend.count_requests("GET", contains="Missing") == 2
+
+    def test_dataset_exists_reconnect(
+        self, mocker, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        mocker.patch.object(
+            dataset_api.DatasetApi, "_existing_datasets", weakref.WeakKeyDictionary()
+        )
+        d_api = dataset_api.DatasetApi()
+        d_api.dataset_exists("Models")
+
+        # Act
+        hopsworks_connection.close()
+        hopsworks_connection.connect()
+        results = [d_api.dataset_exists("Models") for _ in range(2)]
+
+        # Assert
+        # datasets are checked again with the new client
+        assert results == [True, True]
+        assert hopsworks_backend.count_requests("GET", contains="Models") == 2
+        assert len(dataset_api.DatasetApi._existing_datasets) == 1
+
+    # copy / move
+
+    def test_copy_move(self, hopsworks_connection, hopsworks_backend):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/src")
+
+        # Act
+        d_api.copy("Resources/src", "/Projects/test_project/Resources/copied")
+        d_api.move("Resources/src", "/Projects/test_project/Resources/moved")
+
+        # Assert
+        assert d_api.path_exists("Resources/copied")
+        assert d_api.path_exists("Resources/moved")
+        assert not d_api.path_exists("Resources/src")
+
+    # zip / unzip
+
+    def test_zip_unzip(self, hopsworks_connection, tmp_path):
+        # Arrange
+        local_file = tmp_path / "file.txt"
+        local_file.write_bytes(b"content")
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/archive")
+        d_api.upload(str(local_file), "Resources/archive")
+
+        # Act
+        d_api.zip("Resources/archive", block=True)
+        d_api.rm("Resources/archive")
+        d_api.unzip("Resources/archive.zip", block=True)
+
+        # Assert
+        assert d_api.path_exists("Resources/archive/file.txt")
+
+    def test_zip_status_requests(self, hopsworks_connection, hopsworks_backend):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/archive")
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        d_api.zip("Resources/archive", block=True)
+
+        # Assert
+        # zip request, zipState of the dir and existence of the zip file
+        assert [r[0] for r in hopsworks_backend.requests[num_requests:]] == [
+            "POST",
+            "GET",
+            "GET",
+        ]
+
+    def test_zip_status_requests_in_progress(
+        self, mocker, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/archive")
+        get = dataset_api.DatasetApi.get
+        states = ["ZIPPING", "ZIPPING", "ZIPPING"]
+
+        def get_zipping(self, path):
+            status = get(self, path)
+            if path == "Resources/archive" and states:
+                status["zipState"] = states.pop()
+            return status
+
+        mocker.patch.object(
+            dataset_api.DatasetApi, "get", autospec=True, side_effect=get_zipping
+        )
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        d_api.zip("Resources/archive", block=True)
+
+        # Assert
+        # a single zipState request per poll, the zip file is checked once at the end
+        assert [r[0] for r in hopsworks_backend.requests[num_requests:]] == ["POST"] + [
+            "GET"
+        ] * 5
+
+    def test_unzip_not_started(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        local_file = tmp_path / "file.txt"
+        local_file.write_bytes(b"content")
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/archive")
+        d_api.upload(str(local_file), "Resources/archive")
+        d_api.zip("Resources/archive", block=True)
+        d_api.rm("Resources/archive")
+        archive = type(hopsworks_backend)._archive
+        pending = []
+        mocker.patch.object(
+            type(hopsworks_backend),
+            "_archive",
+            autospec=True,
+            side_effect=lambda *args: pending.append(args) or (204, None),
+        )
+        get = dataset_api.DatasetApi.get
+        states = ["NONE", "NONE", "UNZIPPING"]
+
+        def get_starting(self, path):
+            # NONE before the extraction starts, then UNZIPPING and NONE when done
+            if path != "Resources/archive.zip":
+                return get(self, path)
+            if not states and pending:
+                archive(*pending.pop())
+            status = get(self, path)
+            if states:
+                status["zipState"] = states.pop(0)
+            return status
+
+        mocker.patch.object(
+            dataset_api.DatasetApi, "get", autospec=True, side_effect=get_starting
+        )
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        d_api.unzip("Resources/archive.zip", block=True)
+        num_requests = len(hopsworks_backend.requests) - num_requests
+
+        # Assert
+        # unzip request and 4 zipState requests, the folder is checked on the first
+        # poll and once the extraction is done
+        assert num_requests == 1 + 4 + 2
+        assert d_api.path_exists("Resources/archive/file.txt")
+
+    def test_zip_timeout(self, mocker, hopsworks_connection, hopsworks_backend):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch.object(
+            dataset_api.DatasetApi, "get", return_value={"zipState": "ZIPPING"}
+        )
+        mocker.patch.object(dataset_api.DatasetApi, "path_exists", return_value=False)
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/archive")
+
+        # Act
+        with pytest.raises(Exception) as e_info:
+            d_api.zip("Resources/archive", block=True, timeout=0)
+
+        # Assert
+        assert "Timeout of 0 seconds exceeded while zip Resources/archive" in str(
+            e_info.value
+        )
+
+    def test_zip_unzip_async(self, hopsworks_connection, tmp_path):
+        # Arrange
+        local_file = tmp_path / "file.txt"
+        local_file.write_bytes(b"content")
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/archive")
+        d_api.upload(str(local_file), "Resources/archive")
+        callback_futures = []
+
+        # Act
+        zip_future = d_api.zip_async("Resources/archive")
+        zip_future.add_done_callback(callback_futures.append)
+        zip_future.result(timeout=10)
+        d_api.rm("Resources/archive")
+        d_api.unzip_async("Resources/archive.zip").result(timeout=10)
+
+        # Assert
+        assert callback_futures == [zip_future]
+        assert d_api.path_exists("Resources/archive/file.txt")
+
+    # latency shaping
+
+    def test_backend_latency(self, hopsworks_connection, hopsworks_backend):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        hopsworks_backend.latency = 0.05
+        num_requests = hopsworks_backend.count_requests()
+
+        # Act
+        start = time.perf_counter()
+        d_api.path_exists("Models")
+        elapsed = time.perf_counter() - start
+
+        # Assert
+        assert elapsed >= 0.05
+        assert hopsworks_backend.count_requests() == num_requests + 1
+        assert hopsworks_backend.count_requests("GET", contains="Models") == 1
+
+    # iter_list
+
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_iter_list(self, hopsworks_connection, hopsworks_backend, prefetch):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        for i in range(7):
+            d_api.mkdir("Resources/{}".format(i))
+        num_requests = hopsworks_backend.count_requests("GET", contains="Resources")
+
+        # Act
+        entries = list(
+            d_api.iter_list(
+                "Resources", sort_by="NAME:desc", page_size=3, prefetch=prefetch
+            )
+        )
+
+        # Assert
+        assert [os.path.basename(e["attributes"]["path"]) for e in entries] == [
+            str(i) for i in reversed(range(7))
+        ]
+        assert (
+            hopsworks_backend.count_requests("GET", contains="Resources")
+            == num_requests + 3
+        )
+
+    def test_iter_list_offset(self, hopsworks_connection):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        for i in range(5):
+            d_api.mkdir("Resources/{}".format(i))
+
+        # Act
+        entries = list(d_api.iter_list("Resources", page_size=2, offset=3))
+
+        # Assert
+        assert [os.path.basename(e["attributes"]["path"]) for e in entries] == [
+            "3",
+            "4",
+        ]
+
+    def test_iter_list_empty(self, hopsworks_connection):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/empty")
+
+        # Act
+        entries = list(d_api.iter_list("Resources/empty"))
+
+        # Assert
+        assert entries == []
+
+    def test_iter_list_not_consumed(self, hopsworks_connection, hopsworks_backend):
+        # Arrange
+        d_api = dataset_api.DatasetApi()
+        for i in range(5):
+            d_api.mkdir("Resources/{}".format(i))
+        num_requests = hopsworks_backend.count_requests("GET", contains="Resources")
+
+        # Act
+        entries = d_api.iter_list("Resources", page_size=2)
+        first_entry = next(entries)
+        entries.close()
+
+        # Assert
+        assert os.path.basename(first_entry["attributes"]["path"]) == "0"
+        # first page and at most the prefetched second page
+        assert (
+            hopsworks_backend.count_requests("GET", contains="Resources")
+            <= num_requests + 2
+        )
@@ -0,0 +1,220 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import copy
+
+import pytest
+from hsml.client.exceptions import RestAPIError
+from hsml.core import metadata_cache, serving_api
+from hsml.python import signature as python_signature
+
+
+@pytest.fixture
+def enabled_metadata_cache():
+    metadata_cache.init({"ttl": 60, "max_size": 16})
+    yield metadata_cache.get_instance()
+    metadata_cache.stop()
+
+
+class TestMetadataCache:
+    # get / put
+
+    def test_get_put(self):
+        # Arrange
+        cache = metadata_cache.MetadataCache()
+
+        # Act
+        miss = cache.get("key")
+        cache.put("key", {"name": "mnist"})
+        hit = cache.get("key")
+
+        # Assert
+        assert miss is None
+        assert hit == {"name": "mnist"}
+        assert cache.to_dict() == {"hits": 1, "misses": 1, "evictions": 0, "size": 1}
+
+    def test_get_expired(self, mocker):
+        # Arrange
+        mock_monotonic = mocker.patch(
+            "hsml.core.metadata_cache.time.monotonic", return_value=0
+        )
+        cache = metadata_cache.MetadataCache(ttl=10)
+        cache.put("key", "value")
+
+        # Act
+        mock_monotonic.return_value = 11
+        value = cache.get("key")
+
+        # Assert
+        assert value is None
+        assert cache.to_dict()["size"] == 0
+
+    def test_put_lru_eviction(self):
+        # Arrange
+        cache = metadata_cache.MetadataCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")  # "b" becomes the least recently used
+
+        # Act
+        cache.put("c", 3)
+
+        # Assert
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        assert cache.to_dict()["evictions"] == 1
+
+    def test_invalidate(self):
+        # Arrange
+        cache = metadata_cache.MetadataCache()
+        cache.put("a", 1)
+        cache.put("b", 2)
+
+        # Act
+        cache.invalidate("a", "missing")
+
+        # Assert
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_get_or_load_disabled(self, mocker):
+        # Arrange
+        mock_load = mocker.MagicMock(return_value="value")
+
+        # Act
+        for _ in range(2):
+            value = metadata_cache.get_or_load("key", mock_load)
+
+        # Assert
+        assert value == "value"
+        assert mock_load.call_count == 2
+
+    # model api / serving api
+
+    def test_get_model_cached(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(b"weights")
+        mr = hopsworks_connection.get_model_registry()
+        python_signature.create_model("mnist").save(str(model_file))
+        metadata_cache.init({"ttl": 60})
+        try:
+            num_requests = hopsworks_backend.count_requests("GET", "models/mnist_1")
+
+            # Act
+            models = [mr.get_model("mnist", version=1) for _ in range(3)]
+            models[0].description = "changed"
+
+            # Assert
+            assert (
+                hopsworks_backend.count_requests("GET", "models/mnist_1")
+                == num_requests + 1
+            )
+            assert models[1] is not models[2]
+            assert mr.get_model("mnist", version=1).description != "changed"
+            assert hopsworks_connection.get_metadata_cache_stats()["hits"] == 3
+        finally:
+            metadata_cache.stop()
+
+    def test_set_tag_invalidates(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(b"weights")
+        mr = hopsworks_connection.get_model_registry()
+        python_signature.create_model("mnist").save(str(model_file))
+        metadata_cache.init({"ttl": 60})
+        try:
+            model = mr.get_model("mnist", version=1)
+            num_requests = hopsworks_backend.count_requests("GET", "models/mnist_1")
+
+            # Act
+            model.set_tag("owner", "team")
+            mr.get_model("mnist", version=1)
+
+            # Assert
+            assert (
+                hopsworks_backend.count_requests("GET", "models/mnist_1")
+                == num_requests + 1
+            )
+        finally:
+            metadata_cache.stop()
+
+    def test_get_deployment_invalidated_on_delete(
+        self, hopsworks_connection, hopsworks_backend, backend_fixtures
+    ):
+        # Arrange
+        deployment_json = copy.deepcopy(
+            backend_fixtures["predictor"]["get_deployments_singleton"]["response"][
+                "items"
+            ][0]
+        )
+        deployment_json.update({"id": None, "name": "mnist"})
+        hopsworks_backend._put_deployment(deployment_json)
+        ms = hopsworks_connection.get_model_serving()
+        metadata_cache.init({"ttl": 60})
+        try:
+            num_requests = hopsworks_backend.count_requests("GET", "serving")
+            deployment = ms.get_deployment("mnist")
+            ms.get_deployment("mnist")
+            num_requests = (
+                hopsworks_backend.count_requests("GET", "serving") - num_requests
+            )
+
+            # Act
+            deployment.delete()
+
+            # Assert
+            assert num_requests == 1
+            with pytest.raises(RestAPIError):
+                ms.get_deployment("mnist")
+        finally:
+            metadata_cache.stop()
+
+    def test_reset_changes_refreshes_cache(
+        self, hopsworks_connection, hopsworks_backend, backend_fixtures
+    ):
+        # Arrange
+        deployment_json = copy.deepcopy(
+            backend_fixtures["predictor"]["get_deployments_singleton"]["response"][
+                "items"
+            ][0]
+        )
+        deployment_json.update({"id": None, "name": "mnist"})
+        deployment_id = hopsworks_backend._put_deployment(deployment_json)["id"]
+        ms = hopsworks_connection.get_model_serving()
+        metadata_cache.init({"ttl": 60})
+        try:
+            deployment = ms.get_deployment("mnist")
+            ms.get_deployment_by_id(deployment_id)
+            hopsworks_backend.deployments[deployment_id]["description"] = "changed"
+
+            # Act
+            serving_api.ServingApi().reset_changes(deployment)
+            num_requests = hopsworks_backend.count_requests("GET", "serving")
+
+            # Assert
+            assert ms.get_deployment("mnist").description == "changed"
+            assert ms.get_deployment_by_id(deployment_id).description == "changed"
+            assert hopsworks_backend.count_requests("GET", "serving") == num_requests
+        finally:
+            metadata_cache.stop()
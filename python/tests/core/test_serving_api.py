@@ -0,0 +1,92 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import requests
+from hsml.constants import INFERENCE_ENDPOINTS
+from hsml.core import serving_api
+from requests.structures import CaseInsensitiveDict
+
+
+class TestServingApi:
+    # send_inference_request
+
+    def _running_deployment(self, mocker, hopsworks_backend, compression_configuration):
+        deployment_json = hopsworks_backend._put_deployment({"name": "mnist"})
+        deployment_json["status"] = "Running"
+        mock_deployment = mocker.MagicMock()
+        mock_deployment.name = "mnist"
+        mock_deployment.api_protocol = INFERENCE_ENDPOINTS.API_PROTOCOL_REST
+        mock_deployment.compression_configuration = compression_configuration
+        return mock_deployment
+
+    def test_send_inference_request_compressed(
+        self, mocker, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        mock_deployment = self._running_deployment(
+            mocker, hopsworks_backend, {"algorithm": "gzip", "min_size": 1024}
+        )
+        instances = [[float(i) for i in range(100)]] * 10
+
+        # Act
+        response = serving_api.ServingApi().send_inference_request(
+            mock_deployment, {"instances": instances}, through_hopsworks=True
+        )
+
+        # Assert
+        assert response == {"predictions": instances}
+        headers = hopsworks_backend.requests[-1][3]
+        assert headers["content-encoding"] == "gzip"
+        assert headers["accept-encoding"].startswith("gzip")
+
+    def test_send_inference_request_below_min_size(
+        self, mocker, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        mock_deployment = self._running_deployment(
+            mocker, hopsworks_backend, {"algorithm": "gzip", "min_size": 1024}
+        )
+
+        # Act
+        response = serving_api.ServingApi().send_inference_request(
+            mock_deployment, {"instances": [[1, 2]]}, through_hopsworks=True
+        )
+
+        # Assert
+        assert response == {"predictions": [[1, 2]]}
+        assert "content-encoding" not in hopsworks_backend.requests[-1][3]
+
+    def test_send_inference_request_uncompressed(
+        self, mocker, hopsworks_connection, hopsworks_backend
+    ):
+        # Arrange
+        mock_deployment = self._running_deployment(mocker, hopsworks_backend, None)
+        instances = [[float(i) for i in range(100)]] * 10
+
+        # Act
+        response = serving_api.ServingApi().send_inference_request(
+            mock_deployment, {"instances": instances}, through_hopsworks=True
+        )
+
+        # Assert
+        assert response == {"predictions": instances}
+        headers = CaseInsensitiveDict(hopsworks_backend.requests[-1][3])
+        assert "content-encoding" not in headers
+        # default header of requests
+        assert (
+            headers["accept-encoding"]
+            == requests.utils.default_headers()["Accept-Encoding"]
+        )
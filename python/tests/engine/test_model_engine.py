@@ -0,0 +1,584 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+import threading
+import weakref
+
+import pytest
+from hsml import progress
+from hsml.client.exceptions import ModelRegistryException, RestAPIError
+from hsml.core import dataset_api
+from hsml.engine import local_engine, model_engine
+from hsml.python import signature as python_signature
+from tqdm.auto import tqdm
+
+
+class TestModelEngine:
+    # save / download
+
+    def test_save_download(self, mocker, hopsworks_connection, tmp_path):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        model_dir = tmp_path / "model"
+        (model_dir / "sub").mkdir(parents=True)
+        (model_dir / "model.pkl").write_bytes(b"weights")
+        (model_dir / "sub" / "config.json").write_bytes(b"{}")
+        mr = hopsworks_connection.get_model_registry()
+        model = mr.python.create_model("mnist", metrics={"accuracy": 0.9})
+
+        # Act
+        model.save(str(model_dir))
+        model_meta = mr.get_model("mnist", version=1)
+        local_path = model_meta.download()
+
+        # Assert
+        assert model.version == 1
+        assert model_meta.training_metrics == {"accuracy": 0.9}
+        assert sorted(os.listdir(local_path)) == ["model.pkl", "sub"]
+        with open(os.path.join(local_path, "sub", "config.json"), "rb") as f:
+            assert f.read() == b"{}"
+
+    def test_save_next_version(self, mocker, hopsworks_connection, tmp_path):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(b"weights")
+        mr = hopsworks_connection.get_model_registry()
+        python_signature.create_model("mnist").save(str(model_file))
+
+        # Act
+        model = python_signature.create_model("mnist")
+        model.save(str(model_file))
+
+        # Assert
+        assert model.version == 2
+        assert [m.version for m in mr.get_models("mnist")] == [1, 2]
+
+    def test_save_existing_version(self, mocker, hopsworks_connection, tmp_path):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(b"weights")
+        hopsworks_connection.get_model_registry()
+        python_signature.create_model("mnist", version=3).save(str(model_file))
+
+        # Act
+        with pytest.raises(ModelRegistryException) as e_info:
+            python_signature.create_model("mnist", version=3).save(str(model_file))
+
+        # Assert
+        assert "version 3 already exists" in str(e_info.value)
+
+    def test_save_preflight_requests(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch.object(
+            dataset_api.DatasetApi, "_existing_datasets", weakref.WeakKeyDictionary()
+        )
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(b"weights")
+        hopsworks_connection.get_model_registry()
+        python_signature.create_model("mnist").save(str(model_file))
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        model = python_signature.create_model("mnist")
+        model.save(str(model_file))
+
+        # Assert
+        assert model.version == 2
+        # listing of the model folder, the Models dataset is checked only once
+        preflight_requests = [
+            r[1][3:]
+            for r in hopsworks_backend.requests[num_requests:]
+            if r[0] == "GET" and r[1][3:] in (["Models"], ["Models/mnist"])
+        ]
+        assert preflight_requests == [["Models/mnist"]]
+
+    def test_save_download_paginated(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch.object(dataset_api.DatasetApi, "DEFAULT_LIST_PAGE_SIZE", 2)
+        model_dir = tmp_path / "model"
+        model_dir.mkdir()
+        for i in range(5):
+            (model_dir / "file_{}".format(i)).write_bytes(b"content")
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/model")
+        for i in range(5):
+            d_api.upload(str(model_dir / "file_{}".format(i)), "Resources/model")
+        mr = hopsworks_connection.get_model_registry()
+
+        # Act
+        python_signature.create_model("mnist").save("Resources/model")
+        local_path = mr.get_model("mnist", version=1).download()
+
+        # Assert
+        assert sorted(os.listdir(local_path)) == ["file_{}".format(i) for i in range(5)]
+        assert not d_api.path_exists("Resources/model/file_0")
+
+    def _create_hopsfs_model(self, tmp_path, n_files):
+        model_dir = tmp_path / "model"
+        model_dir.mkdir()
+        d_api = dataset_api.DatasetApi()
+        d_api.mkdir("Resources/model")
+        for i in range(n_files):
+            (model_dir / "file_{}".format(i)).write_bytes(b"content")
+            d_api.upload(str(model_dir / "file_{}".format(i)), "Resources/model")
+        return d_api
+
+    @pytest.mark.parametrize("keep_original_files", [True, False])
+    def test_save_hopsfs_dir_entries(
+        self,
+        mocker,
+        hopsworks_connection,
+        hopsworks_backend,
+        tmp_path,
+        keep_original_files,
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mr = hopsworks_connection.get_model_registry()
+        d_api = self._create_hopsfs_model(tmp_path, 5)
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        python_signature.create_model("mnist").save(
+            "Resources/model", keep_original_files=keep_original_files
+        )
+        local_path = mr.get_model("mnist", version=1).download()
+
+        # Assert
+        action = "copy" if keep_original_files else "move"
+        requests = hopsworks_backend.requests[num_requests:]
+        assert [
+            r[2]["action"][0]
+            for r in requests
+            if r[0] == "POST" and r[2].get("action", [None])[0] in ("copy", "move")
+        ] == [action] * 5
+        # the model version folder is kept, with its permissions
+        assert not [r for r in requests if r[0] == "DELETE"]
+        assert sorted(os.listdir(local_path)) == ["file_{}".format(i) for i in range(5)]
+        # the source directory is kept, emptied when moving its entries
+        assert d_api.path_exists("Resources/model")
+        assert d_api.path_exists("Resources/model/file_0") == keep_original_files
+
+    def _create_local_model(self, tmp_path, n_files):
+        model_dir = tmp_path / "model"
+        (model_dir / "sub").mkdir(parents=True)
+        (model_dir / "empty").mkdir()
+        for i in range(n_files):
+            (model_dir / "sub" / "file_{}".format(i)).write_bytes(b"content")
+        return model_dir
+
+    def test_save_archive(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mr = hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 5)
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        python_signature.create_model("mnist").save(
+            str(model_dir), upload_configuration={"mode": "archive"}
+        )
+        local_path = mr.get_model("mnist", version=1).download()
+
+        # Assert
+        uploads = [
+            r
+            for r in hopsworks_backend.requests[num_requests:]
+            if r[1][3:4] == ["upload"]
+        ]
+        assert len(uploads) == 1
+        assert sorted(os.listdir(local_path)) == ["empty", "sub"]
+        assert sorted(os.listdir(os.path.join(local_path, "sub"))) == [
+            "file_{}".format(i) for i in range(5)
+        ]
+        # the archive is extracted outside of the model folder, and removed
+        assert dataset_api.DatasetApi().list("Models/mnist")["count"] == 1
+        assert dataset_api.DatasetApi().list("Resources")["count"] == 0
+
+    def test_save_archive_delayed_unzip(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mr = hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 5)
+        archive = type(hopsworks_backend)._archive
+        pending = []
+
+        def deferred_unzip(self, path, destination_path, action):
+            if action == "zip":
+                return archive(self, path, destination_path, action)
+            pending.append(lambda: archive(self, path, destination_path, action))
+            return 204, None
+
+        mocker.patch.object(
+            type(hopsworks_backend),
+            "_archive",
+            autospec=True,
+            side_effect=deferred_unzip,
+        )
+        get = dataset_api.DatasetApi.get
+        status_requests = []
+
+        def get_starting_unzip(self, path):
+            # the state is still NONE on the first status request, the extraction is
+            # in progress on the second one and complete on the third one
+            if not path.endswith(".zip") or not pending:
+                return get(self, path)
+            status_requests.append(path)
+            if len(status_requests) == 2:
+                return dict(get(self, path), zipState="UNZIPPING")
+            if len(status_requests) == 3:
+                pending.pop()()
+            return get(self, path)
+
+        mocker.patch.object(
+            dataset_api.DatasetApi,
+            "get",
+            autospec=True,
+            side_effect=get_starting_unzip,
+        )
+
+        # Act
+        python_signature.create_model("mnist").save(
+            str(model_dir), upload_configuration={"mode": "archive"}
+        )
+        local_path = mr.get_model("mnist", version=1).download(mode="files")
+
+        # Assert
+        assert sorted(os.listdir(os.path.join(local_path, "sub"))) == [
+            "file_{}".format(i) for i in range(5)
+        ]
+
+    @pytest.mark.parametrize("archive_min_files, expected_uploads", [(5, 1), (6, 5)])
+    def test_save_auto_mode(
+        self,
+        mocker,
+        hopsworks_connection,
+        hopsworks_backend,
+        tmp_path,
+        archive_min_files,
+        expected_uploads,
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch("hsml.constants.MODEL_FILES.ARCHIVE_MIN_FILES", archive_min_files)
+        hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 5)
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        python_signature.create_model("mnist").save(str(model_dir))
+
+        # Assert
+        uploads = [
+            r
+            for r in hopsworks_backend.requests[num_requests:]
+            if r[1][3:4] == ["upload"]
+        ]
+        assert len(uploads) == expected_uploads
+
+    def test_save_invalid_mode(self, mocker, hopsworks_connection, tmp_path):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 1)
+
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            python_signature.create_model("mnist").save(
+                str(model_dir), upload_configuration={"mode": "tar"}
+            )
+
+        # Assert
+        assert "Mode 'tar' is not supported" in str(e_info.value)
+
+    @pytest.mark.parametrize("mode", ["archive", "auto"])
+    def test_download_archive(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path, mode
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch("hsml.constants.MODEL_FILES.ARCHIVE_MIN_FILES", 5)
+        mr = hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 5)
+        python_signature.create_model("mnist").save(
+            str(model_dir), upload_configuration={"mode": "files"}
+        )
+        model = mr.get_model("mnist", version=1)
+        dataset_api.DatasetApi().mkdir(model.version_path + "/Artifacts")
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        local_path = model.download(mode=mode)
+
+        # Assert
+        downloads = [
+            r
+            for r in hopsworks_backend.requests[num_requests:]
+            if r[1][3:4] == ["download"]
+        ]
+        assert len(downloads) == 1
+        # the archive is created outside of the model folder, and removed
+        assert "/".join(downloads[0][1]).count("/Resources/") == 1
+        assert sorted(os.listdir(local_path)) == ["sub"]
+        with open(os.path.join(local_path, "sub", "file_0"), "rb") as f:
+            assert f.read() == b"content"
+        assert dataset_api.DatasetApi().list("Resources")["count"] == 0
+        assert not dataset_api.DatasetApi().path_exists("Models/mnist/1.zip")
+
+    def test_download_archive_fallback(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch.object(
+            dataset_api.DatasetApi,
+            "zip",
+            side_effect=RestAPIError("zip", mocker.Mock(status_code=400, json=dict)),
+        )
+        mr = hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 3)
+        python_signature.create_model("mnist").save(str(model_dir))
+
+        # Act
+        local_path = mr.get_model("mnist", version=1).download(mode="archive")
+
+        # Assert
+        assert sorted(os.listdir(local_path)) == ["empty", "sub"]
+        assert len(os.listdir(os.path.join(local_path, "sub"))) == 3
+
+    def test_download_archive_timeout(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch.object(
+            dataset_api.DatasetApi,
+            "_wait_for_archive",
+            side_effect=TimeoutError("Timeout of 0 seconds exceeded"),
+        )
+        mr = hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 3)
+        python_signature.create_model("mnist").save(str(model_dir))
+
+        # Act
+        local_path = mr.get_model("mnist", version=1).download(mode="archive")
+
+        # Assert
+        assert len(os.listdir(os.path.join(local_path, "sub"))) == 3
+        assert dataset_api.DatasetApi().list("Resources")["count"] == 0
+
+    def test_download_archive_concurrent(
+        self, mocker, hopsworks_connection, hopsworks_backend, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mr = hopsworks_connection.get_model_registry()
+        model_dir = self._create_local_model(tmp_path, 3)
+        python_signature.create_model("mnist").save(str(model_dir))
+        model = mr.get_model("mnist", version=1)
+        barrier = threading.Barrier(2, timeout=10)
+        download = local_engine.LocalEngine.download
+
+        def download_both(self, remote_path, local_path, progress_callback=None):
+            download(self, remote_path, local_path, progress_callback)
+            # both archives are downloaded before any of them is removed
+            barrier.wait()
+
+        mocker.patch.object(local_engine.LocalEngine, "download", download_both)
+        results = []
+
+        def download_model():
+            results.append(model.download(mode="archive"))
+
+        threads = [threading.Thread(target=download_model) for _ in range(2)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(results) == 2
+        for local_path in results:
+            assert len(os.listdir(os.path.join(local_path, "sub"))) == 3
+        model_path = hopsworks_backend._local_path(
+            hopsworks_backend._hdfs_path("Models/mnist")
+        )
+        assert os.listdir(model_path) == ["1"]
+
+    # save_async
+
+    def test_save_async_progress(self, mocker, hopsworks_connection, tmp_path):
+        # Arrange
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(os.urandom(3 * 1024 * 1024 + 1))
+        hopsworks_connection.get_model_registry()
+        events = []
+
+        # Act
+        future = python_signature.create_model("mnist").save_async(
+            str(model_file),
+            upload_configuration={"chunk_size": 1},
+            progress_callback=events.append,
+        )
+        model = future.result(timeout=30)
+
+        # Assert
+        assert model.version == 1
+        assert [e.step for e in events if isinstance(e, progress.StepEvent)] == list(
+            range(6)
+        )
+        transfers = [e for e in events if isinstance(e, progress.TransferEvent)]
+        assert len(transfers) == 4
+        assert sum(e.n_bytes for e in transfers) == 3 * 1024 * 1024 + 1
+        assert transfers[0].path.endswith("/Models/mnist/1/model.pkl")
+        # the model is registered on the first check
+        mock_sleep.assert_not_called()
+
+    def test_save_async_input_examples(self, mocker, hopsworks_connection, tmp_path):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(b"weights")
+        mr = hopsworks_connection.get_model_registry()
+        upload = local_engine.LocalEngine.upload
+        # both input examples are written before any of them is uploaded
+        barrier = threading.Barrier(2, timeout=10)
+
+        def upload_after_barrier(self, local_path, remote_path, **kwargs):
+            if os.path.basename(local_path) == "input_example.json":
+                barrier.wait()
+            return upload(self, local_path, remote_path, **kwargs)
+
+        mocker.patch.object(
+            local_engine.LocalEngine,
+            "upload",
+            autospec=True,
+            side_effect=upload_after_barrier,
+        )
+
+        # Act
+        futures = [
+            python_signature.create_model(name, input_example=[i]).save_async(
+                str(model_file)
+            )
+            for i, name in enumerate(["mnist", "iris"])
+        ]
+        for future in futures:
+            future.result(timeout=30)
+
+        # Assert
+        assert mr.get_model("mnist", version=1).input_example == [0]
+        assert mr.get_model("iris", version=1).input_example == [1]
+
+    def test_save_async_error(self, hopsworks_connection, tmp_path):
+        # Arrange
+        hopsworks_connection.get_model_registry()
+
+        # Act
+        future = python_signature.create_model("mnist").save_async(
+            str(tmp_path / "missing")
+        )
+
+        # Assert
+        with pytest.raises(IOError) as e_info:
+            future.result(timeout=30)
+        assert "Could not find path" in str(e_info.value)
+
+    def test_poll_model_available_backoff(self, mocker):
+        # Arrange
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        engine = model_engine.ModelEngine()
+        model_meta = mocker.Mock()
+        not_found = RestAPIError("get", mocker.Mock(status_code=404, json=dict))
+        mocker.patch.object(
+            engine._model_api, "get", side_effect=[not_found, not_found, model_meta]
+        )
+
+        # Act
+        result = engine._poll_model_available(mocker.Mock(), await_registration=10)
+
+        # Assert
+        assert result == model_meta
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    # progress callbacks
+
+    def test_save_download_metrics_progress(
+        self, mocker, hopsworks_connection, tmp_path
+    ):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch("hsml.core.dataset_api.time.sleep")
+        mock_tqdm = mocker.patch("hsml.engine.model_engine.tqdm", wraps=tqdm)
+        model_file = tmp_path / "model.pkl"
+        model_file.write_bytes(os.urandom(2 * 1024 * 1024))
+        mr = hopsworks_connection.get_model_registry()
+        upload_request = dataset_api.DatasetApi._upload_request
+        failures = [RestAPIError("upload", mocker.Mock(status_code=503, json=dict))]
+
+        def fail_once(self, *args):
+            if failures:
+                raise failures.pop()
+            return upload_request(self, *args)
+
+        mocker.patch.object(
+            dataset_api.DatasetApi,
+            "_upload_request",
+            autospec=True,
+            side_effect=fail_once,
+        )
+        save_metrics = progress.MetricsProgress()
+        download_metrics = progress.MetricsProgress()
+
+        # Act
+        python_signature.create_model("mnist").save(
+            str(model_file),
+            upload_configuration={"chunk_size": 1},
+            progress_callback=save_metrics,
+        )
+        mr.get_model("mnist", version=1).download(progress_callback=download_metrics)
+
+        # Assert
+        save = save_metrics.to_dict()
+        assert save["upload"]["bytes"] == 2 * 1024 * 1024
+        assert save["upload"]["chunks"] == 2
+        assert save["retries"] == 1
+        assert list(save["steps"]) == [
+            "Creating model folder",
+            "Uploading model files",
+            "Uploading input_example and model_schema",
+            "Registering model",
+            "Waiting for model registration",
+            "Model export complete",
+        ]
+        assert download_metrics.to_dict()["download"]["bytes"] == 2 * 1024 * 1024
+        assert mock_tqdm.call_args.kwargs["disable"]
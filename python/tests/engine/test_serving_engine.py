@@ -0,0 +1,316 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import itertools
+
+import numpy as np
+import pytest
+from hsml.client.exceptions import ModelServingException
+from hsml.constants import INFERENCE_ENDPOINTS as IE
+from hsml.constants import PREDICTOR_STATE
+from hsml.engine import serving_engine
+from hsml.utils.schema.input_validator import InputValidator
+
+
+class TestServingEngine:
+    def _deployment(self, mocker, statuses):
+        mocker.patch.object(
+            serving_engine.ServingEngine, "_get_available_instances", return_value=0
+        )
+        deployment = mocker.Mock()
+        deployment.get_state.side_effect = [
+            mocker.Mock(status=status, condition=mocker.Mock(reason="OOMKilled"))
+            for status in statuses
+        ]
+        return deployment
+
+    # _poll_deployment_status
+
+    def test_poll_deployment_status_immediate(self, mocker):
+        # Arrange
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        deployment = self._deployment(mocker, [PREDICTOR_STATE.STATUS_RUNNING])
+        mock_update_progress = mocker.Mock()
+
+        # Act
+        state = serving_engine.ServingEngine()._poll_deployment_status(
+            deployment, PREDICTOR_STATE.STATUS_RUNNING, 60, mock_update_progress
+        )
+
+        # Assert
+        assert state.status == PREDICTOR_STATE.STATUS_RUNNING
+        mock_update_progress.assert_called_once_with(state, 0)
+        mock_sleep.assert_not_called()
+
+    def test_poll_deployment_status_backoff(self, mocker):
+        # Arrange
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        deployment = self._deployment(
+            mocker,
+            [
+                PREDICTOR_STATE.STATUS_FAILED,  # status of a previous run
+                PREDICTOR_STATE.STATUS_STARTING,
+                PREDICTOR_STATE.STATUS_STARTING,
+                PREDICTOR_STATE.STATUS_RUNNING,
+            ],
+        )
+
+        # Act
+        state = serving_engine.ServingEngine()._poll_deployment_status(
+            deployment, PREDICTOR_STATE.STATUS_RUNNING, 60
+        )
+
+        # Assert
+        assert state.status == PREDICTOR_STATE.STATUS_RUNNING
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 1, 2]
+
+    def test_poll_deployment_status_failed(self, mocker):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        deployment = self._deployment(
+            mocker,
+            [PREDICTOR_STATE.STATUS_STARTING, PREDICTOR_STATE.STATUS_FAILED],
+        )
+
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            serving_engine.ServingEngine()._poll_deployment_status(
+                deployment, PREDICTOR_STATE.STATUS_RUNNING, 60
+            )
+
+        # Assert
+        assert "OOMKilled" in str(e_info.value)
+
+    def test_poll_deployment_status_timeout(self, mocker):
+        # Arrange
+        clock = itertools.count(step=4)
+        mocker.patch("hsml.polling.time.monotonic", side_effect=lambda: next(clock))
+        mocker.patch("hsml.polling.time.sleep")
+        deployment = self._deployment(mocker, [PREDICTOR_STATE.STATUS_STOPPING] * 10)
+
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            serving_engine.ServingEngine()._poll_deployment_status(
+                deployment, PREDICTOR_STATE.STATUS_STOPPED, 10
+            )
+
+        # Assert
+        assert "set a higher value for await_stopped" in str(e_info.value)
+        assert deployment.get_state.call_count == 3
+
+    # start
+
+    def test_start_progress_callback(self, mocker):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mock_tqdm = mocker.patch("hsml.engine.serving_engine.tqdm")
+        mocker.patch.object(
+            serving_engine.ServingEngine, "_get_available_instances", return_value=1
+        )
+
+        def state(status, condition_type, reason):
+            return mocker.Mock(
+                status=status, condition=mocker.Mock(type=condition_type, reason=reason)
+            )
+
+        stopped = state(
+            PREDICTOR_STATE.STATUS_STOPPED,
+            PREDICTOR_STATE.CONDITION_TYPE_STOPPED,
+            "Stopped",
+        )
+        mocker.patch.object(
+            serving_engine.ServingEngine,
+            "_check_status",
+            return_value=(False, stopped),
+        )
+        deployment = mocker.Mock(transformer=None, requested_instances=1)
+        deployment.get_state.side_effect = [
+            state(
+                PREDICTOR_STATE.STATUS_STARTING,
+                PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED,
+                "Scheduling",
+            ),
+            state(
+                PREDICTOR_STATE.STATUS_RUNNING,
+                PREDICTOR_STATE.CONDITION_TYPE_READY,
+                "Ready",
+            ),
+        ]
+        engine = serving_engine.ServingEngine()
+        engine._serving_api = mocker.Mock()
+        events = []
+
+        # Act
+        engine.start(deployment, await_status=60, progress_callback=events.append)
+
+        # Assert
+        assert [(type(e).__name__, e.step, e.description) for e in events] == [
+            ("StepEvent", PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED, "Scheduling"),
+            (
+                "StepCompletedEvent",
+                PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED,
+                "Scheduling",
+            ),
+            ("StepEvent", PREDICTOR_STATE.CONDITION_TYPE_READY, "Ready"),
+            ("StepCompletedEvent", PREDICTOR_STATE.CONDITION_TYPE_READY, "Ready"),
+        ]
+        assert mock_tqdm.call_args.kwargs["disable"]
+
+    # stop
+
+    def test_stop_progress_callback(self, mocker):
+        # Arrange
+        mocker.patch("hsml.polling.time.sleep")
+        mocker.patch("hsml.engine.serving_engine.tqdm")
+        mocker.patch.object(
+            serving_engine.ServingEngine, "_get_available_instances", return_value=0
+        )
+
+        def state(status, condition_type, reason):
+            return mocker.Mock(
+                status=status,
+                condition=mocker.Mock(type=condition_type, reason=reason, status=None),
+            )
+
+        running = state(
+            PREDICTOR_STATE.STATUS_RUNNING,
+            PREDICTOR_STATE.CONDITION_TYPE_READY,
+            "Ready",
+        )
+        mocker.patch.object(
+            serving_engine.ServingEngine,
+            "_check_status",
+            return_value=(False, running),
+        )
+        deployment = mocker.Mock(transformer=None, requested_instances=1)
+        deployment.get_state.side_effect = [
+            state(
+                PREDICTOR_STATE.STATUS_STOPPING,
+                PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED,
+                "Stopping",
+            ),
+            state(
+                PREDICTOR_STATE.STATUS_STOPPED,
+                PREDICTOR_STATE.CONDITION_TYPE_STOPPED,
+                "Stopped",
+            ),
+        ]
+        engine = serving_engine.ServingEngine()
+        engine._serving_api = mocker.Mock()
+        events = []
+
+        # Act
+        engine.stop(deployment, await_status=60, progress_callback=events.append)
+
+        # Assert
+        assert [(type(e).__name__, e.step, e.description) for e in events] == [
+            ("StepEvent", PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED, "Stopping"),
+            (
+                "StepCompletedEvent",
+                PREDICTOR_STATE.CONDITION_TYPE_SCHEDULED,
+                "Stopping",
+            ),
+            (
+                "StepEvent",
+                PREDICTOR_STATE.CONDITION_TYPE_STOPPED,
+                "Deployment is stopped",
+            ),
+            (
+                "StepCompletedEvent",
+                PREDICTOR_STATE.CONDITION_TYPE_STOPPED,
+                "Deployment is stopped",
+            ),
+        ]
+
+    # predict
+
+    def _predict_deployment(self, mocker, api_protocol):
+        return mocker.Mock(
+            api_protocol=api_protocol,
+            predictor=mocker.Mock(serving_tool="KSERVE"),
+            model_name="mnist",
+            model_version=1,
+        )
+
+    def test_predict_input_validator_rest(self, mocker):
+        # Arrange
+        deployment = self._predict_deployment(mocker, IE.API_PROTOCOL_REST)
+        engine = serving_engine.ServingEngine()
+        engine._serving_api = mocker.Mock()
+        validator = InputValidator(
+            {"input_schema": {"tensor_schema": {"type": "float32", "shape": "(5, 2)"}}}
+        )
+
+        # Act
+        engine.predict(
+            deployment, None, np.ones((2, 2), dtype="int64"), input_validator=validator
+        )
+
+        # Assert
+        engine._serving_api.send_inference_request.assert_called_once_with(
+            deployment, {"instances": [[1, 1], [1, 1]]}, False
+        )
+
+    def test_predict_input_validator_grpc(self, mocker):
+        # Arrange
+        deployment = self._predict_deployment(mocker, IE.API_PROTOCOL_GRPC)
+        engine = serving_engine.ServingEngine()
+        engine._serving_api = mocker.Mock()
+        validator = InputValidator(
+            {"input_schema": {"tensor_schema": {"type": "float32", "shape": "(5, 2)"}}}
+        )
+
+        # Act
+        engine.predict(
+            deployment, None, np.ones((3, 2), dtype="int64"), input_validator=validator
+        )
+
+        # Assert
+        infer_inputs = engine._serving_api.send_inference_request.call_args.args[1]
+        assert [(i.name, i.shape, i.datatype) for i in infer_inputs] == [
+            ("input-0", [3, 2], "FP32")
+        ]
+
+    def test_predict_input_validator_invalid(self, mocker):
+        # Arrange
+        deployment = self._predict_deployment(mocker, IE.API_PROTOCOL_GRPC)
+        engine = serving_engine.ServingEngine()
+        engine._serving_api = mocker.Mock()
+        validator = InputValidator(
+            {"input_schema": {"tensor_schema": {"type": "float32", "shape": "(5, 2)"}}}
+        )
+
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            engine.predict(deployment, None, np.ones(3), input_validator=validator)
+
+        # Assert
+        assert "expected shape (-1, 2), got (3,)" in str(e_info.value)
+        engine._serving_api.send_inference_request.assert_not_called()
+
+    # get_input_validator
+
+    def test_get_input_validator_no_schema(self, mocker):
+        # Arrange
+        deployment = self._predict_deployment(mocker, IE.API_PROTOCOL_REST)
+        deployment.get_model.return_value = mocker.Mock(model_schema=None)
+
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            serving_engine.ServingEngine().get_input_validator(deployment)
+
+        # Assert
+        assert "Model `mnist` version `1` has no input schema" in str(e_info.value)
@@ -0,0 +1,691 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+"""In-process stand-in for the Hopsworks REST API.
+
+The backend is a `requests` transport adapter. Once installed, every request sent
+by a `requests.Session` to the backend host is served in-process from a temporary
+directory, so the regular `hsml.connection(...)` flow, the REST clients and the
+core APIs run unchanged against it.
+
+It covers the endpoints used by the SDK for projects, datasets (flow upload,
+download, listing, mkdir, copy, move, zip, unzip, tags), model registries
+and model serving. Latency and bandwidth can be shaped to measure throughput.
+"""
+
+import email.parser
+import email.policy
+import gzip
+import http.client
+import io
+import json
+import os
+import shutil
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from unittest import mock
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import pytest
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+
+
+class BackendError(Exception):
+    """Error raised by a handler, converted into a Hopsworks error response."""
+
+    def __init__(self, status_code, error_code, message):
+        super().__init__(message)
+        self.status_code = status_code
+        self.error_code = error_code
+        self.message = message
+
+
+class _ThrottledReader(io.RawIOBase):
+    """File-like object limiting the read throughput of a response body."""
+
+    def __init__(self, fileobj, bandwidth):
+        self._fileobj = fileobj
+        self._bandwidth = bandwidth
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        data = self._fileobj.read(size)
+        if self._bandwidth and data:
+            time.sleep(len(data) / self._bandwidth)
+        return data
+
+    def close(self):
+        self._fileobj.close()
+        super().close()
+
+
+class HopsworksBackend(requests.adapters.BaseAdapter):
+    """Fake Hopsworks backend storing datasets in a local directory.
+
+    # Arguments
+        root_dir: Local directory backing the Hopsworks file system.
+        host: Hostname the backend answers to.
+        port: Port the backend answers to.
+        project: Name of the project.
+        project_id: Id of the project.
+        latency: Seconds added to every request.
+        bandwidth: Maximum throughput in bytes per second for request and response
+            bodies, `None` for unlimited.
+        kserve_installed: Whether KServe is reported as installed. If so, an Istio
+            load balancer endpoint is served by the same backend.
+    """
+
+    BASE_PATH_PARAMS = ["hopsworks-api", "api"]
+    ISTIO_PORT = 8080
+    # json responses of at least this size are gzipped, if accepted by the client
+    COMPRESSION_MIN_SIZE = 1024
+
+    ERROR_CODE_NOT_AUTHORIZED = 200003
+    ERROR_CODE_DATASET_NOT_FOUND = 110018
+    ERROR_CODE_DATASET_ALREADY_EXISTS = 110019
+    ERROR_CODE_MODEL_NOT_FOUND = 360000
+    ERROR_CODE_SERVING_NOT_FOUND = 240000
+
+    def __init__(
+        self,
+        root_dir,
+        host="hopsworks.test",
+        port=443,
+        project="test_project",
+        project_id=119,
+        latency=0.0,
+        bandwidth=None,
+        kserve_installed=False,
+    ):
+        super().__init__()
+        self.root_dir = root_dir
+        self.host = host
+        self.port = port
+        self.project = project
+        self.project_id = project_id
+        self.latency = latency
+        self.bandwidth = bandwidth
+        self.kserve_installed = kserve_installed
+        # if set, requests with a different Authorization header are rejected with 401
+        self.authorization = None
+
+        # (method, path, query params, headers) of every request served
+        self.requests = []
+        self.models = {}  # {registry id: {name_version: model json}}
+        self.deployments = {}  # {id: deployment json}
+        self.tags = {}  # {(kind, key): {name: value}}
+        self.variables = {
+            "kube_kserve_installed": "true" if kserve_installed else "false",
+            "kube_serving_max_cores_allocation": "-1",
+            "kube_serving_max_memory_allocation": "-1",
+            "kube_serving_max_gpus_allocation": "-1",
+            "kube_serving_min_num_instances": "-1",
+            "kube_serving_max_num_instances": "-1",
+            "kube_knative_domain_name": "hopsworks.test",
+        }
+
+        self._lock = threading.RLock()
+        self._next_deployment_id = 1
+
+        self.create_dataset("Models")
+        self.create_dataset("Resources")
+
+    # Setup
+
+    @property
+    def base_url(self):
+        return "https://{}:{}".format(self.host, self.port)
+
+    @property
+    def istio_base_url(self):
+        return "http://{}:{}".format(self.host, self.ISTIO_PORT)
+
+    def create_dataset(self, name, project=None):
+        """Create a top-level dataset in a project of the backend."""
+        os.makedirs(
+            os.path.join(self.root_dir, "Projects", project or self.project, name),
+            exist_ok=True,
+        )
+
+    @contextmanager
+    def install(self):
+        """Route the requests sent to the backend host through this adapter."""
+        get_adapter = requests.Session.get_adapter
+        backend = self
+
+        def _get_adapter(session, url):
+            if urlsplit(url).hostname == backend.host:
+                return backend
+            return get_adapter(session, url)
+
+        with mock.patch.object(requests.Session, "get_adapter", _get_adapter):
+            yield self
+
+    def count_requests(self, method=None, contains=None):
+        """Count the requests served, optionally filtering by method and path."""
+        return len(
+            [
+                r
+                for r in self.requests
+                if (method is None or r[0] == method)
+                and (contains is None or contains in "/".join(r[1]))
+            ]
+        )
+
+    # Transport adapter
+
+    def send(
+        self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None
+    ):
+        url = urlsplit(request.url)
+        segments = [unquote(s) for s in url.path.split("/") if s]
+        if segments[: len(self.BASE_PATH_PARAMS)] == self.BASE_PATH_PARAMS:
+            segments = segments[len(self.BASE_PATH_PARAMS) :]
+        query = parse_qs(url.query, keep_blank_values=True)
+
+        body = request.body or b""
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if request.headers.get("Content-Encoding") == "gzip":
+            body = gzip.decompress(body)
+
+        with self._lock:
+            self.requests.append(
+                (request.method, segments, query, dict(request.headers))
+            )
+
+        if self.latency:
+            time.sleep(self.latency)
+        if self.bandwidth and body:
+            time.sleep(len(body) / self.bandwidth)
+
+        try:
+            if (
+                self.authorization is not None
+                and request.headers.get("Authorization") != self.authorization
+            ):
+                raise BackendError(
+                    401, self.ERROR_CODE_NOT_AUTHORIZED, "Invalid or expired token"
+                )
+            status_code, payload = self._dispatch(
+                request.method, segments, query, request.headers, body
+            )
+        except BackendError as be:
+            status_code, payload = (
+                be.status_code,
+                {
+                    "errorCode": be.error_code,
+                    "errorMsg": be.message,
+                    "usrMsg": "",
+                },
+            )
+        return self._build_response(request, status_code, payload)
+
+    def close(self):
+        pass
+
+    def _build_response(self, request, status_code, payload):
+        response = requests.Response()
+        response.status_code = status_code
+        response.reason = http.client.responses.get(status_code, "")
+        response.url = request.url
+        response.request = request
+        response.encoding = "utf-8"
+        if isinstance(payload, io.IOBase):
+            response.headers = CaseInsensitiveDict(
+                {"Content-Type": "application/octet-stream"}
+            )
+            raw = payload
+        else:
+            response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+            content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+            if len(
+                content
+            ) >= self.COMPRESSION_MIN_SIZE and "gzip" in request.headers.get(
+                "Accept-Encoding", ""
+            ):
+                content = gzip.compress(content)
+                response.headers["Content-Encoding"] = "gzip"
+            raw = io.BytesIO(content)
+        # decodes the body according to the headers, as for real responses
+        response.raw = urllib3.HTTPResponse(
+            body=_ThrottledReader(raw, self.bandwidth),
+            headers=response.headers,
+            status=status_code,
+            preload_content=False,
+            decode_content=True,
+        )
+        return response
+
+    def _dispatch(self, method, segments, query, headers, body):
+        if segments[:1] == ["variables"]:
+            return 200, {"successMessage": self.variables[segments[1]]}
+        if segments[:2] == ["project", "getProjectInfo"]:
+            return 200, {"projectId": self.project_id, "projectName": segments[2]}
+        if segments[:1] == ["v1"]:  # istio
+            return self._predict(segments[2], body)
+        if segments[:1] != ["project"] or len(segments) < 3:
+            raise BackendError(404, 0, "Unknown endpoint " + "/".join(segments))
+
+        resource, params = segments[2], segments[3:]
+        if resource == "dataset":
+            return self._dataset(method, params, query, headers, body)
+        if resource == "modelregistries":
+            return self._model_registries(method, params, query, body)
+        if resource == "serving":
+            return self._serving(method, params, query, body)
+        if resource == "inference":
+            if params[0] == "endpoints":
+                return 200, self._inference_endpoints()
+            return self._predict(params[-1], body)
+        raise BackendError(404, 0, "Unknown endpoint " + "/".join(segments))
+
+    # Datasets
+
+    def _hdfs_path(self, path):
+        if path.startswith("hdfs://"):
+            path = path[path.find("/Projects") :]
+        if "::" in path:
+            project, path = path.split("::", 1)
+            path = "/Projects/{}/{}".format(project, path)
+        elif not path.startswith("/Projects"):
+            path = "/Projects/{}/{}".format(self.project, path)
+        return "/" + "/".join(p for p in path.split("/") if p)
+
+    def _local_path(self, hdfs_path):
+        return os.path.join(self.root_dir, *hdfs_path.split("/"))
+
+    def _get_existing(self, path):
+        hdfs_path = self._hdfs_path(path)
+        local_path = self._local_path(hdfs_path)
+        if not os.path.exists(local_path):
+            raise BackendError(
+                404, self.ERROR_CODE_DATASET_NOT_FOUND, "Path not found: " + hdfs_path
+            )
+        return hdfs_path, local_path
+
+    def _stat(self, hdfs_path):
+        local_path = self._local_path(hdfs_path)
+        is_dir = os.path.isdir(local_path)
+        item = {
+            "attributes": {
+                "name": os.path.basename(hdfs_path),
+                "path": hdfs_path,
+                "dir": is_dir,
+                "size": 0 if is_dir else os.path.getsize(local_path),
+                "modificationTime": int(os.path.getmtime(local_path) * 1000),
+            },
+            "zipState": "NONE",
+        }
+        if len(hdfs_path.split("/")) == 4:  # /Projects/{project}/{dataset}
+            item["datasetType"] = "DATASET"
+        return item
+
+    def _list(self, hdfs_path, query):
+        local_path = self._local_path(hdfs_path)
+        names = os.listdir(local_path)
+        sort_by = (query.get("sort_by") or [""])[0] or ""
+        names.sort(reverse=sort_by.lower().endswith(":desc"))
+        offset = int((query.get("offset") or [0])[0])
+        limit = int((query.get("limit") or [len(names)])[0])
+        items = [
+            self._stat(hdfs_path + "/" + name)
+            for name in names[offset : offset + limit]
+        ]
+        return {"count": len(names), "items": items}
+
+    def _dataset(self, method, params, query, headers, body):
+        if params[0] == "upload" and method == "POST":
+            return self._upload(params[1], headers, body)
+        if params[:2] == ["download", "with_auth"]:
+            _, local_path = self._get_existing(params[2])
+            return 200, open(local_path, "rb")
+        if params[0] == "tags":
+            return self._dataset_tags(method, params[1:], body)
+
+        path = params[0]
+        action = (query.get("action") or [None])[0]
+        if method == "GET":
+            hdfs_path, _ = self._get_existing(path)
+            if action == "listing":
+                return 200, self._list(hdfs_path, query)
+            return 200, self._stat(hdfs_path)
+        if method == "DELETE":
+            _, local_path = self._get_existing(path)
+            if os.path.isdir(local_path):
+                shutil.rmtree(local_path)
+            else:
+                os.remove(local_path)
+            return 204, None
+        if method == "PUT" and action == "PERMISSION":
+            hdfs_path, _ = self._get_existing(path)
+            return 200, self._stat(hdfs_path)
+        if method == "POST" and action == "create":
+            hdfs_path = self._hdfs_path(path)
+            local_path = self._local_path(hdfs_path)
+            if os.path.exists(local_path):
+                raise BackendError(
+                    400,
+                    self.ERROR_CODE_DATASET_ALREADY_EXISTS,
+                    "Path already exists: " + hdfs_path,
+                )
+            os.makedirs(local_path)
+            return 201, self._stat(hdfs_path)
+        if method == "POST" and action in ("copy", "move"):
+            return self._copy_or_move(path, query["destination_path"][0], action)
+        if method == "POST" and action in ("zip", "unzip"):
+            destination_path = (query.get("destination_path") or [None])[0]
+            return self._archive(path, destination_path, action)
+        raise BackendError(400, 0, "Unsupported dataset operation")
+
+    def _upload(self, upload_path, headers, body):
+        hdfs_dir, local_dir = self._get_existing(upload_path)
+        msg = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+            b"Content-Type: " + headers["Content-Type"].encode() + b"\r\n\r\n" + body
+        )
+        form = {
+            part.get_param("name", header="content-disposition"): part.get_payload(
+                decode=True
+            )
+            for part in msg.iter_parts()
+        }
+        file_name = form["flowFilename"].decode()
+        chunk_size = int(form["flowChunkSize"])
+        chunk_number = int(form["flowChunkNumber"])
+        local_path = os.path.join(local_dir, file_name)
+        with self._lock:
+            # chunks can arrive in any order, write each one at its offset
+            mode = "r+b" if os.path.exists(local_path) else "wb"
+            with open(local_path, mode) as f:
+                f.seek((chunk_number - 1) * chunk_size)
+                f.write(form["file"])
+        return 200, self._stat(hdfs_dir + "/" + file_name)
+
+    def _copy_or_move(self, source_path, destination_path, action):
+        _, local_source = self._get_existing(source_path)
+        hdfs_destination = self._hdfs_path(destination_path)
+        local_destination = self._local_path(hdfs_destination)
+        if os.path.exists(local_destination):
+            raise BackendError(
+                400,
+                self.ERROR_CODE_DATASET_ALREADY_EXISTS,
+                "Path already exists: " + hdfs_destination,
+            )
+        if action == "move":
+            shutil.move(local_source, local_destination)
+        elif os.path.isdir(local_source):
+            shutil.copytree(local_source, local_destination)
+        else:
+            shutil.copy2(local_source, local_destination)
+        return 204, None
+
+    def _archive(self, path, destination_path, action):
+        hdfs_path, local_path = self._get_existing(path)
+        if action == "zip":
+            target_dir = (
+                self._local_path(self._hdfs_path(destination_path))
+                if destination_path is not None
+                else os.path.dirname(local_path)
+            )
+            zip_path = os.path.join(target_dir, os.path.basename(local_path) + ".zip")
+            root = os.path.dirname(local_path)
+            with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+                if os.path.isdir(local_path):
+                    for dir_path, _, file_names in os.walk(local_path):
+                        for file_name in file_names:
+                            file_path = os.path.join(dir_path, file_name)
+                            zf.write(file_path, os.path.relpath(file_path, root))
+                else:
+                    zf.write(local_path, os.path.basename(local_path))
+        else:
+            with zipfile.ZipFile(local_path) as zf:
+                zf.extractall(os.path.dirname(local_path))
+        return 204, None
+
+    def _dataset_tags(self, method, params, body):
+        if params[0] == "all":
+            return 200, self._tags_response(("dataset", self._hdfs_path(params[1])))
+        # schema/{name}/{path}
+        name, key = params[1], ("dataset", self._hdfs_path(params[2]))
+        return self._tag(method, key, name, body)
+
+    # Tags
+
+    def _tags_response(self, key, name=None):
+        tags = self.tags.get(key, {})
+        items = [
+            {"name": n, "value": v}
+            for n, v in tags.items()
+            if name is None or n == name
+        ]
+        return {"count": len(items), "items": items}
+
+    def _tag(self, method, key, name, body):
+        with self._lock:
+            if method == "PUT":
+                self.tags.setdefault(key, {})[name] = body.decode("utf-8")
+                return 201, self._tags_response(key, name)
+            if method == "DELETE":
+                self.tags.get(key, {}).pop(name, None)
+                return 204, None
+        return 200, self._tags_response(key, name)
+
+    # Model registry
+
+    def _model_registries(self, method, params, query, body):
+        if not params:
+            return 200, {
+                "count": 1,
+                "items": [{"id": self.project_id, "name": self.project}],
+            }
+        registry_id = int(params[0])
+        registry = self.models.setdefault(registry_id, {})
+        params = params[2:]  # skip "models"
+        if not params:
+            return 200, self._find_models(registry, query)
+
+        model_id = params[0]
+        if len(params) > 1 and params[1] == "tags":
+            self._get_model(registry, model_id)
+            name = params[2] if len(params) > 2 else None
+            return self._tag(method, ("model", registry_id, model_id), name, body)
+        if len(params) > 1:
+            raise BackendError(404, 0, "Unknown model endpoint")
+
+        if method == "PUT":
+            model_json = json.loads(body)
+            model_json["id"] = model_id
+            model_json["modelRegistryId"] = registry_id
+            model_json["created"] = int(time.time() * 1000)
+            model_json["creator"] = "tester@hopsworks.ai"
+            model_json["userFullName"] = "Tester"
+            with self._lock:
+                registry[model_id] = model_json
+            return 200, model_json
+        if method == "DELETE":
+            model_json = self._get_model(registry, model_id)
+            with self._lock:
+                registry.pop(model_id)
+            version_path = "/Projects/{}/Models/{}/{}".format(
+                model_json.get("projectName") or self.project,
+                model_json["name"],
+                model_json["version"],
+            )
+            shutil.rmtree(self._local_path(version_path), ignore_errors=True)
+            return 204, None
+        return 200, self._get_model(registry, model_id)
+
+    def _get_model(self, registry, model_id):
+        if model_id not in registry:
+            raise BackendError(
+                404, self.ERROR_CODE_MODEL_NOT_FOUND, "Model not found: " + model_id
+            )
+        return registry[model_id]
+
+    def _find_models(self, registry, query):
+        models = list(registry.values())
+        for filter_by in query.get("filter_by", []):
+            field, value = filter_by.split(":", 1)
+            if field == "name_eq":
+                models = [m for m in models if m["name"] == value]
+        models.sort(key=lambda m: m["version"])
+        sort_by = (query.get("sort_by") or [None])[0]
+        if sort_by is not None:
+            field, direction = sort_by.split(":")
+            if field in ("id", "version"):
+                models.sort(key=lambda m: m[field], reverse=direction == "desc")
+            else:
+                # sorted by a training metric
+                models = [m for m in models if field in (m.get("metrics") or {})]
+                models.sort(
+                    key=lambda m: float(m["metrics"][field]),
+                    reverse=direction == "desc",
+                )
+        total = len(models)
+        offset = int((query.get("offset") or [0])[0])
+        limit = int((query.get("limit") or [total])[0])
+        models = models[offset : offset + limit]
+        return {"count": total, "items": models} if total else {"count": 0}
+
+    # Model serving
+
+    def _serving(self, method, params, query, body):
+        if not params:
+            if method == "PUT":
+                return 200, self._put_deployment(json.loads(body))
+            if "name" in query:
+                return 200, self._get_deployment_by_name(query["name"][0])
+            deployments = list(self.deployments.values())
+            if query.get("model"):
+                deployments = [
+                    d for d in deployments if d["modelName"] == query["model"][0]
+                ]
+            if query.get("status"):
+                deployments = [
+                    d for d in deployments if d["status"] == query["status"][0]
+                ]
+            return 200, deployments
+
+        deployment_json = self._get_deployment(int(params[0]))
+        if len(params) > 1 and params[1] == "logs":
+            return 200, []
+        if method == "POST":
+            action = query["action"][0]
+            with self._lock:
+                running = action == "START"
+                deployment_json["status"] = "Running" if running else "Stopped"
+                deployment_json["availableInstances"] = 1 if running else 0
+                deployment_json["deployed"] = running
+            return 200, None
+        if method == "DELETE":
+            with self._lock:
+                self.deployments.pop(deployment_json["id"])
+            return 204, None
+        return 200, deployment_json
+
+    def _put_deployment(self, deployment_json):
+        with self._lock:
+            if deployment_json.get("id") is None:
+                if any(
+                    d["name"] == deployment_json["name"]
+                    for d in self.deployments.values()
+                ):
+                    raise BackendError(
+                        400, 240011, "Deployment with the same name already exists"
+                    )
+                deployment_json["id"] = self._next_deployment_id
+                self._next_deployment_id += 1
+                deployment_json["created"] = int(time.time() * 1000)
+                deployment_json["creator"] = "Tester"
+                deployment_json["status"] = "Stopped"
+                deployment_json["availableInstances"] = 0
+            else:
+                current = self._get_deployment(deployment_json["id"])
+                for key in ("created", "creator", "status", "availableInstances"):
+                    deployment_json[key] = current[key]
+            if deployment_json.get("artifactVersion") == -1:
+                deployment_json["artifactVersion"] = 1
+            deployment_json["hopsworksInferencePath"] = (
+                "/project/{}/inference/models/{}".format(
+                    self.project_id, deployment_json["name"]
+                )
+            )
+            deployment_json["modelServerInferencePath"] = (
+                "/v1/models/" + deployment_json["name"]
+            )
+            self.deployments[deployment_json["id"]] = deployment_json
+            return deployment_json
+
+    def _get_deployment(self, deployment_id):
+        if deployment_id not in self.deployments:
+            raise BackendError(
+                404, self.ERROR_CODE_SERVING_NOT_FOUND, "Deployment not found"
+            )
+        return self.deployments[deployment_id]
+
+    def _get_deployment_by_name(self, name):
+        for deployment_json in self.deployments.values():
+            if deployment_json["name"] == name:
+                return deployment_json
+        raise BackendError(
+            404, self.ERROR_CODE_SERVING_NOT_FOUND, "Deployment not found"
+        )
+
+    def _inference_endpoints(self):
+        if not self.kserve_installed:
+            return []
+        return [
+            {
+                "type": "LOAD_BALANCER",
+                "hosts": [self.host],
+                "ports": [{"name": "HTTP", "number": self.ISTIO_PORT}],
+            }
+        ]
+
+    def _predict(self, model_predict, body):
+        name = model_predict.split(":")[0]
+        deployment_json = self._get_deployment_by_name(name)
+        if deployment_json["status"] != "Running":
+            raise BackendError(400, 250001, "Deployment not running")
+        # echo the model inputs back as predictions
+        return 200, {"predictions": json.loads(body).get("instances", [])}
+
+
+@pytest.fixture
+def hopsworks_backend(tmp_path):
+    backend = HopsworksBackend(str(tmp_path))
+    with backend.install():
+        yield backend
+
+
+@pytest.fixture
+def hopsworks_connection(hopsworks_backend):
+    from hsml.connection import Connection
+
+    conn = Connection(
+        host=hopsworks_backend.host,
+        port=hopsworks_backend.port,
+        project=hopsworks_backend.project,
+        api_key_value="api_key",
+    )
+    yield conn
+    conn.close()
@@ -65,6 +65,9 @@ class TestConnection:
         assert mock_connection._trust_store_path is None
         assert mock_connection._api_key_file is None
         assert mock_connection._api_key_value is None
+        assert mock_connection._connection_pool_configuration is None
+        assert mock_connection._metadata_cache_configuration is None
+        assert mock_connection._tracing_configuration is None
         assert isinstance(mock_connection._model_api, model_api.ModelApi)
         assert isinstance(
             mock_connection._model_registry_api, model_registry_api.ModelRegistryApi
@@ -106,6 +109,9 @@ class TestConnection:
             trust_store_path="ts_path",
             api_key_file="ak_file",
             api_key_value="ak_value",
+            connection_pool_configuration={"pool_maxsize": 32},
+            metadata_cache_configuration={"ttl": 300},
+            tracing_configuration={"propagate": False},
         )
 
         # Assert
@@ -116,6 +122,9 @@ class TestConnection:
         assert mock_connection._trust_store_path == "ts_path"
         assert mock_connection._api_key_file == "ak_file"
         assert mock_connection._api_key_value == "ak_value"
+        assert mock_connection._connection_pool_configuration == {"pool_maxsize": 32}
+        assert mock_connection._metadata_cache_configuration == {"ttl": 300}
+        assert mock_connection._tracing_configuration == {"propagate": False}
         assert isinstance(mock_connection._model_api, model_api.ModelApi)
         assert isinstance(
             mock_connection._model_registry_api, model_registry_api.ModelRegistryApi
@@ -61,6 +61,27 @@ class TestConstants:
             expected_constants=hopsfs_mount_prefix,
         )
 
+    # MODEL_FILES
+
+    def test_model_files_constants(self):
+        # Arrange
+        model_files = {
+            "MODE_AUTO": "auto",
+            "MODE_FILES": "files",
+            "MODE_ARCHIVE": "archive",
+            "ARCHIVE_MIN_FILES": 100,
+            "ARCHIVE_MAX_AVG_FILE_SIZE": 1_048_576,
+            "ARCHIVE_TIMEOUT": 600,
+            "ARCHIVE_DATASET": "Resources",
+        }
+
+        # Assert
+        self._check_added_modified_or_removed_values(
+            constants.MODEL_FILES,
+            num_values=len(model_files),
+            expected_constants=model_files,
+        )
+
     # MODEL_SERVING
 
     def test_model_serving_constants(self):
@@ -186,6 +207,24 @@ class TestConstants:
             prefix="ACTION",
         )
 
+    # COMPRESSION
+
+    def test_compression_constants(self):
+        # Arrange
+        compression = {
+            "ALGORITHM_GZIP": "gzip",
+            "ALGORITHM_ZSTD": "zstd",
+            "MIN_SIZE": 1024,
+            "GZIP_LEVEL": 6,
+        }
+
+        # Assert
+        self._check_added_modified_or_removed_values(
+            constants.COMPRESSION,
+            num_values=len(compression),
+            expected_constants=compression,
+        )
+
     # PREDICTOR
 
     def test_predictor_model_server_constants(self):
@@ -176,7 +176,9 @@ class TestDeployment:
         d.start()
 
         # Assert
-        mock_serving_engine_start.assert_called_once_with(d, await_status=60)
+        mock_serving_engine_start.assert_called_once_with(
+            d, await_status=60, progress_callback=None
+        )
 
     def test_start(self, mocker, backend_fixtures):
         # Arrange
@@ -191,7 +193,9 @@ class TestDeployment:
         d.start(await_running=await_running)
 
         # Assert
-        mock_serving_engine_start.assert_called_once_with(d, await_status=await_running)
+        mock_serving_engine_start.assert_called_once_with(
+            d, await_status=await_running, progress_callback=None
+        )
 
     # stop
 
@@ -207,7 +211,9 @@ class TestDeployment:
         d.stop()
 
         # Assert
-        mock_serving_engine_stop.assert_called_once_with(d, await_status=60)
+        mock_serving_engine_stop.assert_called_once_with(
+            d, await_status=60, progress_callback=None
+        )
 
     def test_stop(self, mocker, backend_fixtures):
         # Arrange
@@ -222,7 +228,9 @@ class TestDeployment:
         d.stop(await_stopped=await_stopped)
 
         # Assert
-        mock_serving_engine_start.assert_called_once_with(d, await_status=await_stopped)
+        mock_serving_engine_start.assert_called_once_with(
+            d, await_status=await_stopped, progress_callback=None
+        )
 
     # delete
 
@@ -609,7 +617,84 @@ class TestDeployment:
         d.predict("data", "inputs")
 
         # Assert
-        mock_serving_engine_predict.assert_called_once_with(d, "data", "inputs")
+        mock_serving_engine_predict.assert_called_once_with(
+            d, "data", "inputs", input_validator=None
+        )
+
+    def test_predict_validate(self, mocker, backend_fixtures):
+        # Arrange
+        p = self._get_dummy_predictor(mocker, backend_fixtures)
+        d = deployment.Deployment(predictor=p)
+        mock_get_input_validator = mocker.patch(
+            "hsml.engine.serving_engine.ServingEngine.get_input_validator",
+            return_value="validator",
+        )
+        mock_serving_engine_predict = mocker.patch(
+            "hsml.engine.serving_engine.ServingEngine.predict"
+        )
+
+        # Act
+        d.predict(inputs="inputs", validate=True)
+        d.predict(inputs="inputs", validate=True)
+
+        # Assert
+        # the validator is compiled once
+        mock_get_input_validator.assert_called_once_with(d)
+        mock_serving_engine_predict.assert_called_with(
+            d, None, "inputs", input_validator="validator"
+        )
+
+    def test_get_input_validator_model_changed(self, mocker, backend_fixtures):
+        # Arrange
+        p = self._get_dummy_predictor(mocker, backend_fixtures)
+        d = deployment.Deployment(predictor=p)
+        mock_get_input_validator = mocker.patch(
+            "hsml.engine.serving_engine.ServingEngine.get_input_validator",
+            side_effect=["validator_1", "validator_2", "validator_3"],
+        )
+
+        # Act
+        validator_1 = d.get_input_validator()
+        d.model_version = d.model_version + 1
+        validator_2 = d.get_input_validator()
+        d.predictor.model_name = d.model_name + "_new"
+        validator_3 = d.get_input_validator()
+
+        # Assert
+        # the validator is compiled again for each deployed model
+        assert mock_get_input_validator.call_count == 3
+        assert (validator_1, validator_2, validator_3) == (
+            "validator_1",
+            "validator_2",
+            "validator_3",
+        )
+        assert d.get_input_validator() == "validator_3"
+
+    # compression configuration
+
+    def test_compression_configuration(self, mocker, backend_fixtures):
+        # Arrange
+        p = self._get_dummy_predictor(mocker, backend_fixtures)
+        d = deployment.Deployment(predictor=p)
+
+        # Act
+        d.compression_configuration = {"algorithm": "gzip", "min_size": 2048}
+
+        # Assert
+        assert d.compression_configuration == {"algorithm": "gzip", "min_size": 2048}
+        assert "compression_configuration" not in d.to_dict()
+
+    def test_compression_configuration_not_supported(self, mocker, backend_fixtures):
+        # Arrange
+        p = self._get_dummy_predictor(mocker, backend_fixtures)
+        d = deployment.Deployment(predictor=p)
+
+        # Act
+        with pytest.raises(ValueError):
+            d.compression_configuration = {"algorithm": "brotli"}
+
+        # Assert
+        assert d.compression_configuration is None
 
     # download artifact
 
@@ -0,0 +1,133 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+
+# slow to import, and only needed to build schemas, input examples, grpc requests and
+# to trace requests
+HEAVY_MODULES = ["grpc", "pandas", "google.protobuf", "opentelemetry"]
+
+PYTHON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONNECT_AND_FETCH_METADATA = """
+import os
+import tempfile
+
+from tests.fixtures.backend_fixtures import backend_fixtures_json
+from tests.fixtures.hopsworks_backend import HopsworksBackend
+
+import hsml
+
+root_dir = tempfile.mkdtemp()
+backend = HopsworksBackend(root_dir)
+deployment_json = dict(
+    backend_fixtures_json["predictor"]["get_deployments_singleton"]["response"][
+        "items"
+    ][0]
+)
+deployment_json.update({"id": None, "name": "mnist"})
+backend._put_deployment(deployment_json)
+with backend.install():
+    conn = hsml.connection(
+        host=backend.host,
+        port=backend.port,
+        project=backend.project,
+        api_key_value="api_key",
+    )
+    mr = conn.get_model_registry()
+    model_file = os.path.join(root_dir, "model.pkl")
+    with open(model_file, "wb") as f:
+        f.write(b"weights")
+    mr.python.create_model("mnist").save(model_file)
+    mr.get_model("mnist", version=1)
+    mr.get_models("mnist")
+    ms = conn.get_model_serving()
+    ms.get_deployment("mnist")
+    ms.get_deployments()
+    conn.close()
+"""
+
+
+def _get_imported_heavy_modules(code):
+    script = code + textwrap.dedent(
+        """
+        import json, sys
+        print(json.dumps([m for m in {} if m in sys.modules]))
+        """.format(HEAVY_MODULES)
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=PYTHON_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestImportTime:
+    @pytest.mark.parametrize(
+        "module",
+        [
+            "hsml",
+            "hsml.connection",
+            "hsml.model_registry",
+            "hsml.model_serving",
+            "hsml.model",
+            "hsml.deployment",
+            "hsml.predictor",
+            "hsml.python.signature",
+            "hsml.tensorflow.signature",
+        ],
+    )
+    def test_import_does_not_import_heavy_modules(self, module):
+        # Act
+        imported = _get_imported_heavy_modules("import {}".format(module))
+
+        # Assert
+        assert imported == []
+
+    def test_connect_and_fetch_metadata_does_not_import_heavy_modules(self):
+        # Act
+        imported = _get_imported_heavy_modules(CONNECT_AND_FETCH_METADATA)
+
+        # Assert
+        assert imported == []
+
+    def test_heavy_submodule_imported_on_access(self):
+        # Act
+        imported = _get_imported_heavy_modules("import hsml\nhsml.schema")
+
+        # Assert
+        assert "pandas" in imported
+
+    def test_unknown_attribute(self):
+        # Arrange
+        import hsml
+
+        # Act
+        with pytest.raises(AttributeError) as e_info:
+            hsml.unknown_attribute  # noqa: B018
+
+        # Assert
+        assert "has no attribute 'unknown_attribute'" in str(e_info.value)
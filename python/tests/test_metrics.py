@@ -0,0 +1,297 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import copy
+import threading
+
+import pytest
+from hsml import metrics
+from hsml.client.exceptions import ModelServingException
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+class TestMetrics:
+    # LatencyHistogram
+
+    def test_histogram_percentiles(self):
+        # Arrange
+        histogram = metrics.LatencyHistogram()
+
+        # Act
+        for i in range(1, 1001):
+            histogram.record(i / 1000)
+
+        # Assert
+        result = histogram.to_dict()
+        assert result["count"] == 1000
+        assert result["mean"] == pytest.approx(0.5005)
+        assert result["p50"] == pytest.approx(0.5, rel=0.02)
+        assert result["p90"] == pytest.approx(0.9, rel=0.02)
+        assert result["p99"] == pytest.approx(0.99, rel=0.02)
+        assert result["max"] == 1.0
+
+    def test_histogram_small_values_exact(self):
+        # Arrange
+        histogram = metrics.LatencyHistogram()
+
+        # Act
+        for i in range(1, 101):
+            histogram.record(i / 1e6)
+
+        # Assert
+        assert histogram.get_percentile(50) == 50 / 1e6
+        assert histogram.get_percentile(100) == 100 / 1e6
+
+    def test_histogram_empty(self):
+        # Act
+        result = metrics.LatencyHistogram().to_dict()
+
+        # Assert
+        assert result == {
+            "count": 0,
+            "mean": None,
+            "p50": None,
+            "p90": None,
+            "p99": None,
+            "max": None,
+        }
+
+    def test_histogram_merge(self):
+        # Arrange
+        histogram = metrics.LatencyHistogram()
+        other = metrics.LatencyHistogram()
+        histogram.record(0.01)
+        other.record(0.02)
+        other.record(2.0)
+
+        # Act
+        histogram.merge(other)
+
+        # Assert
+        assert histogram.count == 3
+        assert histogram.sum == pytest.approx(2.03)
+        assert histogram.get_percentile(100) == 2.0
+        assert histogram.get_cumulative_counts([0.015, 0.025, 1, 10]) == [1, 2, 2, 3]
+
+    # DeploymentMetrics
+
+    def test_deployment_metrics_threads(self):
+        # Arrange
+        deployment_metrics = metrics.get_deployment_metrics("mnist")
+
+        def record():
+            for _ in range(100):
+                deployment_metrics.record({metrics.TOTAL: 0.01})
+
+        threads = [threading.Thread(target=record) for _ in range(4)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        deployment_metrics.record({metrics.TOTAL: 0.02}, error=True)
+
+        # Assert
+        result = deployment_metrics.to_dict()
+        assert result["requests"] == 401
+        assert result["errors"] == 1
+        assert result["latency"][metrics.TOTAL]["count"] == 401
+        assert result["latency"][metrics.NETWORK]["count"] == 0
+
+    def test_deployment_metrics_finished_threads(self):
+        # Arrange
+        deployment_metrics = metrics.get_deployment_metrics("mnist")
+
+        def record():
+            deployment_metrics.record({metrics.TOTAL: 0.01})
+
+        # Act
+        for _ in range(50):
+            threads = [threading.Thread(target=record) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        deployment_metrics.record({metrics.TOTAL: 0.02}, error=True)
+
+        # Assert
+        result = deployment_metrics.to_dict()
+        assert result["requests"] == 201
+        assert result["errors"] == 1
+        assert result["latency"][metrics.TOTAL]["count"] == 201
+        # the shards of the joined threads are folded into the base shard
+        assert deployment_metrics._shards == [
+            (deployment_metrics._shards[0][0], deployment_metrics._local.shard)
+        ]
+
+    # time_inference
+
+    def test_time_inference(self):
+        # Act
+        with metrics.time_inference("mnist") as timer:
+            with metrics.phase(metrics.SERIALIZATION):
+                pass
+            with metrics.phase(metrics.NETWORK):
+                metrics.add_phase_time(metrics.QUEUEING, 0.0)
+
+        # Assert
+        assert set(timer.phases) == {
+            metrics.TOTAL,
+            metrics.SERIALIZATION,
+            metrics.NETWORK,
+            metrics.QUEUEING,
+        }
+        result = metrics.get_stats()["mnist"]
+        assert result["requests"] == 1
+        assert result["errors"] == 0
+        assert result["latency"][metrics.SERIALIZATION]["count"] == 1
+
+    def test_time_inference_error(self):
+        # Act
+        with pytest.raises(ValueError):
+            with metrics.time_inference("mnist"):
+                raise ValueError()
+
+        # Assert
+        assert metrics.get_stats()["mnist"]["errors"] == 1
+
+    def test_phase_without_timer(self):
+        # Act
+        with metrics.phase(metrics.NETWORK):
+            metrics.add_phase_time(metrics.QUEUEING, 1.0)
+
+        # Assert
+        assert metrics.get_stats() == {}
+
+    # to_prometheus
+
+    def test_to_prometheus(self):
+        # Arrange
+        metrics.get_deployment_metrics('mn"ist').record(
+            {metrics.TOTAL: 0.003, metrics.NETWORK: 0.002}
+        )
+
+        # Act
+        result = metrics.to_prometheus()
+
+        # Assert
+        lines = result.splitlines()
+        assert "# TYPE hsml_inference_latency_seconds histogram" in lines
+        assert 'hsml_inference_requests_total{deployment="mn\\"ist"} 1' in lines
+        assert 'hsml_inference_errors_total{deployment="mn\\"ist"} 0' in lines
+        labels = 'deployment="mn\\"ist",phase="total"'
+        assert (
+            'hsml_inference_latency_seconds_bucket{{{},le="0.0025"}} 0'.format(labels)
+            in lines
+        )
+        assert (
+            'hsml_inference_latency_seconds_bucket{{{},le="0.005"}} 1'.format(labels)
+            in lines
+        )
+        assert (
+            'hsml_inference_latency_seconds_bucket{{{},le="+Inf"}} 1'.format(labels)
+            in lines
+        )
+        assert "hsml_inference_latency_seconds_count{{{}}} 1".format(labels) in lines
+        assert result.endswith("\n")
+
+    def test_to_prometheus_deployments(self):
+        # Arrange
+        metrics.get_deployment_metrics("a").record({metrics.TOTAL: 0.003})
+        metrics.get_deployment_metrics("b").record({metrics.TOTAL: 0.003}, error=True)
+
+        # Act
+        result = metrics.to_prometheus()
+
+        # Assert
+        families = []
+        for line in result.splitlines():
+            if line.startswith("# TYPE "):
+                families.append(line.split()[2])
+                continue
+            if line.startswith("#"):
+                continue
+            # samples follow the TYPE line of their family
+            assert line.startswith(families[-1])
+        assert families == [
+            "hsml_inference_requests_total",
+            "hsml_inference_errors_total",
+            "hsml_inference_latency_seconds",
+        ]
+        lines = result.splitlines()
+        assert lines.index('hsml_inference_requests_total{deployment="a"} 1') + 1 == (
+            lines.index('hsml_inference_requests_total{deployment="b"} 1')
+        )
+        assert 'hsml_inference_errors_total{deployment="b"} 1' in lines
+
+    # deployment.predict
+
+    def _running_deployment(self, hopsworks_connection, hopsworks_backend, fixtures):
+        deployment_json = copy.deepcopy(
+            fixtures["predictor"]["get_deployments_singleton"]["response"]["items"][0]
+        )
+        deployment_json.update({"id": None, "name": "mnist"})
+        hopsworks_backend._put_deployment(deployment_json)["status"] = "Running"
+        return hopsworks_connection.get_model_serving().get_deployment("mnist")
+
+    def test_predict_client_stats(
+        self, hopsworks_connection, hopsworks_backend, backend_fixtures
+    ):
+        # Arrange
+        deployment = self._running_deployment(
+            hopsworks_connection, hopsworks_backend, backend_fixtures
+        )
+
+        # Act
+        predictions = deployment.predict(inputs=[[1, 2]])
+        deployment.predict(inputs=[[3, 4]])
+
+        # Assert
+        assert predictions == {"predictions": [[1, 2]]}
+        result = deployment.get_client_stats()
+        assert result["requests"] == 2
+        assert result["errors"] == 0
+        # the queueing time is measured by the pooled adapter, replaced by the backend
+        for phase in metrics.PHASES:
+            expected = 0 if phase == metrics.QUEUEING else 2
+            assert result["latency"][phase]["count"] == expected
+        latency = result["latency"]
+        assert latency[metrics.TOTAL]["max"] >= latency[metrics.NETWORK]["max"]
+
+    def test_predict_client_stats_error(
+        self, hopsworks_connection, hopsworks_backend, backend_fixtures
+    ):
+        # Arrange
+        deployment = self._running_deployment(
+            hopsworks_connection, hopsworks_backend, backend_fixtures
+        )
+        hopsworks_backend._get_deployment_by_name("mnist")["status"] = "Stopped"
+
+        # Act
+        with pytest.raises(ModelServingException):
+            deployment.predict(inputs=[[1, 2]])
+
+        # Assert
+        result = deployment.get_client_stats()
+        assert result["requests"] == 1
+        assert result["errors"] == 1
@@ -164,6 +164,32 @@ class TestModel:
             await_registration=1234,
             keep_original_files=True,
             upload_configuration=upload_configuration,
+            progress_callback=None,
+        )
+
+    def test_save_async(self, mocker, backend_fixtures):
+        # Arrange
+        m_json = backend_fixtures["model"]["get_python"]["response"]["items"][0]
+        mock_model_engine_save_async = mocker.patch(
+            "hsml.engine.model_engine.ModelEngine.save_async"
+        )
+        progress_callback = mocker.Mock()
+
+        # Act
+        m = model.Model.from_response_json(m_json)
+        future = m.save_async(
+            model_path="model_path", progress_callback=progress_callback
+        )
+
+        # Assert
+        assert future == mock_model_engine_save_async.return_value
+        mock_model_engine_save_async.assert_called_once_with(
+            model_instance=m,
+            model_path="model_path",
+            await_registration=480,
+            keep_original_files=False,
+            upload_configuration=None,
+            progress_callback=progress_callback,
         )
 
     # deploy
@@ -253,7 +279,9 @@ class TestModel:
         m.download()
 
         # Assert
-        mock_model_engine_download.assert_called_once_with(model_instance=m)
+        mock_model_engine_download.assert_called_once_with(
+            model_instance=m, mode="auto", progress_callback=None
+        )
 
     # tags
 
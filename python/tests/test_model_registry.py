@@ -0,0 +1,199 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import datetime
+import os
+
+import pytest
+from hsml import model_registry
+from hsml.client.exceptions import ModelRegistryException
+from hsml.summary import ModelSummary
+
+
+class TestModelRegistry:
+    @pytest.fixture
+    def mr(self, hopsworks_connection, tmp_path):
+        mr = hopsworks_connection.get_model_registry()
+        model_file = os.path.join(str(tmp_path), "model.pkl")
+        with open(model_file, "wb") as f:
+            f.write(b"weights")
+        for accuracy in [0.5, 0.95, 0.7, 0.9, 0.8]:
+            mr.python.create_model("mnist", metrics={"accuracy": accuracy}).save(
+                model_file
+            )
+        return mr
+
+    def _model_requests(self, hopsworks_backend):
+        return [
+            query
+            for method, segments, query, _ in hopsworks_backend.requests
+            if method == "GET" and segments[-1] == "models"
+        ]
+
+    # get_models
+
+    def test_get_models(self, mr, hopsworks_backend):
+        # Act
+        models = mr.get_models("mnist")
+
+        # Assert
+        assert [m.version for m in models] == [1, 2, 3, 4, 5]
+        queries = self._model_requests(hopsworks_backend)
+        assert len(queries) == 1
+        assert queries[0]["expand"] == ["trainingdatasets"]
+        assert "limit" not in queries[0]
+        assert "offset" not in queries[0]
+        assert "sort_by" not in queries[0]
+
+    def test_get_models_limit_offset(self, mr, hopsworks_backend):
+        # Act
+        models = mr.get_models("mnist", offset=1, limit=2)
+
+        # Assert
+        assert [m.version for m in models] == [2, 3]
+        queries = self._model_requests(hopsworks_backend)
+        assert len(queries) == 1
+        assert queries[0]["offset"] == ["1"]
+        assert queries[0]["limit"] == ["2"]
+        # pages are fetched in a deterministic order
+        assert queries[0]["sort_by"] == ["version:asc"]
+
+    def test_get_models_page_size(self, mr, hopsworks_backend):
+        # Act
+        models = mr.get_models("mnist", page_size=2)
+        first_model = next(models)
+        num_requests = len(self._model_requests(hopsworks_backend))
+        other_models = list(models)
+
+        # Assert
+        assert first_model.version == 1
+        assert num_requests == 1
+        assert [m.version for m in other_models] == [2, 3, 4, 5]
+        queries = self._model_requests(hopsworks_backend)
+        assert [q.get("offset") for q in queries] == [None, ["2"], ["4"]]
+        assert all(q["limit"] == ["2"] for q in queries)
+        assert all(q["sort_by"] == ["version:asc"] for q in queries)
+
+    def test_get_models_page_size_limit(self, mr, hopsworks_backend):
+        # Act
+        models = list(mr.get_models("mnist", page_size=2, limit=3))
+
+        # Assert
+        assert [m.version for m in models] == [1, 2, 3]
+        queries = self._model_requests(hopsworks_backend)
+        assert [q["limit"] for q in queries] == [["2"], ["1"]]
+
+    def test_get_models_no_expand(self, mr, hopsworks_backend):
+        # Act
+        mr.get_models("mnist", expand=False)
+
+        # Assert
+        assert "expand" not in self._model_requests(hopsworks_backend)[0]
+
+    def test_get_models_metrics(self, mr):
+        # Act
+        models = mr.get_models("mnist", metrics={"accuracy": (0.75, 0.9)})
+
+        # Assert
+        assert [m.training_metrics["accuracy"] for m in models] == [0.9, 0.8]
+
+    def test_get_models_metrics_limit(self, mr, hopsworks_backend, mocker):
+        # Arrange
+        mocker.patch.object(model_registry.ModelRegistry, "DEFAULT_PAGE_SIZE", 2)
+
+        # Act
+        models = mr.get_models(
+            "mnist", metrics={"accuracy": (0.75, None)}, limit=2, summary=True
+        )
+
+        # Assert
+        assert [m.version for m in models] == [2, 4]
+        assert not any(m.is_materialized for m in models)
+        assert len(self._model_requests(hopsworks_backend)) == 2
+
+    def test_get_models_metrics_missing(self, mr):
+        # Act
+        models = mr.get_models("mnist", metrics={"loss": (None, 1)})
+
+        # Assert
+        assert models == []
+
+    def test_get_models_created(self, mr, hopsworks_backend):
+        # Arrange
+        registry = hopsworks_backend.models[int(mr.model_registry_id)]
+        for model_json in registry.values():
+            created = datetime.datetime(2024, 1, model_json["version"])
+            model_json["created"] = int(created.timestamp() * 1000)
+
+        # Act
+        models = mr.get_models(
+            "mnist",
+            created_after=datetime.datetime(2024, 1, 2),
+            created_before=datetime.date(2024, 1, 4),
+        )
+
+        # Assert
+        assert [m.version for m in models] == [2, 3, 4]
+
+    def test_get_models_created_dates(self, mr, hopsworks_backend):
+        # Arrange
+        registry = hopsworks_backend.models[int(mr.model_registry_id)]
+        for model_json in registry.values():
+            created = datetime.datetime(
+                2024, 1, model_json["version"], tzinfo=datetime.timezone.utc
+            )
+            model_json["created"] = created.isoformat().replace("+00:00", "Z")
+
+        # Act
+        models = mr.get_models(
+            "mnist",
+            created_after=datetime.datetime(2024, 1, 4, tzinfo=datetime.timezone.utc),
+        )
+
+        # Assert
+        assert [m.version for m in models] == [4, 5]
+
+    def test_get_models_created_invalid(self, mr, hopsworks_backend):
+        # Arrange
+        registry = hopsworks_backend.models[int(mr.model_registry_id)]
+        for model_json in registry.values():
+            model_json["created"] = None
+
+        # Act
+        with pytest.raises(ModelRegistryException) as e_info:
+            mr.get_models("mnist", created_after=datetime.datetime(2024, 1, 1))
+
+        # Assert
+        assert "cannot be filtered by creation date" in str(e_info.value)
+
+    def test_get_models_tags(self, mr, hopsworks_backend):
+        # Arrange
+        models = mr.get_models("mnist")
+        models[1].set_tag("team", "vision")
+        models[3].set_tag("team", {"name": "vision"})
+        num_requests = len(hopsworks_backend.requests)
+
+        # Act
+        tagged_models = mr.get_models(
+            "mnist", summary=True, tags={"team": "vision"}, limit=1
+        )
+
+        # Assert
+        assert [type(m) for m in tagged_models] == [ModelSummary]
+        assert [m.version for m in tagged_models] == [2]
+        assert not tagged_models[0].is_materialized
+        # models are listed, then tags are fetched until a model matches
+        assert len(hopsworks_backend.requests) - num_requests == 3
@@ -0,0 +1,81 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import itertools
+
+from hsml import polling
+
+
+class TestPolling:
+    # Backoff
+
+    def test_backoff_intervals(self):
+        # Arrange
+        backoff = polling.Backoff(initial_interval=0.5, max_interval=3, multiplier=2)
+
+        # Act
+        intervals = list(itertools.islice(backoff.intervals(), 5))
+
+        # Assert
+        assert intervals == [0.5, 1, 2, 3, 3]
+
+    # poll
+
+    def test_poll_immediate(self, mocker):
+        # Arrange
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        mock_check = mocker.Mock(return_value="done")
+
+        # Act
+        result = polling.poll(mock_check, timeout=10)
+
+        # Assert
+        assert result == "done"
+        assert mock_check.call_count == 1
+        mock_sleep.assert_not_called()
+
+    def test_poll_backoff(self, mocker):
+        # Arrange
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        mock_check = mocker.Mock(side_effect=[None, False, "done"])
+
+        # Act
+        result = polling.poll(
+            mock_check, timeout=10, backoff=polling.Backoff(initial_interval=0.1)
+        )
+
+        # Assert
+        assert result == "done"
+        assert mock_check.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.1, 0.2]
+
+    def test_poll_timeout(self, mocker):
+        # Arrange
+        clock = itertools.count(step=4)
+        mocker.patch("hsml.polling.time.monotonic", side_effect=lambda: next(clock))
+        mock_sleep = mocker.patch("hsml.polling.time.sleep")
+        mock_check = mocker.Mock(return_value=None)
+
+        # Act
+        result = polling.poll(
+            mock_check, timeout=10, backoff=polling.Backoff(initial_interval=5)
+        )
+
+        # Assert
+        assert result is None
+        # checks at 4, 8 and 12 seconds, the second wait is cut at the deadline
+        assert mock_check.call_count == 3
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [5, 2]
@@ -0,0 +1,149 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+from hsml import progress
+
+
+class TestProgress:
+    # StepTracker
+
+    def test_step_tracker(self, mocker):
+        # Arrange
+        mocker.patch("hsml.progress.time.monotonic", side_effect=[0, 2, 2, 5])
+        events = []
+        steps = progress.StepTracker(events.append)
+
+        # Act
+        steps.start(0, "Creating")
+        steps.start(0, "Creating")  # already the current step
+        steps.start(1, "Uploading")
+        steps.complete()
+        steps.complete()
+
+        # Assert
+        assert [(type(e).__name__, e.step, e.description) for e in events] == [
+            ("StepEvent", 0, "Creating"),
+            ("StepCompletedEvent", 0, "Creating"),
+            ("StepEvent", 1, "Uploading"),
+            ("StepCompletedEvent", 1, "Uploading"),
+        ]
+        assert [e.duration for e in events[1::2]] == [2, 3]
+
+    def test_step_tracker_no_callback(self):
+        # Arrange
+        steps = progress.StepTracker(None)
+
+        # Act
+        steps.start(0, "Creating")
+        steps.complete()
+
+        # Assert
+        assert steps._current is None
+
+    # TqdmProgress
+
+    def test_tqdm_progress(self, mocker):
+        # Arrange
+        mock_tqdm = mocker.patch("hsml.progress.tqdm")
+        file_bar = mocker.Mock(n=0)
+
+        def update(n):
+            file_bar.n += n
+
+        file_bar.update.side_effect = update
+        step_bar = mocker.Mock()
+        mock_tqdm.side_effect = [step_bar, file_bar]
+        callback = progress.TqdmProgress()
+
+        # Act
+        callback(progress.StepEvent(1, "Uploading model files"))
+        callback(progress.TransferEvent("Models/mnist/1/model.pkl", 6, 10))
+        callback(progress.TransferEvent("Models/mnist/1/model.pkl", 4, 10))
+        callback(progress.StepCompletedEvent(1, "Uploading model files", 1.5))
+        callback.close()
+
+        # Assert
+        step_bar.set_description.assert_called_once_with("Uploading model files")
+        step_bar.update.assert_called_once_with(1)
+        step_bar.close.assert_called_once()
+        assert mock_tqdm.call_args_list[1].kwargs["total"] == 10
+        assert mock_tqdm.call_args_list[1].kwargs["desc"] == "model.pkl"
+        file_bar.close.assert_called_once()
+        assert callback._file_bars == {}
+
+    # MetricsProgress
+
+    def test_metrics_progress(self):
+        # Arrange
+        callback = progress.MetricsProgress()
+
+        # Act
+        callback(progress.TransferEvent("a", 100, 300, latency=1, timestamp=11))
+        callback(progress.TransferEvent("a", 200, 300, latency=2, timestamp=12))
+        callback(
+            progress.TransferEvent(
+                "b", 50, None, direction="download", latency=0.5, timestamp=20
+            )
+        )
+        callback(progress.RetryEvent("a", 1, Exception("503")))
+        callback(progress.StepCompletedEvent(1, "Uploading model files", 2.5))
+
+        # Assert
+        assert callback.to_dict() == {
+            "upload": {
+                "bytes": 300,
+                "chunks": 2,
+                "seconds": 2,
+                "throughput": 150,
+                "max_latency": 2,
+            },
+            "download": {
+                "bytes": 50,
+                "chunks": 1,
+                "seconds": 0.5,
+                "throughput": 100,
+                "max_latency": 0.5,
+            },
+            "retries": 1,
+            "steps": {"Uploading model files": 2.5},
+        }
+
+    def test_metrics_progress_empty(self):
+        # Act
+        metrics = progress.MetricsProgress().to_dict()
+
+        # Assert
+        assert metrics["upload"]["throughput"] is None
+        assert metrics["upload"]["seconds"] == 0
+        assert metrics["retries"] == 0
+
+    # events
+
+    def test_event_to_dict(self):
+        # Act
+        event = progress.TransferEvent("a", 1, 2, timestamp=3)
+
+        # Assert
+        assert event.to_dict() == {
+            "type": "TransferEvent",
+            "timestamp": 3,
+            "path": "a",
+            "n_bytes": 1,
+            "total_bytes": 2,
+            "direction": "upload",
+            "latency": None,
+        }
+        assert repr(event).startswith("TransferEvent(timestamp=3, path='a'")
@@ -120,8 +120,8 @@ class TestResources:
         # Arrange
         res = {"something": "here"}
         json_decamelized = {"key": "value"}
-        mock_humps_decamelize = mocker.patch(
-            "humps.decamelize", return_value=json_decamelized
+        mock_util_decamelize = mocker.patch(
+            "hsml.util.decamelize", return_value=json_decamelized
         )
         mock_from_json = mocker.patch(
             "hsml.resources.ComponentResources.from_json",
@@ -133,7 +133,7 @@ class TestResources:
 
         # Assert
         assert result == "from_json_result"
-        mock_humps_decamelize.assert_called_once_with(res)
+        mock_util_decamelize.assert_called_once_with(res)
         mock_from_json.assert_called_once_with(json_decamelized)
 
     # - constructor
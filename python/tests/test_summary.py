@@ -0,0 +1,173 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import copy
+import os
+import pickle
+
+import pytest
+from hsml import client
+from hsml.deployment import Deployment
+from hsml.python.model import Model as PythonModel
+from hsml.summary import DeploymentSummary, ModelSummary
+
+
+class TestSummary:
+    @pytest.fixture
+    def model_registry(self, hopsworks_connection, tmp_path):
+        mr = hopsworks_connection.get_model_registry()
+        model_file = os.path.join(str(tmp_path), "model.pkl")
+        with open(model_file, "wb") as f:
+            f.write(b"weights")
+        for accuracy in [0.8, 0.9]:
+            mr.python.create_model(
+                "mnist", metrics={"accuracy": accuracy}, description="digits"
+            ).save(model_file)
+        return mr
+
+    @pytest.fixture
+    def model_serving(self, hopsworks_connection, hopsworks_backend, backend_fixtures):
+        for name in ["mnist", "iris"]:
+            deployment_json = copy.deepcopy(
+                backend_fixtures["predictor"]["get_deployments_singleton"]["response"][
+                    "items"
+                ][0]
+            )
+            deployment_json.update({"id": None, "name": name})
+            hopsworks_backend._put_deployment(deployment_json)
+        return hopsworks_connection.get_model_serving()
+
+    # models
+
+    def test_get_models_summary(self, model_registry):
+        # Act
+        models = model_registry.get_models("mnist", summary=True)
+
+        # Assert
+        assert [type(m) for m in models] == [ModelSummary, ModelSummary]
+        assert [m.version for m in models] == [1, 2]
+        assert models[0].name == "mnist"
+        assert models[0].framework == "PYTHON"
+        assert models[0].description == "digits"
+        assert models[0].training_metrics == {"accuracy": 0.8}
+        assert not any(m.is_materialized for m in models)
+        assert repr(models[0]).startswith("ModelSummary(id=")
+
+    def test_get_models_summary_materialize(self, model_registry):
+        # Arrange
+        models = model_registry.get_models("mnist", summary=True)
+        full_model = model_registry.get_models("mnist")[1]
+
+        # Act
+        creator = models[1].creator
+
+        # Assert
+        assert creator == "tester@hopsworks.ai"
+        assert models[1].is_materialized
+        assert not models[0].is_materialized
+        assert isinstance(models[1].materialize(), PythonModel)
+        for field in ModelSummary.FIELDS:
+            assert getattr(models[1], field) == getattr(full_model, field)
+        assert models[1].shared_registry_project_name is None
+        assert repr(models[1]) == repr(models[1].materialize())
+
+    def test_get_models_summary_setattr(self, model_registry):
+        # Arrange
+        model = model_registry.get_models("mnist", summary=True)[0]
+
+        # Act
+        model.description = "handwritten digits"
+
+        # Assert
+        assert model.is_materialized
+        assert model.description == "handwritten digits"
+        assert model.materialize().description == "handwritten digits"
+
+    @pytest.mark.parametrize(
+        "copy_function",
+        [copy.copy, copy.deepcopy, lambda m: pickle.loads(pickle.dumps(m))],
+    )
+    def test_get_models_summary_copy(self, model_registry, copy_function):
+        # Arrange
+        model = model_registry.get_models("mnist", summary=True)[0]
+
+        # Act
+        model_copy = copy_function(model)
+
+        # Assert
+        assert type(model_copy) is ModelSummary
+        assert not model_copy.is_materialized
+        assert repr(model_copy) == repr(model)
+        assert model_copy.creator == "tester@hopsworks.ai"
+        assert not model.is_materialized
+        assert model_copy.model_registry_id == model.model_registry_id
+
+    @pytest.mark.parametrize(
+        "copy_function",
+        [copy.copy, copy.deepcopy, lambda m: pickle.loads(pickle.dumps(m))],
+    )
+    def test_get_models_summary_copy_materialized(self, model_registry, copy_function):
+        # Arrange
+        model = model_registry.get_models("mnist", summary=True)[0]
+        model.description = "handwritten digits"
+
+        # Act
+        model_copy = copy_function(model)
+
+        # Assert
+        assert type(model_copy) is ModelSummary
+        assert model_copy.is_materialized
+        assert isinstance(model_copy.materialize(), PythonModel)
+        assert model_copy.description == "handwritten digits"
+        assert model_copy.version == model.version
+
+    def test_get_models_summary_empty(self, model_registry):
+        # Act
+        models = model_registry.get_models("missing", summary=True)
+
+        # Assert
+        assert models == []
+
+    # deployments
+
+    def test_get_deployments_summary(self, model_serving, hopsworks_connection):
+        # Act
+        deployments = model_serving.get_deployments(summary=True)
+
+        # Assert
+        assert [type(d) for d in deployments] == [DeploymentSummary] * 2
+        assert sorted(d.name for d in deployments) == ["iris", "mnist"]
+        full_deployments = {d.name: d for d in model_serving.get_deployments()}
+        for deployment in deployments:
+            assert not deployment.is_materialized
+            full_deployment = full_deployments[deployment.name]
+            for field in DeploymentSummary.FIELDS:
+                assert getattr(deployment, field) == getattr(full_deployment, field)
+
+    def test_get_deployments_summary_materialize(
+        self, model_serving, hopsworks_connection
+    ):
+        # Arrange
+        deployment = model_serving.get_deployments(summary=True)[0]
+
+        # Act
+        state = deployment.get_state()
+
+        # Assert
+        assert deployment.is_materialized
+        assert isinstance(deployment.materialize(), Deployment)
+        assert deployment.model_registry_id == client.get_instance()._project_id
+        assert state.status is not None
@@ -14,9 +14,13 @@
 #   limitations under the License.
 #
 
+import json
 import os
 from urllib.parse import ParseResult
 
+import humps
+import numpy as np
+import pandas as pd
 import pytest
 from hsml import util
 from hsml.constants import MODEL
@@ -232,6 +236,108 @@ class TestUtil:
         assert isinstance(json, dict)
         assert json == input_example_dict
 
+    def test_handle_tensor_input_max_rows(self, mocker):
+        # Arrange
+        mocker.patch("hsml.util.INPUT_EXAMPLE_MAX_ROWS", 2)
+
+        # Act
+        with pytest.warns(UserWarning, match="first 2 rows"):
+            json = util._handle_tensor_input(np.arange(8).reshape(4, 2))
+
+        # Assert
+        assert json == [[0, 1], [2, 3]]
+
+    def test_handle_dataframe_input_series_max_rows(self, mocker):
+        # Arrange
+        mocker.patch("hsml.util.INPUT_EXAMPLE_MAX_ROWS", 2)
+
+        # Act
+        with pytest.warns(UserWarning, match="first 2 rows"):
+            json = util._handle_dataframe_input(pd.Series([1, 2, 3]))
+
+        # Assert
+        assert json == [1, 2]
+
+    @pytest.mark.parametrize(
+        "input_example", [np.arange(8).reshape(4, 2), pd.Series([1, 2, 3, 4])]
+    )
+    def test_input_example_to_json_max_rows_caller(self, mocker, input_example):
+        # Arrange
+        mocker.patch("hsml.util.INPUT_EXAMPLE_MAX_ROWS", 2)
+
+        # Act
+        with pytest.warns(UserWarning, match="first 2 rows") as record:
+            util.input_example_to_json(input_example)
+
+        # Assert
+        # the warning points at the caller of input_example_to_json
+        assert record[0].filename == __file__
+
+    def test_handle_dataframe_input_column_types(self):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "int": [1, 2],
+                "float": [0.5, 1.5],
+                "time": pd.to_datetime(["2024-01-01", "2024-01-02"]),
+                "nullable": pd.array([None, 2], dtype="Int64"),
+            }
+        )
+
+        # Act
+        json = util._handle_dataframe_input(df)
+
+        # Assert
+        assert json == [1, 0.5, "2024-01-01T00:00:00", None]
+        assert isinstance(json[0], int)
+
+    # - NumpyEncoder
+
+    def test_numpy_encoder_arrays(self):
+        # Arrange
+        obj = {
+            "int": np.array([[1, 2], [3, 4]]),
+            "bytes": np.array([b"ab", b"c"]),
+            "object": np.array([{"a": np.int64(1)}, None, b"c"], dtype=object),
+            "time": np.array(["2024-01-01"], dtype="datetime64[s]"),
+            "scalar": np.array(b"ab"),
+        }
+
+        # Act
+        result = json.loads(json.dumps(obj, cls=util.NumpyEncoder))
+
+        # Assert
+        assert result == {
+            "int": [[1, 2], [3, 4]],
+            "bytes": ["YWI=\n", "Yw==\n"],
+            "object": [{"a": 1}, None, "Yw==\n"],
+            "time": ["2024-01-01T00:00:00"],
+            "scalar": "YWI=\n",
+        }
+
+    def test_numpy_encoder_dataframe(self):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "int": [1, 2],
+                "time": pd.to_datetime(["2024-01-01", None]).tz_localize("UTC"),
+                "string": pd.array(["x", None], dtype="string"),
+            }
+        )
+
+        # Act
+        result = json.loads(json.dumps(df, cls=util.NumpyEncoder))
+
+        # Assert
+        assert result == [[1, "2024-01-01T00:00:00+00:00", "x"], [2, None, None]]
+
+    def test_numpy_encoder_series(self):
+        # Act
+        result = json.dumps(pd.Series([True, False]), cls=util.NumpyEncoder)
+
+        # Assert
+        assert result == "[true, false]"
+
     # artifacts
 
     def test_compress_dir(self, mocker):
@@ -531,6 +637,58 @@ class TestUtil:
 
     # json
 
+    def test_decamelize(self, backend_fixtures):
+        # Arrange
+        json = backend_fixtures["predictor"]["get_deployment_tf_kserve_rest_trans"][
+            "response"
+        ]
+
+        # Act
+        json_decamelized = util.decamelize(json)
+
+        # Assert
+        assert json_decamelized == humps.decamelize(json)
+        assert "model_server" in json_decamelized
+
+    def test_decamelize_copies(self):
+        # Arrange
+        json = {"items": [{"modelName": "mnist", "inputs": [1, 2]}]}
+
+        # Act
+        json_decamelized = util.decamelize(json)
+        json_decamelized["items"][0]["inputs"].append(3)
+
+        # Assert
+        assert json_decamelized["items"][0]["model_name"] == "mnist"
+        assert json["items"][0]["inputs"] == [1, 2]
+
+    def test_decamelize_non_str_keys(self):
+        # Act
+        json_decamelized = util.decamelize({1: "a", 2.5: "b", "HTTPPort": 80})
+
+        # Assert
+        assert json_decamelized == humps.decamelize({1: "a", 2.5: "b", "HTTPPort": 80})
+
+    def test_decamelize_str(self):
+        # Act
+        result = util.decamelize("requestedInstances")
+
+        # Assert
+        assert result == "requested_instances"
+
+    def test_camelize(self, backend_fixtures):
+        # Arrange
+        json = humps.decamelize(
+            backend_fixtures["model"]["get_python"]["response"]["items"][0]
+        )
+
+        # Act
+        json_camelized = util.camelize(json)
+
+        # Assert
+        assert json_camelized == humps.camelize(json)
+        assert util.camelize("num_instances") == "numInstances"
+
     def test_extract_field_from_json(self, mocker):
         # Arrange
         json = {"a": "1", "b": "2"}
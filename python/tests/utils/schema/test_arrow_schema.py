@@ -0,0 +1,165 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import os
+
+import pytest
+from hsml.schema import Schema
+from hsml.utils.schema import arrow_schema, columnar_schema, tensor_schema
+
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestArrowSchema:
+    @pytest.fixture
+    def table(self):
+        return pa.table(
+            {
+                "id": pa.array([1, 2, 3], type=pa.int64()),
+                "name": pa.array(["a", "b", "c"]),
+                "embedding": pa.array(
+                    [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]], type=pa.list_(pa.float32(), 2)
+                ),
+            }
+        )
+
+    @pytest.fixture
+    def parquet_dir(self, table, tmp_path):
+        pq.write_table(table, os.path.join(str(tmp_path), "part-0.parquet"))
+        pq.write_table(table.slice(0, 2), os.path.join(str(tmp_path), "part-1.parquet"))
+        return tmp_path
+
+    @pytest.fixture
+    def no_data_read(self, mocker):
+        # only the footers of the Parquet files can be read
+        mocker.patch("pyarrow.parquet.read_table", side_effect=AssertionError)
+        mocker.patch("pyarrow.parquet.ParquetFile.read", side_effect=AssertionError)
+
+    # is_arrow_object
+
+    def test_is_arrow_object(self, table):
+        # Act & Assert
+        assert arrow_schema.is_arrow_object(table)
+        assert arrow_schema.is_arrow_object(table.schema)
+        assert arrow_schema.is_arrow_object(ds.dataset(table))
+        assert not arrow_schema.is_arrow_object([1, 2])
+        assert not arrow_schema.is_arrow_object("data.parquet")
+
+    # is_path
+
+    def test_is_path(self, parquet_dir):
+        # Act & Assert
+        assert arrow_schema.is_path(parquet_dir)
+        assert arrow_schema.is_path(str(parquet_dir / "part-0.parquet"))
+        assert arrow_schema.is_path("s3://bucket/data.parquet")
+        assert not arrow_schema.is_path(str(parquet_dir / "missing.parquet"))
+        assert not arrow_schema.is_path(["data.parquet"])
+
+    # get_schema / get_num_rows
+
+    def test_get_schema_parquet_file(self, table, parquet_dir, no_data_read):
+        # Arrange
+        path = parquet_dir / "part-0.parquet"
+
+        # Act
+        schema = arrow_schema.get_schema(path)
+        num_rows = arrow_schema.get_num_rows(str(path))
+
+        # Assert
+        assert schema.equals(table.schema)
+        assert num_rows == 3
+
+    def test_get_schema_parquet_dir(self, table, parquet_dir, no_data_read):
+        # Act
+        schema = arrow_schema.get_schema(str(parquet_dir))
+        num_rows = arrow_schema.get_num_rows(str(parquet_dir))
+
+        # Assert
+        assert schema.equals(table.schema)
+        assert num_rows == 5
+
+    def test_get_num_rows(self, table):
+        # Act & Assert
+        assert arrow_schema.get_num_rows(table) == 3
+        assert arrow_schema.get_num_rows(ds.dataset(table)) == 3
+        assert arrow_schema.get_num_rows(table.schema) is None
+
+    def test_import_error(self, mocker):
+        # Arrange
+        mocker.patch("importlib.import_module", side_effect=ImportError)
+
+        # Act
+        with pytest.raises(ModuleNotFoundError) as e_info:
+            arrow_schema.get_schema("s3://bucket/data.parquet")
+
+        # Assert
+        assert "pip install hsml[arrow]" in str(e_info.value)
+
+    # ColumnarSchema
+
+    def test_columnar_schema_table(self, table):
+        # Act
+        schema = columnar_schema.ColumnarSchema(table)
+
+        # Assert
+        assert [(c.name, c.type) for c in schema.columns] == [
+            ("id", "int64"),
+            ("name", "string"),
+            ("embedding", "fixed_size_list<item: float>[2]"),
+        ]
+
+    def test_columnar_schema_parquet_dir(self, parquet_dir, no_data_read):
+        # Act
+        schema = columnar_schema.ColumnarSchema(parquet_dir)
+
+        # Assert
+        assert [c.name for c in schema.columns] == ["id", "name", "embedding"]
+
+    # TensorSchema
+
+    def test_tensor_schema_parquet_dir(self, parquet_dir, no_data_read):
+        # Act
+        schema = tensor_schema.TensorSchema(str(parquet_dir))
+
+        # Assert
+        assert [(t.name, t.type, t.shape) for t in schema.tensors] == [
+            ("id", "int64", "(5,)"),
+            ("name", "object", "(5,)"),
+            ("embedding", "float32", "(5, 2)"),
+        ]
+
+    def test_tensor_schema_arrow_schema(self, table):
+        # Act
+        schema = tensor_schema.TensorSchema(table.schema)
+
+        # Assert
+        assert [t.shape for t in schema.tensors] == ["(-1,)", "(-1,)", "(-1, 2)"]
+
+    # Schema
+
+    def test_schema_parquet_file(self, parquet_dir, no_data_read):
+        # Act
+        schema = Schema(str(parquet_dir / "part-1.parquet"))
+
+        # Assert
+        assert schema._get_type() == "columnar"
+        assert schema.to_dict()["columnar_schema"][0] == {
+            "name": "id",
+            "type": "int64",
+        }
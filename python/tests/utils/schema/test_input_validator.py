@@ -0,0 +1,228 @@
+#
+#   Copyright 2024 Hopsworks AB
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+
+import numpy as np
+import pandas as pd
+import pytest
+from hsml.client.exceptions import ModelServingException
+from hsml.model_schema import ModelSchema
+from hsml.schema import Schema
+from hsml.utils.schema.input_validator import InputValidator
+
+
+class TestInputValidator:
+    @pytest.fixture
+    def columnar_validator(self):
+        df = pd.DataFrame(
+            {
+                "age": np.array([30], dtype="int64"),
+                "income": np.array([1.5], dtype="float32"),
+                "city": ["Stockholm"],
+            }
+        )
+        return InputValidator(ModelSchema(input_schema=Schema(df)))
+
+    @pytest.fixture
+    def tensor_validator(self):
+        return InputValidator(
+            ModelSchema(input_schema=Schema(np.zeros((100, 4), dtype="float32")))
+        )
+
+    # constructor
+
+    def test_constructor_no_input_schema(self):
+        # Act
+        with pytest.raises(ValueError) as e_info:
+            InputValidator({"output_schema": {"columnar_schema": []}})
+
+        # Assert
+        assert "does not contain an input schema" in str(e_info.value)
+
+    def test_constructor_schema_types(self):
+        # Arrange
+        model_schema = {
+            "input_schema": {
+                "columnar_schema": [
+                    {"name": "a", "type": "bigint"},
+                    {"name": "b", "type": "float"},
+                    {"name": "c", "type": "string"},
+                    {"name": "d", "type": "Int64"},
+                    {"name": "e", "type": "struct<x: int8>"},
+                ]
+            }
+        }
+
+        # Act
+        validator = InputValidator(model_schema)
+
+        # Assert
+        assert [spec.dtype for spec in validator._specs] == [
+            np.dtype("int64"),
+            np.dtype("float32"),
+            np.dtype(object),
+            np.dtype("int64"),
+            None,
+        ]
+
+    # validate
+
+    def test_validate_dataframe(self, columnar_validator):
+        # Arrange
+        df = pd.DataFrame(
+            {
+                "city": ["Lund", "Malmo"],
+                "age": np.array([20, 40], dtype="int32"),
+                "income": [2.0, 3.0],
+            }
+        )
+
+        # Act & Assert
+        columnar_validator.validate(df)
+
+    def test_validate_dataframe_errors(self, columnar_validator):
+        # Arrange
+        df = pd.DataFrame({"age": [20.5], "income": ["high"], "city": ["Lund"]})
+
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            columnar_validator.validate(df)
+
+        # Assert
+        message = str(e_info.value)
+        assert "column 'age': expected values of type int64, got float64" in message
+        assert "column 'income': expected values of type float32" in message
+        assert "'city'" not in message
+
+    def test_validate_dataframe_columns(self, columnar_validator):
+        # Arrange
+        df = pd.DataFrame({"age": [20], "country": ["SE"], "city": ["Lund"]})
+
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            columnar_validator.validate(df)
+
+        # Assert
+        assert "missing columns ['income']" in str(e_info.value)
+        assert "unexpected columns ['country']" in str(e_info.value)
+
+    def test_validate_list(self, columnar_validator):
+        # Act
+        columnar_validator.validate([[20, 2.0, "Lund"], [40, 3, "Malmo"]])
+        columnar_validator.validate([20, 2.0, "Lund"])
+        with pytest.raises(ModelServingException) as e_info:
+            columnar_validator.validate([["20", 2.0, "Lund"]])
+
+        # Assert
+        assert "column 'age'" in str(e_info.value)
+
+    def test_validate_array_columns(self, columnar_validator):
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            columnar_validator.validate(np.zeros((2, 4)))
+
+        # Assert
+        assert "expected an array of shape (n, 3), got (2, 4)" in str(e_info.value)
+
+    def test_validate_tensor(self, tensor_validator):
+        # Act
+        tensor_validator.validate(np.ones((2, 4), dtype="float64"))
+        tensor_validator.validate([[1, 2, 3, 4]])
+        with pytest.raises(ModelServingException) as e_info:
+            tensor_validator.validate(np.ones((2, 3), dtype="float32"))
+
+        # Assert
+        assert "tensor #0: expected shape (-1, 4), got (2, 3)" in str(e_info.value)
+
+    def test_validate_tensor_objects(self, tensor_validator):
+        # Arrange
+        inputs = np.array([[1, 2, 3, "4"]], dtype=object)
+
+        # Act
+        tensor_validator.validate(np.array([[1, 2, 3, 4.5]], dtype=object))
+        tensor_validator.validate(np.array([[1, 2, 3, None]], dtype=object))
+        with pytest.raises(ModelServingException) as e_info:
+            tensor_validator.validate(inputs)
+
+        # Assert
+        assert "expected values of type float32, got object" in str(e_info.value)
+
+    def test_validate_named_tensors(self):
+        # Arrange
+        validator = InputValidator(
+            {
+                "input_schema": {
+                    "tensor_schema": [
+                        {"name": "ids", "type": "int64", "shape": "[-1, 8]"},
+                        {"name": "mask", "type": "bool", "shape": "[-1, 8]"},
+                    ]
+                }
+            }
+        )
+
+        # Act
+        validator.validate({"ids": np.zeros((1, 8), dtype=int), "mask": [[True] * 8]})
+        with pytest.raises(ModelServingException) as e_info:
+            validator.validate(np.zeros((1, 8)))
+
+        # Assert
+        assert "expected a dictionary of arrays" in str(e_info.value)
+
+    def test_validate_invalid_type(self, tensor_validator):
+        # Act
+        with pytest.raises(ModelServingException) as e_info:
+            tensor_validator.validate("inputs")
+
+        # Assert
+        assert "inputs of type str cannot be validated" in str(e_info.value)
+
+    # to_infer_inputs
+
+    def test_to_infer_inputs_columnar(self, columnar_validator):
+        # Arrange
+        df = pd.DataFrame({"city": ["Lund"], "age": [20], "income": [2.0]})
+
+        # Act
+        infer_inputs = columnar_validator.to_infer_inputs(df)
+
+        # Assert
+        assert [(i.name, i.shape, i.datatype) for i in infer_inputs] == [
+            ("age", [1], "INT64"),
+            ("income", [1], "FP32"),
+            ("city", [1], "BYTES"),
+        ]
+        assert infer_inputs[1].data.dtype == np.float32
+
+    def test_to_infer_inputs_tensor(self, tensor_validator):
+        # Act
+        infer_inputs = tensor_validator.to_infer_inputs([[1, 2, 3, 4], [5, 6, 7, 8]])
+
+        # Assert
+        assert len(infer_inputs) == 1
+        assert infer_inputs[0].name == "input-0"
+        assert infer_inputs[0].shape == [2, 4]
+        assert infer_inputs[0].datatype == "FP32"
+
+    # to_instances
+
+    def test_to_instances(self, columnar_validator):
+        # Arrange
+        df = pd.DataFrame({"city": ["Lund"], "age": [20], "income": [2.0]})
+
+        # Act
+        instances = columnar_validator.to_instances(df)
+
+        # Assert
+        assert instances == [[20, 2.0, "Lund"]]